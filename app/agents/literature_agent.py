@@ -14,7 +14,7 @@ from app.agents.base_agent import (
 from data.loaders.yaml_loader import (
     get_hybrid_loader, LiteratureBenchmarks, RiskFactor, PublicationBenchmark
 )
-from data.vectorstore import get_vector_store, PgVectorStore
+from data.vectorstore import get_vector_store, PgVectorStore, AsyncPgVectorStore
 from data.loaders.hazard_ratio_extractor import HazardRatioExtractor
 
 logger = logging.getLogger(__name__)
@@ -47,6 +47,10 @@ class LiteratureAgent(BaseAgent):
             self._vector_store = get_vector_store()
         return self._vector_store
 
+    def _get_async_vector_store(self) -> AsyncPgVectorStore:
+        """Get non-blocking vector store front-end for use in async paths."""
+        return self._get_vector_store().as_async()
+
     def _load_benchmarks(self) -> LiteratureBenchmarks:
         """Load literature benchmarks with caching."""
         if self._benchmarks is None:
@@ -247,25 +251,38 @@ class LiteratureAgent(BaseAgent):
     async def _search_literature(
         self,
         query: str,
-        n_results: int = 5
+        n_results: int = 5,
+        diverse: bool = False
     ) -> Dict[str, Any]:
         """
-        Semantic search over literature documents using ChromaDB.
+        Hybrid (vector + full-text) search over literature documents.
 
         Args:
             query: Search query text
             n_results: Number of results to return
+            diverse: Re-rank a larger candidate pool with MMR and keep at most
+                one chunk per page, so overlapping chunks are not repeated
 
         Returns:
             Search results with content and metadata
         """
-        store = self._get_vector_store()
-        results = store.search(
-            query=query,
-            source_type="literature",
-            n_results=n_results,
-            include_distances=True
-        )
+        store = self._get_async_vector_store()
+        if diverse:
+            results = await store.search_diverse(
+                query=query,
+                source_type="literature",
+                n_results=n_results,
+                max_per_page=1,
+                mode="hybrid"
+            )
+        else:
+            results = await store.search(
+                query=query,
+                source_type="literature",
+                n_results=n_results,
+                include_distances=True,
+                mode="hybrid"
+            )
 
         return {
             "query": query,
@@ -296,9 +313,10 @@ class LiteratureAgent(BaseAgent):
         Returns:
             Synthesized answer with sources
         """
-        # Step 1: Retrieve relevant chunks
+        # Step 1: Retrieve relevant chunks (MMR de-duplicated if "diverse" is set)
         n_results = context.parameters.get("n_results", 5)
-        search_results = await self._search_literature(query, n_results)
+        diverse = context.parameters.get("diverse", False)
+        search_results = await self._search_literature(query, n_results, diverse=diverse)
 
         if not search_results["results"]:
             return {
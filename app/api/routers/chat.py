@@ -13,18 +13,19 @@ import re
 import uuid
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import List, Optional, Dict, Any, Set
+from typing import AsyncIterator, List, Optional, Dict, Any, Set
 from pydantic import BaseModel, Field
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
-from app.services.llm_service import LLMService
+from app.services.llm_service import get_llm_service
 from app.services.prompt_service import PromptService
 from app.agents.base_agent import AgentContext, AgentType
 from app.agents.data_agent import DataAgent
 from app.agents.literature_agent import LiteratureAgent
 from app.agents.registry_agent import RegistryAgent
 from app.agents.code_agent import get_code_agent, CodeLanguage
-from data.vectorstore import get_vector_store
+from data.vectorstore import get_async_vector_store
 
 
 class IntentClassification(BaseModel):
@@ -268,6 +269,13 @@ class ChatResponse(BaseModel):
     cached: bool = False  # Whether response came from cache
 
 
+class ChatStreamContext(BaseModel):
+    """First event of a streamed chat response, sent before the narrative."""
+    sources: List[Source]
+    evidence: Optional[Evidence] = None
+    suggested_followups: Optional[List[str]] = None
+
+
 # Keywords for detecting question intent and required agents
 INTENT_KEYWORDS = {
     "literature": [
@@ -379,7 +387,6 @@ INTENT_KEYWORDS = {
 # Cache for intent classification (simple TTL-less cache, cleared on restart)
 _intent_cache: Dict[str, Set[str]] = {}
 _prompt_service: Optional[PromptService] = None
-_llm_service: Optional[LLMService] = None
 
 # Chat response cache with 96-hour TTL (for common questions)
 # Structure: {cache_key: {"response": ChatResponse, "timestamp": datetime}}
@@ -434,14 +441,6 @@ def _get_prompt_service() -> PromptService:
     return _prompt_service
 
 
-def _get_llm_service() -> LLMService:
-    """Get singleton LLM service."""
-    global _llm_service
-    if _llm_service is None:
-        _llm_service = LLMService()
-    return _llm_service
-
-
 def _extract_json(response: str) -> dict:
     """Robustly extract JSON from LLM response."""
     response = response.strip()
@@ -501,7 +500,7 @@ async def detect_question_intent_llm(question: str, page_context: str) -> Set[st
             parameters={"question": question, "page_context": page_context}
         )
 
-        response = await _get_llm_service().generate(
+        response = await get_llm_service().generate(
             prompt=prompt,
             model="gemini-3-pro-preview",
             temperature=0.0,  # Zero temperature for deterministic classification
@@ -1345,9 +1344,9 @@ async def query_agents(intents: Set[str], study_id: str, query: str = "") -> Dic
             logger.warning("RAG intent detected but query is empty - skipping RAG search")
         else:
             try:
-                store = get_vector_store()
+                store = get_async_vector_store()
                 # Search across all source types for comprehensive context
-                rag_results_by_source = store.search_multi_source(
+                rag_results_by_source = await store.search_multi_source(
                     query=query,
                     source_types=["protocol", "literature", "registry"],
                     n_results_per_source=3
@@ -1756,52 +1755,25 @@ FALLBACK_CONTEXT = {
 }
 
 
-@router.post("", response_model=ChatResponse)
-async def chat(request: ChatRequest) -> ChatResponse:
-    """
-    Process a natural language query with multi-agent orchestration.
+def _build_chat_prompt(request: ChatRequest, intents: Set[str], agent_results: Dict[str, Any]) -> str:
+    """Build the narrative prompt from agent results, conversation history and the question."""
+    # Build context from agent results
+    agent_context = build_agent_context(agent_results, request.context)
 
-    This endpoint:
-    1. Detects question intent (what data sources are needed)
-    2. Queries relevant agents (Data, Literature, Registry)
-    3. Builds comprehensive context from agent responses
-    4. Generates response with full source provenance
-    """
-    try:
-        # Check cache first (96-hour TTL)
-        cached = _get_cached_response(request.message, request.context, request.study_id)
-        if cached:
-            # Mark as cached and add delay for natural UX
-            cached.cached = True
-            await asyncio.sleep(3)  # 3-second delay for demo purposes
-            return cached
+    # Fallback if no agent data retrieved
+    if not agent_context.strip() or agent_context == f"You are an AI assistant for the DELTA Revision Cup clinical study, Protocol H-34 ({request.context} view).\n":
+        agent_context = FALLBACK_CONTEXT.get(request.context, FALLBACK_CONTEXT["dashboard"])
 
-        llm = LLMService()
+    # Build conversation history
+    history_text = ""
+    if request.history:
+        for msg in request.history[-5:]:  # Last 5 messages for context
+            history_text += f"\n{msg.role.upper()}: {msg.content}"
 
-        # Step 1: Detect what agents to query based on question (LLM-based with keyword fallback)
-        intents = await detect_question_intent_llm(request.message, request.context)
-        logger.info(f"Detected intents for question: {intents}")
-
-        # Step 2: Query relevant agents
-        agent_results = await query_agents(intents, request.study_id, query=request.message)
-
-        # Step 3: Build context from agent results
-        agent_context = build_agent_context(agent_results, request.context)
-
-        # Fallback if no agent data retrieved
-        if not agent_context.strip() or agent_context == f"You are an AI assistant for the DELTA Revision Cup clinical study, Protocol H-34 ({request.context} view).\n":
-            agent_context = FALLBACK_CONTEXT.get(request.context, FALLBACK_CONTEXT["dashboard"])
-
-        # Build conversation history
-        history_text = ""
-        if request.history:
-            for msg in request.history[-5:]:  # Last 5 messages for context
-                history_text += f"\n{msg.role.upper()}: {msg.content}"
-
-        # Build multi-source synthesis instructions if applicable
-        multi_source_instructions = ""
-        if "multi_source" in intents:
-            multi_source_instructions = """
+    # Build multi-source synthesis instructions if applicable
+    multi_source_instructions = ""
+    if "multi_source" in intents:
+        multi_source_instructions = """
 
 MULTI-SOURCE SYNTHESIS REQUIREMENTS:
 This query requires synthesizing data from multiple sources. You MUST:
@@ -1816,8 +1788,8 @@ This query requires synthesizing data from multiple sources. You MUST:
 6. For product-specific queries (Delta PF, ceramic liners, etc.), cite product-specific literature where available
 """
 
-        # Build full prompt with agent context
-        prompt = f"""{agent_context}
+    # Build full prompt with agent context
+    prompt = f"""{agent_context}
 
 CONVERSATION HISTORY:{history_text}
 
@@ -1854,6 +1826,110 @@ ANTI-HALLUCINATION RULES (STRICT):
 - Only cite sources explicitly listed in STUDY DATA, LITERATURE BENCHMARKS, or REGISTRY BENCHMARKS sections
 
 Respond in a professional tone suitable for clinical and regulatory stakeholders."""
+    return prompt
+
+
+def _build_sources(agent_results: Dict[str, Any]) -> List[Source]:
+    """Build sources from agent results (real provenance)."""
+    sources = []
+    for source_info in agent_results.get("sources", []):
+        # Extract metadata if present and convert to SourceMetadata
+        metadata_dict = source_info.get("metadata")
+        metadata = SourceMetadata(**metadata_dict) if metadata_dict else None
+
+        sources.append(Source(
+            type=source_info["type"],
+            reference=source_info["reference"],
+            confidence=source_info.get("confidence", 1.0),
+            confidence_level=source_info.get("confidence_level", "high"),
+            lineage=source_info.get("lineage", "raw_data"),
+            metadata=metadata
+        ))
+    return sources
+
+
+def _add_inferred_sources(sources: List[Source], response_text: str) -> List[Source]:
+    """Add sources the response text refers to but agents did not return."""
+    response_lower = response_text.lower()
+    source_refs = set(s.reference for s in sources)
+
+    if "protocol" in response_lower and "CIP" not in str(source_refs):
+        sources.append(Source(type="protocol", reference="H-34 CIP v2.0"))
+    return sources
+
+
+def _build_evidence(agent_results: Dict[str, Any]) -> Optional[Evidence]:
+    """Build the Evidence object from agent results, or None if there are no metrics."""
+    evidence_data = agent_results.get("evidence", {})
+    evidence = None
+    if evidence_data.get("metrics"):
+        evidence_metrics = []
+        for metric in evidence_data.get("metrics", []):
+            data_points = []
+            for dp in metric.get("data_points", []):
+                # Convert raw_data dict to SourceRawData if present
+                raw_data = None
+                if dp.get("raw_data"):
+                    raw_data = SourceRawData(**dp["raw_data"])
+                data_points.append(EvidenceDataPoint(
+                    source=dp["source"],
+                    source_type=dp["source_type"],
+                    value=dp.get("value"),
+                    value_formatted=dp["value_formatted"],
+                    sample_size=dp.get("sample_size"),
+                    year=dp.get("year"),
+                    context=dp.get("context"),
+                    raw_data=raw_data
+                ))
+            evidence_metrics.append(EvidenceMetric(
+                metric_name=metric["metric_name"],
+                claim=metric["claim"],
+                aggregated_value=metric.get("aggregated_value"),
+                calculation_method=metric.get("calculation_method"),
+                data_points=data_points,
+                confidence_level=metric.get("confidence_level", "high")
+            ))
+
+        evidence = Evidence(
+            summary=f"Based on {evidence_data.get('total_sources', 0)} sources with combined n={evidence_data.get('total_sample_size', 0):,}",
+            metrics=evidence_metrics,
+            total_sources=evidence_data.get("total_sources", 0),
+            total_sample_size=evidence_data.get("total_sample_size")
+        )
+    return evidence
+
+
+@router.post("", response_model=ChatResponse)
+async def chat(request: ChatRequest) -> ChatResponse:
+    """
+    Process a natural language query with multi-agent orchestration.
+
+    This endpoint:
+    1. Detects question intent (what data sources are needed)
+    2. Queries relevant agents (Data, Literature, Registry)
+    3. Builds comprehensive context from agent responses
+    4. Generates response with full source provenance
+    """
+    try:
+        # Check cache first (96-hour TTL)
+        cached = _get_cached_response(request.message, request.context, request.study_id)
+        if cached:
+            # Mark as cached and add delay for natural UX
+            cached.cached = True
+            await asyncio.sleep(3)  # 3-second delay for demo purposes
+            return cached
+
+        llm = get_llm_service()
+
+        # Step 1: Detect what agents to query based on question (LLM-based with keyword fallback)
+        intents = await detect_question_intent_llm(request.message, request.context)
+        logger.info(f"Detected intents for question: {intents}")
+
+        # Step 2: Query relevant agents
+        agent_results = await query_agents(intents, request.study_id, query=request.message)
+
+        # Step 3: Build prompt from agent results
+        prompt = _build_chat_prompt(request, intents, agent_results)
 
         # Call LLM with comprehensive prompt
         response_text = await llm.generate(
@@ -1863,69 +1939,14 @@ Respond in a professional tone suitable for clinical and regulatory stakeholders
             max_tokens=2048  # Increased for comprehensive responses
         )
 
-        # Step 4: Build sources from agent results (real provenance)
-        sources = []
-        for source_info in agent_results.get("sources", []):
-            # Extract metadata if present and convert to SourceMetadata
-            metadata_dict = source_info.get("metadata")
-            metadata = SourceMetadata(**metadata_dict) if metadata_dict else None
-
-            sources.append(Source(
-                type=source_info["type"],
-                reference=source_info["reference"],
-                confidence=source_info.get("confidence", 1.0),
-                confidence_level=source_info.get("confidence_level", "high"),
-                lineage=source_info.get("lineage", "raw_data"),
-                metadata=metadata
-            ))
-
-        # Add inferred sources from response content
-        response_lower = response_text.lower()
-        source_refs = set(s.reference for s in sources)
-
-        if "protocol" in response_lower and "CIP" not in str(source_refs):
-            sources.append(Source(type="protocol", reference="H-34 CIP v2.0"))
+        # Step 4: Build sources from agent results, plus sources the response refers to
+        sources = _add_inferred_sources(_build_sources(agent_results), response_text)
 
         # Generate contextual follow-up suggestions based on intents
         followups = _generate_followups(intents, request.context)
 
         # Build Evidence object from agent results
-        evidence_data = agent_results.get("evidence", {})
-        evidence = None
-        if evidence_data.get("metrics"):
-            evidence_metrics = []
-            for metric in evidence_data.get("metrics", []):
-                data_points = []
-                for dp in metric.get("data_points", []):
-                    # Convert raw_data dict to SourceRawData if present
-                    raw_data = None
-                    if dp.get("raw_data"):
-                        raw_data = SourceRawData(**dp["raw_data"])
-                    data_points.append(EvidenceDataPoint(
-                        source=dp["source"],
-                        source_type=dp["source_type"],
-                        value=dp.get("value"),
-                        value_formatted=dp["value_formatted"],
-                        sample_size=dp.get("sample_size"),
-                        year=dp.get("year"),
-                        context=dp.get("context"),
-                        raw_data=raw_data
-                    ))
-                evidence_metrics.append(EvidenceMetric(
-                    metric_name=metric["metric_name"],
-                    claim=metric["claim"],
-                    aggregated_value=metric.get("aggregated_value"),
-                    calculation_method=metric.get("calculation_method"),
-                    data_points=data_points,
-                    confidence_level=metric.get("confidence_level", "high")
-                ))
-
-            evidence = Evidence(
-                summary=f"Based on {evidence_data.get('total_sources', 0)} sources with combined n={evidence_data.get('total_sample_size', 0):,}",
-                metrics=evidence_metrics,
-                total_sources=evidence_data.get("total_sources", 0),
-                total_sample_size=evidence_data.get("total_sample_size")
-            )
+        evidence = _build_evidence(agent_results)
 
         # Build the response
         chat_response = ChatResponse(
@@ -1945,6 +1966,93 @@ Respond in a professional tone suitable for clinical and regulatory stakeholders
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def generate_chat_events(request: ChatRequest) -> AsyncIterator[str]:
+    """
+    Generate server-sent events for a streamed chat response.
+
+    Sources and evidence are known once the agents have answered, so they
+    are sent before the narrative, which follows token by token.
+    """
+    try:
+        cached = _get_cached_response(request.message, request.context, request.study_id)
+        if cached:
+            cached.cached = True
+            context = ChatStreamContext(
+                sources=cached.sources,
+                evidence=cached.evidence,
+                suggested_followups=cached.suggested_followups,
+            )
+            yield f"event: context\ndata: {context.model_dump_json()}\n\n"
+            yield f"event: token\ndata: {json.dumps({'text': cached.response})}\n\n"
+            yield f"event: done\ndata: {cached.model_dump_json()}\n\n"
+            return
+
+        intents = await detect_question_intent_llm(request.message, request.context)
+        logger.info(f"Detected intents for question: {intents}")
+        agent_results = await query_agents(intents, request.study_id, query=request.message)
+
+        # Sources and evidence first, while the narrative is generated
+        sources = _build_sources(agent_results)
+        evidence = _build_evidence(agent_results)
+        followups = _generate_followups(intents, request.context)
+        context = ChatStreamContext(
+            sources=sources if sources else [Source(type="study_data", reference="H-34 Study Data")],
+            evidence=evidence,
+            suggested_followups=followups,
+        )
+        yield f"event: context\ndata: {context.model_dump_json()}\n\n"
+
+        parts = []
+        async for text in get_llm_service().generate_stream(
+            prompt=_build_chat_prompt(request, intents, agent_results),
+            model="gemini-3-pro-preview",
+            temperature=0.3,
+            max_tokens=2048
+        ):
+            parts.append(text)
+            yield f"event: token\ndata: {json.dumps({'text': text})}\n\n"
+
+        response_text = "".join(parts)
+        sources = _add_inferred_sources(sources, response_text)
+        chat_response = ChatResponse(
+            response=response_text,
+            sources=sources if sources else [Source(type="study_data", reference="H-34 Study Data")],
+            evidence=evidence,
+            suggested_followups=followups
+        )
+        _cache_response(request.message, request.context, request.study_id, chat_response)
+        yield f"event: done\ndata: {chat_response.model_dump_json()}\n\n"
+
+    except asyncio.CancelledError:
+        logger.info(f"Chat stream cancelled by client: {request.message[:50]}...")
+        raise
+    except Exception as e:
+        logger.error(f"Chat stream error: {e}", exc_info=True)
+        yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+
+
+@router.post("/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    Streaming variant of the chat endpoint, via Server-Sent Events.
+
+    Events, in order:
+    - context: sources, evidence and suggested follow-ups (ChatStreamContext)
+    - token: {"text": ...} chunks of the narrative as the model produces them
+    - done: the complete ChatResponse, including sources cited in the narrative
+    - error: {"error": ...} if the request fails; no further events follow
+    """
+    return StreamingResponse(
+        generate_chat_events(request),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        }
+    )
+
+
 def _generate_followups(intents: Set[str], context: str) -> List[str]:
     """Generate contextual follow-up suggestions based on query intents."""
     followups = []
@@ -6,6 +6,8 @@ from typing import Dict, Any
 
 from fastapi import APIRouter
 from app.services.cache_service import get_cache_service
+from app.services.llm_service import get_llm_service
+from data.vectorstore import get_vector_store_pool_stats, get_vector_store_embedding_cache_stats
 
 router = APIRouter()
 
@@ -55,3 +57,35 @@ async def cache_status() -> Dict[str, Any]:
         "timestamp": datetime.utcnow().isoformat(),
         **cache.get_status()
     }
+
+
+@router.get("/llm-status")
+async def llm_status() -> Dict[str, Any]:
+    """
+    LLM status endpoint.
+    Returns cumulative token usage, response cache hit/miss counters and
+    per-model admission queue depth, wait times and throttling.
+    """
+    llm = get_llm_service()
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "usage": llm.get_usage_stats(),
+        "response_cache": llm.get_cache_stats(),
+        "limits": llm.get_limiter_stats(),
+    }
+
+
+@router.get("/vector-store-status")
+async def vector_store_status() -> Dict[str, Any]:
+    """
+    Vector store status endpoint.
+    Returns connection pool usage (in use, idle, waits) and query embedding
+    cache hit/miss counters for monitoring.
+    """
+    pool_stats = get_vector_store_pool_stats()
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "initialized": pool_stats is not None,
+        "pool": pool_stats,
+        "embedding_cache": get_vector_store_embedding_cache_stats(),
+    }
@@ -3,7 +3,7 @@ Monte Carlo Simulation API.
 
 Multi-factor simulation for risk-adjusted cohort outcome projection.
 """
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, Query
@@ -39,6 +39,30 @@ class SimulationRequest(BaseModel):
     n_iterations: int = Field(default=10000, ge=100, le=100000, description="Number of iterations")
     risk_distribution: Optional[RiskDistribution] = Field(None, description="Custom risk prevalence")
     seed: Optional[int] = Field(None, description="Random seed for reproducibility")
+    engine: Literal["vectorized", "parallel", "loop"] = Field(
+        default="vectorized",
+        description="Simulation engine (loop is the per-patient reference); "
+                    "adaptive runs use their own batch engine and accept only the default",
+    )
+    n_workers: Optional[int] = Field(
+        None, ge=1, le=64,
+        description="Worker processes for the parallel engine (capped at MONTE_CARLO_MAX_WORKERS); "
+                    "not supported with adaptive",
+    )
+    adaptive: bool = Field(
+        default=False,
+        description="Stop early once converged (n_iterations becomes the maximum); "
+                    "runs in-process batches, so engine and n_workers cannot be set",
+    )
+    precision: float = Field(
+        default=0.01, gt=0, le=0.5, description="Adaptive mode: target CI half-width for probability_pass"
+    )
+    rate_precision: float = Field(
+        default=0.001, gt=0, le=0.5, description="Adaptive mode: target CI half-width for mean revision rate"
+    )
+    include_raw_rates: bool = Field(
+        default=False, description="Also return every per-iteration revision rate (large for big runs)"
+    )
 
 
 class ScenarioSpec(BaseModel):
@@ -56,6 +80,21 @@ class ScenarioComparisonRequest(BaseModel):
     n_iterations: int = Field(default=10000, ge=100, le=100000, description="Iterations per scenario")
     scenarios: List[ScenarioSpec] = Field(..., min_length=1, max_length=10, description="Scenarios to compare")
     seed: Optional[int] = Field(default=42, description="Random seed")
+    engine: Literal["crn", "vectorized", "parallel", "loop"] = Field(
+        default="crn",
+        description="crn evaluates all scenarios in one pass with common random numbers; "
+                    "other engines run each scenario independently",
+    )
+    n_workers: Optional[int] = Field(None, ge=1, le=64, description="Worker processes for the parallel engine (capped at MONTE_CARLO_MAX_WORKERS)")
+
+
+class SensitivityRequest(BaseModel):
+    """Request for Sobol global sensitivity analysis."""
+    n_patients: int = Field(default=549, ge=10, le=10000, description="Cohort size")
+    n_samples: int = Field(default=4096, ge=256, le=65536, description="Base sample size N")
+    n_bootstrap: int = Field(default=100, ge=10, le=1000, description="Bootstrap resamples for CIs")
+    risk_distribution: Optional[RiskDistribution] = Field(None, description="Custom risk prevalence")
+    seed: Optional[int] = Field(default=42, description="Random seed")
 
 
 class HazardRatioResponse(BaseModel):
@@ -84,8 +123,18 @@ class SimulationResponse(BaseModel):
     verdict: str
     verdict_label: str = Field(description="Human-readable verdict")
     variance_contributions: Dict[str, float]
+    histogram: Dict[str, Any] = Field(description="Fixed-bin histogram of cohort revision rates")
+    revision_rates: Optional[List[float]] = Field(None, description="Per-iteration rates, if requested")
     execution_time_ms: float
     generated_at: str
+    max_iterations: Optional[int] = Field(None, description="Adaptive mode: iteration cap")
+    stop_reason: Optional[str] = Field(None, description="Adaptive mode: why the run stopped")
+    probability_pass_ci_half_width: Optional[float] = Field(
+        None, description="Adaptive mode: achieved CI half-width for probability_pass"
+    )
+    mean_revision_rate_ci_half_width: Optional[float] = Field(
+        None, description="Adaptive mode: achieved CI half-width for mean revision rate"
+    )
 
 
 class ScenarioComparisonResponse(BaseModel):
@@ -98,6 +147,29 @@ class ScenarioComparisonResponse(BaseModel):
     generated_at: str
 
 
+class SensitivityFactor(BaseModel):
+    """Sobol indices for one uncertain input."""
+    factor: str
+    first_order: float
+    first_order_ci: float
+    total_order: float
+    total_order_ci: float
+
+
+class SensitivityResponse(BaseModel):
+    """Response from Sobol global sensitivity analysis."""
+    success: bool = True
+    n_patients: int
+    n_base_samples: int
+    n_model_evaluations: int
+    output_mean: float
+    output_variance: float
+    factors: List[SensitivityFactor]
+    interaction_share: float = Field(description="Variance share not explained by first-order effects")
+    execution_time_ms: float
+    generated_at: str
+
+
 class HazardRatiosResponse(BaseModel):
     """Response with all hazard ratio specifications."""
     success: bool = True
@@ -121,6 +193,12 @@ async def run_monte_carlo_simulation(request: SimulationRequest) -> SimulationRe
 
     Returns probability of meeting regulatory benchmark and outcome distribution.
     """
+    if request.adaptive and (request.engine != "vectorized" or request.n_workers is not None):
+        raise HTTPException(
+            status_code=422,
+            detail="adaptive runs use their own batch engine; engine and n_workers cannot be set",
+        )
+
     service = get_monte_carlo_service()
 
     # Get risk distribution
@@ -137,12 +215,26 @@ async def run_monte_carlo_simulation(request: SimulationRequest) -> SimulationRe
     )
 
     # Run simulation
-    summary = service.run_simulation(
-        cohort=cohort,
-        threshold_key=request.threshold,
-        n_iterations=request.n_iterations,
-        seed=request.seed
-    )
+    if request.adaptive:
+        summary = service.run_adaptive_simulation(
+            cohort=cohort,
+            threshold_key=request.threshold,
+            max_iterations=request.n_iterations,
+            precision=request.precision,
+            rate_precision=request.rate_precision,
+            seed=request.seed,
+            keep_raw_rates=request.include_raw_rates,
+        )
+    else:
+        summary = service.run_simulation(
+            cohort=cohort,
+            threshold_key=request.threshold,
+            n_iterations=request.n_iterations,
+            seed=request.seed,
+            engine=request.engine,
+            n_workers=request.n_workers,
+            keep_raw_rates=request.include_raw_rates,
+        )
 
     # Map verdict to label
     verdict_labels = {
@@ -167,8 +259,20 @@ async def run_monte_carlo_simulation(request: SimulationRequest) -> SimulationRe
         verdict=summary.verdict,
         verdict_label=verdict_labels.get(summary.verdict, summary.verdict),
         variance_contributions=summary.variance_contributions,
+        histogram=summary.histogram,
+        revision_rates=summary.revision_rates,
         execution_time_ms=round(summary.execution_time_ms, 1),
         generated_at=summary.generated_at,
+        max_iterations=summary.max_iterations,
+        stop_reason=summary.stop_reason,
+        probability_pass_ci_half_width=(
+            round(summary.probability_pass_ci_half_width, 4)
+            if summary.probability_pass_ci_half_width is not None else None
+        ),
+        mean_revision_rate_ci_half_width=(
+            round(summary.mean_revision_rate_ci_half_width, 5)
+            if summary.mean_revision_rate_ci_half_width is not None else None
+        ),
     )
 
 
@@ -182,7 +286,9 @@ async def compare_scenarios(request: ScenarioComparisonRequest) -> ScenarioCompa
     - "What if we tighten BMI criteria?"
     - "How does Paprosky 3B exclusion affect outcomes?"
 
-    Each scenario gets its own Monte Carlo run with modified risk distribution.
+    By default all scenarios share one set of sampled baseline rates, hazard
+    ratios and patient draws (common random numbers), so the deltas between
+    scenarios are tight and the sweep costs a single vectorized pass.
     """
     service = get_monte_carlo_service()
 
@@ -214,6 +320,8 @@ async def compare_scenarios(request: ScenarioComparisonRequest) -> ScenarioCompa
         threshold_key=request.threshold,
         n_iterations=request.n_iterations,
         seed=request.seed,
+        engine=request.engine,
+        n_workers=request.n_workers,
     )
 
     # Format response
@@ -235,6 +343,7 @@ async def compare_scenarios(request: ScenarioComparisonRequest) -> ScenarioCompa
             "delta_probability": round(result.delta_probability, 4) if result.delta_probability else None,
             "delta_probability_pct": round(result.delta_probability * 100, 1) if result.delta_probability else None,
             "delta_mean_rate": round(result.delta_mean_rate, 4) if result.delta_mean_rate else None,
+            "delta_mean_rate_se": round(result.delta_mean_rate_se, 5) if result.delta_mean_rate_se else None,
         })
 
     return ScenarioComparisonResponse(
@@ -247,6 +356,37 @@ async def compare_scenarios(request: ScenarioComparisonRequest) -> ScenarioCompa
     )
 
 
+@router.post("/monte-carlo/sensitivity", response_model=SensitivityResponse)
+async def run_sensitivity_analysis(request: SensitivityRequest) -> SensitivityResponse:
+    """
+    Global sensitivity analysis of hazard-ratio uncertainty (Sobol indices).
+
+    Unlike the correlation-based variance contributions returned by
+    /monte-carlo/run, total-order indices include interaction effects
+    between the baseline rate and hazard ratios.
+    """
+    service = get_monte_carlo_service()
+
+    risk_dist = None
+    if request.risk_distribution:
+        risk_dist = request.risk_distribution.to_dict() or None
+
+    cohort = service.generate_synthetic_cohort(
+        n_patients=request.n_patients,
+        risk_distribution=risk_dist,
+        seed=request.seed,
+    )
+
+    sensitivity = service.run_sensitivity_analysis(
+        cohort=cohort,
+        n_samples=request.n_samples,
+        n_bootstrap=request.n_bootstrap,
+        seed=request.seed,
+    )
+
+    return SensitivityResponse(success=True, **service.sensitivity_to_dict(sensitivity))
+
+
 @router.get("/monte-carlo/hazard-ratios", response_model=HazardRatiosResponse)
 async def get_hazard_ratios() -> HazardRatiosResponse:
     """
@@ -54,6 +54,58 @@ class Settings(BaseSettings):
         alias="GEMINI_TIMEOUT",
         description="Gemini timeout in seconds"
     )
+    gemini_max_connections: int = Field(
+        default=32,
+        alias="GEMINI_MAX_CONNECTIONS",
+        description="HTTP connections the async Gemini client keeps open (bounds concurrent calls)"
+    )
+
+    # LLM admission control (applied per provider and model)
+    gemini_max_in_flight: int = Field(
+        default=16,
+        alias="GEMINI_MAX_IN_FLIGHT",
+        description="Concurrent Gemini requests per model"
+    )
+    gemini_requests_per_minute: int = Field(
+        default=600,
+        alias="GEMINI_REQUESTS_PER_MINUTE",
+        description="Gemini request quota per model"
+    )
+    gemini_tokens_per_minute: int = Field(
+        default=2000000,
+        alias="GEMINI_TOKENS_PER_MINUTE",
+        description="Gemini input + output token quota per model"
+    )
+    azure_openai_max_in_flight: int = Field(
+        default=8,
+        alias="AZURE_OPENAI_MAX_IN_FLIGHT",
+        description="Concurrent Azure OpenAI requests per deployment"
+    )
+    azure_openai_requests_per_minute: int = Field(
+        default=300,
+        alias="AZURE_OPENAI_REQUESTS_PER_MINUTE",
+        description="Azure OpenAI request quota per deployment"
+    )
+    azure_openai_tokens_per_minute: int = Field(
+        default=150000,
+        alias="AZURE_OPENAI_TOKENS_PER_MINUTE",
+        description="Azure OpenAI input + output token quota per deployment"
+    )
+    azure_openai_max_retries: int = Field(
+        default=3,
+        alias="AZURE_OPENAI_MAX_RETRIES",
+        description="Azure OpenAI attempts per request (retryable errors only)"
+    )
+    llm_queue_timeout: float = Field(
+        default=120.0,
+        alias="LLM_QUEUE_TIMEOUT",
+        description="Seconds an LLM request may wait for admission before failing"
+    )
+    llm_max_retry_after: float = Field(
+        default=60.0,
+        alias="LLM_MAX_RETRY_AFTER",
+        description="Upper bound on a provider-requested retry delay in seconds"
+    )
 
     # Azure OpenAI
     azure_openai_api_key: str = Field(
@@ -94,6 +146,107 @@ class Settings(BaseSettings):
         description="Embedding model for vector store"
     )
 
+    # Vector store connection pool
+    vector_db_pool_min_size: int = Field(
+        default=1,
+        alias="VECTOR_DB_POOL_MIN_SIZE",
+        description="Vector store connections opened at startup"
+    )
+    vector_db_pool_max_size: int = Field(
+        default=10,
+        alias="VECTOR_DB_POOL_MAX_SIZE",
+        description="Maximum concurrently open vector store connections"
+    )
+    vector_db_pool_timeout: float = Field(
+        default=30.0,
+        alias="VECTOR_DB_POOL_TIMEOUT",
+        description="Seconds to wait for a free vector store connection"
+    )
+    vector_storage_mode: str = Field(
+        default="full",
+        alias="VECTOR_STORAGE_MODE",
+        description="ANN index layout: full, halfvec or binary (compact modes re-rank on full vectors)"
+    )
+
+    # Embedding backend
+    embedding_backend: str = Field(
+        default="gemini",
+        alias="EMBEDDING_BACKEND",
+        description="Embedding backend: gemini (network) or local (deterministic, offline)"
+    )
+    embedding_dimension: int = Field(
+        default=768,
+        alias="EMBEDDING_DIMENSION",
+        description="Vector size for the local embedding backend (must match the vector table)"
+    )
+
+    embedding_max_concurrency: int = Field(
+        default=4,
+        alias="EMBEDDING_MAX_CONCURRENCY",
+        description="Gemini embedding batches in flight at once during ingestion"
+    )
+    embedding_requests_per_minute: int = Field(
+        default=1500,
+        alias="EMBEDDING_REQUESTS_PER_MINUTE",
+        description="Gemini embedding request quota shared by concurrent batches"
+    )
+
+    # Query embedding cache
+    embedding_cache_enabled: bool = Field(
+        default=True,
+        alias="EMBEDDING_CACHE_ENABLED",
+        description="Cache query embeddings in memory and on disk"
+    )
+    embedding_cache_path: str = Field(
+        default="data/embedding_cache.db",
+        alias="EMBEDDING_CACHE_PATH",
+        description="SQLite file for persisted query embeddings"
+    )
+    embedding_cache_memory_size: int = Field(
+        default=2048,
+        alias="EMBEDDING_CACHE_MEMORY_SIZE",
+        description="Query embeddings kept in the in-memory LRU"
+    )
+
+    # LLM response cache
+    llm_cache_enabled: bool = Field(
+        default=True,
+        alias="LLM_CACHE_ENABLED",
+        description="Cache low-temperature LLM responses in memory and on disk"
+    )
+    llm_cache_path: str = Field(
+        default="data/llm_cache.db",
+        alias="LLM_CACHE_PATH",
+        description="SQLite file for persisted LLM responses"
+    )
+    llm_cache_memory_size: int = Field(
+        default=512,
+        alias="LLM_CACHE_MEMORY_SIZE",
+        description="LLM responses kept in the in-memory LRU"
+    )
+    llm_cache_ttl_seconds: int = Field(
+        default=604800,
+        alias="LLM_CACHE_TTL_SECONDS",
+        description="Lifetime of a cached LLM response (default 7 days)"
+    )
+    llm_cache_max_disk_mb: int = Field(
+        default=256,
+        alias="LLM_CACHE_MAX_DISK_MB",
+        description="Response megabytes kept on disk before least recently used eviction"
+    )
+    llm_cache_max_temperature: float = Field(
+        default=0.2,
+        alias="LLM_CACHE_MAX_TEMPERATURE",
+        description="Only calls at or below this temperature are cached (higher ones expect varied output)"
+    )
+
+    # Monte Carlo simulation
+    monte_carlo_max_workers: int = Field(
+        default=0,
+        alias="MONTE_CARLO_MAX_WORKERS",
+        description="Process pool size for the parallel simulation engine (0 = CPU count); caps per-request n_workers"
+    )
+
     # Data paths (relative to project root)
     h34_study_data_path: str = Field(
         default="data/raw/study/H-34DELTARevisionstudy_export_20250912.xlsx",
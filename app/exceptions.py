@@ -55,6 +55,18 @@ class LLMServiceError(Exception):
     pass
 
 
+class LLMCapacityError(LLMServiceError):
+    """
+    Raised when an LLM request waits in the admission queue past its deadline.
+
+    HTTP Status: 503 Service Unavailable
+
+    The provider's concurrency or rate budget is exhausted; shedding the
+    request is preferable to letting queues grow without bound.
+    """
+    pass
+
+
 class StudyDataLoadError(Exception):
     """
     Raised when study data cannot be loaded from the database.
@@ -30,6 +30,9 @@ from app.api.routers import (
     onboarding, products
 )
 from app.services.cache_service import warmup_cache, start_background_refresh, get_cache_service
+from app.services.monte_carlo_service import shutdown_monte_carlo_service
+from app.services.llm_service import shutdown_llm_service
+from data.vectorstore import close_vector_store
 
 # Detect production mode
 IS_PRODUCTION = os.getenv("REPLIT_DEPLOYMENT", "0") == "1" or os.getenv("PRODUCTION", "0") == "1"
@@ -182,6 +185,9 @@ async def shutdown_event():
     """Cleanup on shutdown."""
     if http_client:
         await http_client.aclose()
+    shutdown_monte_carlo_service()
+    await shutdown_llm_service()
+    close_vector_store()
 
 
 async def _proxy_request_to_vite(request: Request, path: str):
@@ -0,0 +1,310 @@
+"""
+Persistent cache for LLM responses.
+
+Most LLMService calls are low-temperature completions of deterministic
+prompts (risk-factor extraction, narratives, intent detection), so the same
+request is paid for again after every restart. ``LLMResponseCache`` keys
+responses by a hash of everything that determines them (provider, model id,
+prompt, max_tokens, temperature, response_format) and keeps them in a bounded
+in-memory LRU backed by SQLite. Entries expire after a TTL and the disk tier
+evicts least recently used responses beyond a size budget.
+"""
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """A cached LLM completion."""
+    content: str
+    model: str
+    provider: str
+    output_tokens: int
+    expires_at: float
+
+
+class LLMResponseCache:
+    """
+    Two-level (memory LRU + SQLite) content-addressed LLM response cache.
+
+    Thread-safe; a single SQLite connection is shared behind a lock.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        max_memory_entries: int = 512,
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+    ):
+        """
+        Initialize LLM response cache.
+
+        Args:
+            db_path: SQLite file for the persistent tier (created if missing)
+            max_memory_entries: Capacity of the in-memory LRU
+            ttl_seconds: Lifetime of a cached response
+            max_disk_bytes: Response bytes kept on disk before LRU eviction
+        """
+        if max_memory_entries < 0:
+            raise ValueError("max_memory_entries must be non-negative")
+        if ttl_seconds <= 0 or max_disk_bytes <= 0:
+            raise ValueError("ttl_seconds and max_disk_bytes must be positive")
+
+        self.db_path = Path(db_path)
+        self.max_memory_entries = max_memory_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_bytes = max_disk_bytes
+
+        self._memory: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._writes = 0
+        self._evictions = 0
+        self._output_tokens_saved = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                cache_key TEXT PRIMARY KEY,
+                provider TEXT NOT NULL,
+                model TEXT NOT NULL,
+                content TEXT NOT NULL,
+                output_tokens INTEGER NOT NULL DEFAULT 0,
+                size_bytes INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_responses_last_access ON llm_responses (last_access)"
+        )
+        self._conn.execute("DELETE FROM llm_responses WHERE expires_at <= ?", (time.time(),))
+        self._conn.commit()
+        self._disk_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size_bytes), 0) FROM llm_responses"
+        ).fetchone()[0]
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        response_format: Optional[str],
+    ) -> str:
+        """Build the content-addressed cache key (the prompt is hashed verbatim)."""
+        payload = "\x1f".join((
+            provider,
+            model,
+            str(max_tokens),
+            repr(float(temperature)),
+            response_format or "",
+            prompt,
+        ))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Look up a cached response.
+
+        Returns:
+            The cached response, or None on a miss or an expired entry
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry.expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._memory_hits += 1
+                    self._output_tokens_saved += entry.output_tokens
+                    return entry
+                del self._memory[key]
+
+            row = self._conn.execute(
+                """
+                SELECT content, model, provider, output_tokens, expires_at
+                FROM llm_responses WHERE cache_key = ?
+                """,
+                (key,)
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+
+            entry = CachedResponse(*row)
+            if entry.expires_at <= now:
+                self._delete(key)
+                self._expired += 1
+                self._misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE llm_responses SET last_access = ? WHERE cache_key = ?", (now, key)
+            )
+            self._conn.commit()
+            self._remember(key, entry)
+            self._disk_hits += 1
+            self._output_tokens_saved += entry.output_tokens
+            return entry
+
+    def put(
+        self,
+        key: str,
+        content: str,
+        model: str,
+        provider: str,
+        output_tokens: int = 0,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        """Store a response in both tiers, evicting old responses if over budget."""
+        now = time.time()
+        entry = CachedResponse(
+            content=content,
+            model=model,
+            provider=provider,
+            output_tokens=output_tokens,
+            expires_at=now + (ttl_seconds or self.ttl_seconds),
+        )
+        size_bytes = len(content.encode("utf-8"))
+        if size_bytes > self.max_disk_bytes:
+            return
+
+        with self._lock:
+            self._remember(key, entry)
+            self._delete(key)
+            self._conn.execute(
+                """
+                INSERT INTO llm_responses
+                    (cache_key, provider, model, content, output_tokens, size_bytes,
+                     created_at, expires_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (key, provider, model, content, output_tokens, size_bytes, now, entry.expires_at, now)
+            )
+            self._disk_bytes += size_bytes
+            self._writes += 1
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict()
+            self._conn.commit()
+
+    def invalidate(self, key: str) -> None:
+        """Drop one response from both tiers (e.g. one that failed to parse)."""
+        with self._lock:
+            self._memory.pop(key, None)
+            self._delete(key)
+            self._conn.commit()
+
+    def _delete(self, key: str) -> None:
+        """Remove a disk entry and account for its size. Caller holds the lock."""
+        row = self._conn.execute(
+            "SELECT size_bytes FROM llm_responses WHERE cache_key = ?", (key,)
+        ).fetchone()
+        if row is not None:
+            self._conn.execute("DELETE FROM llm_responses WHERE cache_key = ?", (key,))
+            self._disk_bytes -= row[0]
+
+    def _evict(self) -> None:
+        """Drop expired, then least recently used, responses until under budget. Caller holds the lock."""
+        self._conn.execute("DELETE FROM llm_responses WHERE expires_at <= ?", (time.time(),))
+        rows = self._conn.execute(
+            "SELECT cache_key, size_bytes FROM llm_responses ORDER BY last_access"
+        ).fetchall()
+        total = sum(size for _, size in rows)
+        victims = []
+        for key, size in rows:
+            if total <= self.max_disk_bytes * 0.9:  # leave headroom so eviction is not per-write
+                break
+            victims.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM llm_responses WHERE cache_key = ?", victims)
+        for (key,) in victims:
+            self._memory.pop(key, None)
+        self._evictions += len(victims)
+        self._disk_bytes = total
+
+    def _remember(self, key: str, entry: CachedResponse) -> None:
+        """Insert into the LRU, evicting the least recently used entry. Caller holds the lock."""
+        if self.max_memory_entries == 0:
+            return
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses from memory and disk."""
+        with self._lock:
+            self._memory.clear()
+            self._conn.execute("DELETE FROM llm_responses")
+            self._conn.commit()
+            self._disk_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters for monitoring."""
+        with self._lock:
+            hits = self._memory_hits + self._disk_hits
+            lookups = hits + self._misses
+            disk_entries = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+            return {
+                "hits": hits,
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "expired": self._expired,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "writes": self._writes,
+                "evictions": self._evictions,
+                "output_tokens_saved": self._output_tokens_saved,
+                "memory_entries": len(self._memory),
+                "max_memory_entries": self.max_memory_entries,
+                "disk_entries": disk_entries,
+                "disk_bytes": self._disk_bytes,
+                "max_disk_bytes": self.max_disk_bytes,
+            }
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_llm_response_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_response_cache() -> Optional[LLMResponseCache]:
+    """Get the shared LLM response cache, or None if disabled in settings."""
+    global _llm_response_cache
+    if not settings.llm_cache_enabled:
+        return None
+    if _llm_response_cache is None:
+        db_path = Path(settings.llm_cache_path)
+        if not db_path.is_absolute():
+            db_path = settings.project_root / db_path
+        _llm_response_cache = LLMResponseCache(
+            db_path,
+            max_memory_entries=settings.llm_cache_memory_size,
+            ttl_seconds=settings.llm_cache_ttl_seconds,
+            max_disk_bytes=settings.llm_cache_max_disk_mb * 1024 * 1024,
+        )
+    return _llm_response_cache
@@ -1,21 +1,31 @@
 """
 LLM Service for Clinical Intelligence Platform.
-Unified interface for Gemini and Azure OpenAI with rate limiting and retries.
+Unified interface for Gemini and Azure OpenAI with rate limiting, retries and streaming.
 """
 import asyncio
+import email.utils
 import logging
 import os
 import json
-from typing import Optional, Dict, Any, List, Tuple
+import random
+import re
+import time
+from contextlib import aclosing
+from typing import Optional, Dict, Any, AsyncIterator, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
 import google.generativeai as genai
+import httpx
+from google import genai as google_genai
+from google.genai import types as genai_types
+import openai
 from openai import AsyncAzureOpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from app.config import settings
-from app.exceptions import LLMServiceError
+from app.exceptions import LLMCapacityError, LLMServiceError
+from app.services.llm_cache import LLMResponseCache, get_llm_response_cache
+from app.services.rate_limiter import AdmissionController
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +54,8 @@ class LLMService:
     - Automatic provider selection based on model name
     - Rate limiting and retry logic
     - Token usage tracking
+    - Streaming output (generate_stream)
+    - Persistent response cache for low-temperature calls
     - Consensus mode for critical decisions
     """
 
@@ -70,14 +82,27 @@ class LLMService:
         "gpt-4o": 16384,
     }
 
-    def __init__(self):
-        """Initialize LLM service with API keys from environment."""
+    def __init__(self, response_cache: Optional[LLMResponseCache] = None):
+        """
+        Initialize LLM service with API keys from environment.
+
+        Args:
+            response_cache: Response cache. Defaults to the shared cache (None if disabled).
+        """
         # Configure Gemini
         self.gemini_api_key = settings.gemini_api_key
         if self.gemini_api_key:
+            # Still used by the embedding code paths
             genai.configure(api_key=self.gemini_api_key)
             logger.info("Gemini API configured")
 
+        # Async Gemini client, created per event loop on first use (see _get_gemini_client)
+        self._gemini_client: Optional[google_genai.Client] = None
+        self._gemini_http_client: Optional[httpx.AsyncClient] = None
+        self._gemini_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Generation configs per (model_id, max_tokens, temperature), built once
+        self._gemini_configs: Dict[Tuple[str, int, float], genai_types.GenerateContentConfig] = {}
+
         # Configure Azure OpenAI
         self.azure_client: Optional[AsyncAzureOpenAI] = None
         if settings.azure_openai_api_key and settings.azure_openai_endpoint:
@@ -85,6 +110,7 @@ class LLMService:
                 api_key=settings.azure_openai_api_key,
                 api_version=settings.azure_openai_api_version,
                 azure_endpoint=settings.azure_openai_endpoint,
+                max_retries=0,  # retries are driven by _call_with_admission
             )
             logger.info("Azure OpenAI client configured")
 
@@ -92,6 +118,16 @@ class LLMService:
         self.total_input_tokens = 0
         self.total_output_tokens = 0
 
+        self.response_cache = response_cache if response_cache is not None else get_llm_response_cache()
+
+        # Single-flight: request key -> shared in-flight provider call
+        self._in_flight: Dict[str, "asyncio.Task[str]"] = {}
+        self.provider_calls = 0
+        self.coalesced_requests = 0
+
+        # Admission control per (provider, model id)
+        self._limiters: Dict[Tuple[str, str], AdmissionController] = {}
+
     def _get_provider(self, model: str) -> LLMProvider:
         """Determine provider based on model name."""
         if model.startswith("gemini") or model in self.GEMINI_MODELS:
@@ -109,12 +145,156 @@ class LLMService:
                 return max_tokens
         return 8192  # Default
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type((Exception,)),
-        reraise=True
-    )
+    def _request_key(
+        self,
+        prompt: str,
+        model: str,
+        max_tokens: Optional[int],
+        temperature: float,
+        response_format: Optional[str],
+    ) -> str:
+        """Hash of everything that determines a response (provider, model id, prompt, parameters)."""
+        provider = self._get_provider(model)
+        if provider == LLMProvider.GEMINI:
+            model_id = self.GEMINI_MODELS.get(model, model)
+        else:
+            model_id = settings.azure_openai_deployment
+        return LLMResponseCache.make_key(
+            provider.value,
+            model_id,
+            prompt,
+            max_tokens if max_tokens is not None else self._get_max_tokens(model),
+            temperature,
+            response_format,
+        )
+
+    def _cache_key(
+        self,
+        prompt: str,
+        model: str,
+        max_tokens: Optional[int],
+        temperature: float,
+        response_format: Optional[str],
+    ) -> Optional[str]:
+        """Response cache key for a call, or None if the call is not cacheable."""
+        if self.response_cache is None or temperature > settings.llm_cache_max_temperature:
+            return None
+        return self._request_key(prompt, model, max_tokens, temperature, response_format)
+
+    RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+    def _get_limiter(self, provider: LLMProvider, model_id: str) -> AdmissionController:
+        """Get the admission controller for a provider and model."""
+        key = (provider.value, model_id)
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            if provider == LLMProvider.GEMINI:
+                limits = (
+                    settings.gemini_max_in_flight,
+                    settings.gemini_requests_per_minute,
+                    settings.gemini_tokens_per_minute,
+                )
+            else:
+                limits = (
+                    settings.azure_openai_max_in_flight,
+                    settings.azure_openai_requests_per_minute,
+                    settings.azure_openai_tokens_per_minute,
+                )
+            limiter = AdmissionController(
+                f"{provider.value}:{model_id}",
+                max_in_flight=limits[0],
+                requests_per_minute=limits[1],
+                tokens_per_minute=limits[2],
+                queue_timeout=settings.llm_queue_timeout,
+            )
+            self._limiters[key] = limiter
+        return limiter
+
+    async def _call_with_admission(
+        self,
+        provider: LLMProvider,
+        model_id: str,
+        prompt: str,
+        call,
+    ) -> LLMResponse:
+        """
+        Run a provider call under admission control, retrying retryable failures.
+
+        Only timeouts, connection errors, 408/429 and 5xx responses are
+        retried. The delay is the provider's Retry-After (header or Gemini
+        RetryInfo) when given, otherwise jittered exponential backoff. A 429
+        also pauses admission for the model, so queued requests wait out the
+        limit instead of each hitting it.
+
+        Raises:
+            LLMCapacityError: If the request cannot be admitted before LLM_QUEUE_TIMEOUT
+        """
+        limiter = self._get_limiter(provider, model_id)
+        max_attempts = max(1, (
+            settings.gemini_max_retries if provider == LLMProvider.GEMINI
+            else settings.azure_openai_max_retries
+        ))
+        estimated_tokens = len(prompt) / 4  # ~4 characters per token
+
+        for attempt in range(max_attempts):
+            admitted = False
+            try:
+                async with limiter.admit(estimated_tokens):
+                    admitted = True
+                    try:
+                        response = await call()
+                    except Exception as e:
+                        delay, retry_after = self._retry_delay(e, attempt)
+                        if delay is None or attempt == max_attempts - 1:
+                            raise
+                        if retry_after is not None:
+                            limiter.pause(delay)
+                        limiter.retries += 1
+                        logger.warning(
+                            f"{limiter.name} attempt {attempt + 1}/{max_attempts} failed ({e}); "
+                            f"retrying in {delay:.1f}s"
+                        )
+                    else:
+                        limiter.record_usage(
+                            estimated_tokens,
+                            response.usage.get("input_tokens", 0) + response.usage.get("output_tokens", 0),
+                        )
+                        return response
+            except TimeoutError as e:
+                if admitted:
+                    raise  # the provider call timed out, not admission
+                raise LLMCapacityError(f"LLM request not admitted in time: {e}") from e
+            await asyncio.sleep(delay)
+
+    def _retry_delay(self, error: Exception, attempt: int) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Decide whether and when to retry a failed call.
+
+        Returns:
+            (delay seconds or None if not retryable, provider retry-after or None)
+        """
+        # openai errors carry the HTTP status in status_code (their .code is a string);
+        # google-genai APIError carries it as an integer .code
+        status = getattr(error, "status_code", None)
+        if status is None:
+            code = getattr(error, "code", None)
+            status = code if isinstance(code, int) else None
+        transient = isinstance(error, (
+            asyncio.TimeoutError,
+            httpx.TimeoutException,
+            httpx.TransportError,
+            openai.APITimeoutError,
+            openai.APIConnectionError,
+        ))
+        if not transient and status not in self.RETRYABLE_STATUS_CODES:
+            return None, None
+
+        retry_after = _retry_after_seconds(error)
+        if retry_after is not None:
+            return min(retry_after, settings.llm_max_retry_after), retry_after
+        backoff = min(30.0, 2.0 * 2 ** attempt)
+        return backoff * random.uniform(0.5, 1.0), None
+
     async def _call_gemini(
         self,
         prompt: str,
@@ -123,57 +303,100 @@ class LLMService:
         temperature: float,
         response_format: Optional[str] = None,
     ) -> LLMResponse:
-        """Call Gemini API with retry logic."""
-        import time
+        """Call Gemini API."""
         start_time = time.time()
 
         # Resolve model name
         model_id = self.GEMINI_MODELS.get(model, model)
 
-        # Configure generation
-        generation_config = genai.GenerationConfig(
-            max_output_tokens=max_tokens,
-            temperature=temperature,
-        )
-
-        # Create model instance
-        gemini_model = genai.GenerativeModel(
-            model_name=model_id,
-            generation_config=generation_config,
-        )
-
-        # Generate response
-        response = await asyncio.to_thread(
-            gemini_model.generate_content,
-            prompt
+        # Generate response on the native async client (no worker thread per call)
+        client = await self._get_gemini_client()
+        response = await client.aio.models.generate_content(
+            model=model_id,
+            contents=prompt,
+            config=self._get_gemini_config(model_id, max_tokens, temperature),
         )
 
         latency_ms = (time.time() - start_time) * 1000
 
         # Extract usage if available
         usage = {}
-        if hasattr(response, 'usage_metadata'):
+        if getattr(response, 'usage_metadata', None) is not None:
             usage = {
-                "input_tokens": getattr(response.usage_metadata, 'prompt_token_count', 0),
-                "output_tokens": getattr(response.usage_metadata, 'candidates_token_count', 0),
+                "input_tokens": getattr(response.usage_metadata, 'prompt_token_count', 0) or 0,
+                "output_tokens": getattr(response.usage_metadata, 'candidates_token_count', 0) or 0,
             }
             self.total_input_tokens += usage.get("input_tokens", 0)
             self.total_output_tokens += usage.get("output_tokens", 0)
 
         return LLMResponse(
-            content=response.text,
+            content=response.text or "",
             model=model_id,
             provider=LLMProvider.GEMINI,
             usage=usage,
             latency_ms=latency_ms,
         )
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type((Exception,)),
-        reraise=True
-    )
+    async def _get_gemini_client(self) -> google_genai.Client:
+        """
+        Get the async Gemini client for the running event loop.
+
+        Requests share one explicitly sized httpx connection pool, so
+        concurrency is bounded by GEMINI_MAX_CONNECTIONS rather than by the
+        default thread pool. httpx pools are bound to the loop they were used
+        on, so if the loop changes (e.g. in scripts that call asyncio.run
+        repeatedly) the old pool is closed and a new client is made.
+        """
+        loop = asyncio.get_running_loop()
+        if self._gemini_client is None or self._gemini_client_loop is not loop:
+            stale_http_client = self._gemini_http_client
+            self._gemini_http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.gemini_max_connections,
+                    max_keepalive_connections=settings.gemini_max_connections,
+                ),
+                timeout=httpx.Timeout(settings.gemini_timeout, connect=10.0),
+            )
+            self._gemini_client = google_genai.Client(
+                api_key=self.gemini_api_key,
+                http_options=genai_types.HttpOptions(
+                    httpx_async_client=self._gemini_http_client,
+                ),
+            )
+            self._gemini_client_loop = loop
+            # Swapped in before awaiting, so concurrent callers reuse the new client
+            if stale_http_client is not None:
+                try:
+                    await stale_http_client.aclose()
+                except Exception as e:  # its connections may belong to a closed loop
+                    logger.debug(f"Error closing stale Gemini connection pool: {e}")
+        return self._gemini_client
+
+    def _get_gemini_config(
+        self,
+        model_id: str,
+        max_tokens: int,
+        temperature: float,
+    ) -> genai_types.GenerateContentConfig:
+        """Get the cached generation config for a model and parameters."""
+        key = (model_id, max_tokens, temperature)
+        config = self._gemini_configs.get(key)
+        if config is None:
+            config = genai_types.GenerateContentConfig(
+                max_output_tokens=max_tokens,
+                temperature=temperature,
+            )
+            self._gemini_configs[key] = config
+        return config
+
+    async def aclose(self) -> None:
+        """Close the Gemini connection pool."""
+        if self._gemini_http_client is not None:
+            await self._gemini_http_client.aclose()
+            self._gemini_http_client = None
+            self._gemini_client = None
+            self._gemini_client_loop = None
+
     async def _call_azure(
         self,
         prompt: str,
@@ -181,8 +404,7 @@ class LLMService:
         temperature: float,
         response_format: Optional[str] = None,
     ) -> LLMResponse:
-        """Call Azure OpenAI API with retry logic."""
-        import time
+        """Call Azure OpenAI API."""
         start_time = time.time()
 
         if not self.azure_client:
@@ -217,6 +439,59 @@ class LLMService:
             latency_ms=latency_ms,
         )
 
+    async def _stream_gemini(
+        self,
+        prompt: str,
+        model_id: str,
+        max_tokens: int,
+        temperature: float,
+    ) -> AsyncIterator[Tuple[str, Dict[str, int]]]:
+        """Stream a Gemini completion as (text, usage) pairs; usage is cumulative and may be empty."""
+        client = await self._get_gemini_client()
+        stream = await client.aio.models.generate_content_stream(
+            model=model_id,
+            contents=prompt,
+            config=self._get_gemini_config(model_id, max_tokens, temperature),
+        )
+        async with aclosing(stream):
+            async for chunk in stream:
+                usage = {}
+                if getattr(chunk, 'usage_metadata', None) is not None:
+                    usage = {
+                        "input_tokens": getattr(chunk.usage_metadata, 'prompt_token_count', 0) or 0,
+                        "output_tokens": getattr(chunk.usage_metadata, 'candidates_token_count', 0) or 0,
+                    }
+                yield chunk.text or "", usage
+
+    async def _stream_azure(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+    ) -> AsyncIterator[Tuple[str, Dict[str, int]]]:
+        """Stream an Azure OpenAI completion as (text, usage) pairs; usage arrives on the last chunk."""
+        if not self.azure_client:
+            raise ValueError("Azure OpenAI client not configured")
+
+        stream = await self.azure_client.chat.completions.create(
+            model=settings.azure_openai_deployment,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        async with stream:
+            async for chunk in stream:
+                usage = {}
+                if chunk.usage:
+                    usage = {
+                        "input_tokens": chunk.usage.prompt_tokens,
+                        "output_tokens": chunk.usage.completion_tokens,
+                    }
+                text = chunk.choices[0].delta.content if chunk.choices else None
+                yield text or "", usage
+
     async def generate(
         self,
         prompt: str,
@@ -224,16 +499,24 @@ class LLMService:
         max_tokens: Optional[int] = None,
         temperature: float = 0.1,
         response_format: Optional[str] = None,
+        use_cache: bool = True,
     ) -> str:
         """
         Generate response from specified model.
 
+        Calls at or below LLM_CACHE_MAX_TEMPERATURE are served from the
+        response cache when the same request was answered before. Identical
+        requests made while one is in flight wait for it instead of issuing
+        another provider call.
+
         Args:
             prompt: The prompt to send to the LLM
             model: Model identifier (gemini-3-pro-preview, gpt-5-mini, etc.)
             max_tokens: Maximum output tokens (uses model default if None)
             temperature: Sampling temperature (0.0-1.0)
             response_format: Optional format hint ("json" for JSON output)
+            use_cache: Set False to bypass the response cache (no read, no write)
+                and in-flight coalescing, forcing a fresh provider call
 
         Returns:
             Generated text response
@@ -243,7 +526,46 @@ class LLMService:
         if max_tokens is None:
             max_tokens = self._get_max_tokens(model)
 
-        # Check if we have valid credentials for the provider
+        self._check_credentials(provider)
+
+        request_key = (
+            self._request_key(prompt, model, max_tokens, temperature, response_format)
+            if use_cache else None
+        )
+        cacheable = (
+            self.response_cache is not None
+            and temperature <= settings.llm_cache_max_temperature
+        )
+        cache_key = request_key if cacheable else None
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"LLM response cache hit for {model}")
+                return cached.content
+
+        if request_key is None:
+            return await self._dispatch(
+                prompt, model, provider, max_tokens, temperature, response_format, cache_key
+            )
+
+        # Single flight: identical concurrent requests share one provider call.
+        # The call runs as its own task so a cancelled caller does not cancel it
+        # for the others.
+        loop = asyncio.get_running_loop()
+        task = self._in_flight.get(request_key)
+        if task is not None and task.get_loop() is loop:
+            self.coalesced_requests += 1
+            logger.debug(f"Joining in-flight {model} request")
+        else:
+            task = loop.create_task(self._dispatch(
+                prompt, model, provider, max_tokens, temperature, response_format, cache_key
+            ))
+            self._in_flight[request_key] = task
+            task.add_done_callback(lambda done: self._finish_in_flight(request_key, done))
+        return await asyncio.shield(task)
+
+    def _check_credentials(self, provider: LLMProvider) -> None:
+        """Raise LLMServiceError if the provider has no valid credentials."""
         if provider == LLMProvider.GEMINI and not self.gemini_api_key:
             logger.error("Gemini API key not configured")
             raise LLMServiceError(
@@ -257,15 +579,40 @@ class LLMService:
                 "Set AZURE_OPENAI_API_KEY, AZURE_OPENAI_ENDPOINT environment variables."
             )
 
+    def _finish_in_flight(self, request_key: str, task: "asyncio.Task[str]") -> None:
+        """Forget a finished shared call (and mark its error as retrieved)."""
+        if self._in_flight.get(request_key) is task:
+            del self._in_flight[request_key]
+        if not task.cancelled():
+            task.exception()  # avoid "never retrieved" warnings when every caller was cancelled
+
+    async def _dispatch(
+        self,
+        prompt: str,
+        model: str,
+        provider: LLMProvider,
+        max_tokens: int,
+        temperature: float,
+        response_format: Optional[str],
+        cache_key: Optional[str],
+    ) -> str:
+        """Call the provider and store the response in the cache."""
         logger.debug(f"Calling {provider.value} model {model} with {len(prompt)} chars")
+        self.provider_calls += 1
 
         if provider == LLMProvider.GEMINI:
-            response = await self._call_gemini(
-                prompt, model, max_tokens, temperature, response_format
+            response = await self._call_with_admission(
+                provider,
+                self.GEMINI_MODELS.get(model, model),
+                prompt,
+                lambda: self._call_gemini(prompt, model, max_tokens, temperature, response_format),
             )
         elif provider == LLMProvider.AZURE_OPENAI:
-            response = await self._call_azure(
-                prompt, max_tokens, temperature, response_format
+            response = await self._call_with_admission(
+                provider,
+                settings.azure_openai_deployment,
+                prompt,
+                lambda: self._call_azure(prompt, max_tokens, temperature, response_format),
             )
         else:
             raise ValueError(f"Unknown provider: {provider}")
@@ -275,14 +622,139 @@ class LLMService:
             f"{response.latency_ms:.0f}ms"
         )
 
+        if cache_key is not None and response.content:
+            self.response_cache.put(
+                cache_key,
+                response.content,
+                model=response.model,
+                provider=response.provider.value,
+                output_tokens=response.usage.get("output_tokens", 0),
+            )
+
         return response.content
 
+    async def generate_stream(
+        self,
+        prompt: str,
+        model: str = "gemini-3-pro-preview",
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.1,
+        use_cache: bool = True,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response from the specified model as text chunks.
+
+        The call goes through the same admission control as ``generate`` and
+        holds its slot until the stream ends or the caller stops iterating.
+        Failures before the first chunk are retried like ``generate``; once
+        text has been yielded an error is raised to the caller, since partial
+        output cannot be taken back. A cached response is yielded as a single
+        chunk and a completed stream is written to the cache.
+
+        Args:
+            prompt: The prompt to send to the LLM
+            model: Model identifier (gemini-3-pro-preview, gpt-5-mini, etc.)
+            max_tokens: Maximum output tokens (uses model default if None)
+            temperature: Sampling temperature (0.0-1.0)
+            use_cache: Set False to bypass the response cache
+
+        Yields:
+            Text chunks in order; joined, they are the full response
+        """
+        provider = self._get_provider(model)
+
+        if max_tokens is None:
+            max_tokens = self._get_max_tokens(model)
+
+        self._check_credentials(provider)
+
+        cache_key = (
+            self._cache_key(prompt, model, max_tokens, temperature, None)
+            if use_cache else None
+        )
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"LLM response cache hit for {model}")
+                yield cached.content
+                return
+
+        if provider == LLMProvider.GEMINI:
+            model_id = self.GEMINI_MODELS.get(model, model)
+            open_stream = lambda: self._stream_gemini(prompt, model_id, max_tokens, temperature)
+            max_attempts = max(1, settings.gemini_max_retries)
+        else:
+            model_id = settings.azure_openai_deployment
+            open_stream = lambda: self._stream_azure(prompt, max_tokens, temperature)
+            max_attempts = max(1, settings.azure_openai_max_retries)
+
+        logger.debug(f"Streaming {provider.value} model {model} with {len(prompt)} chars")
+        self.provider_calls += 1
+        limiter = self._get_limiter(provider, model_id)
+        estimated_tokens = len(prompt) / 4  # ~4 characters per token
+        start_time = time.time()
+
+        for attempt in range(max_attempts):
+            parts: List[str] = []
+            usage: Dict[str, int] = {}
+            admitted = False
+            try:
+                async with limiter.admit(estimated_tokens):
+                    admitted = True
+                    try:
+                        async with aclosing(open_stream()) as chunks:
+                            async for text, chunk_usage in chunks:
+                                usage = chunk_usage or usage
+                                if text:
+                                    parts.append(text)
+                                    yield text
+                    except Exception as e:
+                        delay, retry_after = self._retry_delay(e, attempt)
+                        if parts or delay is None or attempt == max_attempts - 1:
+                            raise
+                        if retry_after is not None:
+                            limiter.pause(delay)
+                        limiter.retries += 1
+                        logger.warning(
+                            f"{limiter.name} stream attempt {attempt + 1}/{max_attempts} failed ({e}); "
+                            f"retrying in {delay:.1f}s"
+                        )
+                    else:
+                        limiter.record_usage(
+                            estimated_tokens,
+                            usage.get("input_tokens", 0) + usage.get("output_tokens", 0),
+                        )
+                        break
+            except TimeoutError as e:
+                if admitted:
+                    raise
+                raise LLMCapacityError(f"LLM request not admitted in time: {e}") from e
+            await asyncio.sleep(delay)
+
+        self.total_input_tokens += usage.get("input_tokens", 0)
+        self.total_output_tokens += usage.get("output_tokens", 0)
+        logger.debug(
+            f"LLM stream: {usage.get('output_tokens', 0)} tokens, "
+            f"{(time.time() - start_time) * 1000:.0f}ms"
+        )
+
+        content = "".join(parts)
+        if cache_key is not None and content:
+            self.response_cache.put(
+                cache_key,
+                content,
+                model=model_id,
+                provider=provider.value,
+                output_tokens=usage.get("output_tokens", 0),
+            )
+
     async def generate_json(
         self,
         prompt: str,
         model: str = "gemini-3-pro-preview",
         max_tokens: Optional[int] = None,
         temperature: float = 0.0,
+        use_cache: bool = True,
     ) -> Dict[str, Any]:
         """
         Generate JSON response from LLM.
@@ -292,6 +764,7 @@ class LLMService:
             model: Model identifier
             max_tokens: Maximum output tokens
             temperature: Sampling temperature
+            use_cache: Set False to bypass the response cache
 
         Returns:
             Parsed JSON dictionary
@@ -302,6 +775,7 @@ class LLMService:
             max_tokens=max_tokens,
             temperature=temperature,
             response_format="json",
+            use_cache=use_cache,
         )
 
         # Try to parse JSON from response
@@ -318,6 +792,10 @@ class LLMService:
 
             return json.loads(response)
         except json.JSONDecodeError as e:
+            # Don't keep serving an unparseable response from the cache
+            cache_key = self._cache_key(prompt, model, max_tokens, temperature, "json")
+            if cache_key is not None:
+                self.response_cache.invalidate(cache_key)
             logger.error(f"Failed to parse JSON response: {e}")
             logger.debug(f"Response was: {response[:500]}...")
             raise ValueError(f"LLM response was not valid JSON: {e}")
@@ -368,17 +846,62 @@ class LLMService:
         return valid_responses[0], confidence
 
     def get_usage_stats(self) -> Dict[str, int]:
-        """Get cumulative token usage statistics."""
+        """Get cumulative token usage and request deduplication statistics."""
         return {
             "total_input_tokens": self.total_input_tokens,
             "total_output_tokens": self.total_output_tokens,
             "total_tokens": self.total_input_tokens + self.total_output_tokens,
+            "provider_calls": self.provider_calls,
+            "coalesced_requests": self.coalesced_requests,
+            "in_flight_requests": len(self._in_flight),
         }
 
+    def get_limiter_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get queue depth, wait times and throttling per provider and model."""
+        return {limiter.name: limiter.get_stats() for limiter in self._limiters.values()}
+
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Get response cache counters, or None if caching is off."""
+        return self.response_cache.get_stats() if self.response_cache is not None else None
+
     def reset_usage_stats(self):
         """Reset token usage counters."""
         self.total_input_tokens = 0
         self.total_output_tokens = 0
+        self.provider_calls = 0
+        self.coalesced_requests = 0
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Provider-requested retry delay from Retry-After headers or Gemini RetryInfo."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is not None:
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms:
+            try:
+                return float(retry_after_ms) / 1000
+            except ValueError:
+                pass
+        retry_after = headers.get("retry-after")
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+            try:
+                when = email.utils.parsedate_to_datetime(retry_after)
+                return max(0.0, when.timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+
+    # Gemini puts it in the error body: {"@type": ".../google.rpc.RetryInfo", "retryDelay": "27s"}
+    details = getattr(error, "details", None)
+    if details:
+        match = re.search(r"""["']retryDelay["']:\s*["']([\d.]+)s["']""", str(details))
+        if match:
+            return float(match.group(1))
+    return None
 
 
 # Singleton instance
@@ -391,3 +914,9 @@ def get_llm_service() -> LLMService:
     if _llm_service is None:
         _llm_service = LLMService()
     return _llm_service
+
+
+async def shutdown_llm_service() -> None:
+    """Close the singleton LLM service's connection pool, if it was created."""
+    if _llm_service is not None:
+        await _llm_service.aclose()
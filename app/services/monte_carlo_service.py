@@ -6,17 +6,102 @@ Uses literature-derived hazard ratios with uncertainty to simulate revision rate
 """
 import logging
 import math
+import os
 import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 import numpy as np
 
+from app.config import settings
 from data.loaders.yaml_loader import get_hybrid_loader
 
 logger = logging.getLogger(__name__)
 
 
+def _python_rng_as_numpy() -> np.random.RandomState:
+    """
+    Mirror the global ``random`` module state into a NumPy RandomState.
+
+    Both use MT19937 and the same 53-bit double construction, so
+    ``random_sample`` yields exactly the draws ``random.random()`` would.
+    """
+    _, internal_state, _ = random.getstate()
+    rng = np.random.RandomState()
+    rng.set_state((
+        "MT19937",
+        np.array(internal_state[:-1], dtype=np.uint32),
+        internal_state[-1],
+    ))
+    return rng
+
+
+def _sync_python_rng(rng: np.random.RandomState) -> None:
+    """Write a mirrored RandomState back into the global ``random`` module."""
+    version, _, gauss_next = random.getstate()
+    _, keys, pos = rng.get_state()[:3]
+    random.setstate((
+        version,
+        tuple(int(key) for key in keys) + (int(pos),),
+        gauss_next,
+    ))
+
+
+def _wilson_interval(successes: int, n: int, z: float) -> Tuple[float, float]:
+    """Wilson score interval for a binomial proportion."""
+    if n == 0:
+        return 0.0, 1.0
+    p = successes / n
+    denominator = 1 + z ** 2 / n
+    center = (p + z ** 2 / (2 * n)) / denominator
+    half_width = z * math.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / denominator
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+
+def _simulate_block(
+    factor_matrix: np.ndarray,
+    hr_columns: List[int],
+    log_means: np.ndarray,
+    log_stds: np.ndarray,
+    baseline_beta: Tuple[float, float],
+    n_iterations: int,
+    seed_sequence: np.random.SeedSequence,
+    block_cell_budget: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Simulate one iteration block from its own random stream.
+
+    Module-level so it can be shipped to worker processes. All draws come from
+    a Generator seeded by ``seed_sequence``, so the block's output depends only
+    on its position in the spawn order, never on which worker ran it.
+
+    Returns:
+        Tuple of (revision counts, baseline samples, iteration x factor HR samples)
+    """
+    rng = np.random.default_rng(seed_sequence)
+    baseline_samples = rng.beta(baseline_beta[0], baseline_beta[1], size=n_iterations)
+    hr_samples = rng.lognormal(log_means, log_stds, size=(n_iterations, len(log_means)))
+
+    n_patients = factor_matrix.shape[0]
+    n_revisions = np.zeros(n_iterations, dtype=np.int64)
+    if n_patients == 0:
+        return n_revisions, baseline_samples, hr_samples
+
+    chunk_size = max(1, block_cell_budget // n_patients)
+    for start in range(0, n_iterations, chunk_size):
+        stop = min(start + chunk_size, n_iterations)
+        risks = MonteCarloService._cohort_risks(
+            factor_matrix,
+            baseline_samples[start:stop],
+            hr_samples[start:stop][:, hr_columns],
+        )
+        draws = rng.random(risks.shape)
+        n_revisions[start:stop] = np.count_nonzero(draws < risks, axis=1)
+
+    return n_revisions, baseline_samples, hr_samples
+
+
 @dataclass
 class HazardRatioSpec:
     """Specification for a hazard ratio with uncertainty."""
@@ -88,6 +173,86 @@ class SimulationResult:
     passes_threshold: bool
 
 
+@dataclass
+class RevisionRateSketch:
+    """
+    Mergeable quantile sketch of cohort revision rates.
+
+    A cohort rate is always k / n_patients, so counting iterations per
+    revision count k summarises any number of iterations in n_patients + 1
+    integers, with exact quantiles. Sketches from different blocks, batches
+    or workers merge by adding counts.
+    """
+    n_patients: int
+    counts: np.ndarray  # counts[k] = iterations with k revisions
+
+    @classmethod
+    def from_rates(cls, rates: np.ndarray, n_patients: int) -> "RevisionRateSketch":
+        """Build a sketch from per-iteration cohort rates."""
+        n_revisions = np.rint(np.asarray(rates) * n_patients).astype(np.int64)
+        return cls(n_patients, np.bincount(n_revisions, minlength=n_patients + 1))
+
+    def merge(self, other: "RevisionRateSketch") -> "RevisionRateSketch":
+        """Combine two sketches of the same cohort size."""
+        if other.n_patients != self.n_patients:
+            raise ValueError("Cannot merge sketches for different cohort sizes")
+        return RevisionRateSketch(self.n_patients, self.counts + other.counts)
+
+    @property
+    def n_iterations(self) -> int:
+        return int(self.counts.sum())
+
+    @property
+    def values(self) -> np.ndarray:
+        """Cohort rate represented by each count bucket."""
+        return np.arange(self.n_patients + 1) / max(self.n_patients, 1)
+
+    def mean(self) -> float:
+        return float(np.dot(self.counts, self.values) / self.n_iterations)
+
+    def std(self) -> float:
+        deviations = self.values - self.mean()
+        return float(math.sqrt(np.dot(self.counts, deviations ** 2) / self.n_iterations))
+
+    def fraction_at_or_below(self, rate: float) -> float:
+        """Share of iterations with cohort rate <= ``rate``."""
+        return int(self.counts[self.values <= rate].sum()) / self.n_iterations
+
+    def percentile(self, q: float) -> float:
+        """Percentile with ``np.percentile``'s default linear interpolation."""
+        n = self.n_iterations
+        position = (q / 100) * (n - 1)
+        lower = math.floor(position)
+        t = position - lower
+        cumulative = np.cumsum(self.counts)
+        values = self.values
+        a = values[np.searchsorted(cumulative, lower, side="right")]
+        b = values[np.searchsorted(cumulative, min(lower + 1, n - 1), side="right")]
+        if a == b:
+            return float(a)
+        return float(b - (b - a) * (1 - t) if t >= 0.5 else a + (b - a) * t)
+
+    def histogram(self, n_bins: int, max_rate: float) -> Dict[str, Any]:
+        """Fixed-bin histogram over [0, max_rate]; higher rates land in the last bin."""
+        edges = np.linspace(0.0, max_rate, n_bins + 1)
+        counts, _ = np.histogram(
+            np.minimum(self.values, max_rate), bins=edges, weights=self.counts
+        )
+        return {
+            "bin_width": max_rate / n_bins,
+            "range": [0.0, max_rate],
+            "counts": counts.astype(np.int64).tolist(),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Sparse representation: revision count -> iterations."""
+        nonzero = np.flatnonzero(self.counts)
+        return {
+            "n_patients": self.n_patients,
+            "counts": {int(k): int(self.counts[k]) for k in nonzero},
+        }
+
+
 @dataclass
 class MonteCarloSummary:
     """Summary statistics from Monte Carlo simulation."""
@@ -110,8 +275,41 @@ class MonteCarloSummary:
     # Variance decomposition (sensitivity analysis)
     variance_contributions: Dict[str, float]
 
-    # Raw data for visualization
-    revision_rates: List[float]
+    # Outcome distribution for visualization: fixed-bin histogram of cohort
+    # rates and the mergeable sketch the statistics above were computed from
+    histogram: Dict[str, Any]
+    rate_sketch: RevisionRateSketch
+
+    # Raw per-iteration rates, only kept when explicitly requested
+    revision_rates: Optional[List[float]]
+
+    # Execution metadata
+    execution_time_ms: float
+    generated_at: str
+
+    # Adaptive run convergence (None for fixed-iteration runs)
+    max_iterations: Optional[int] = None
+    stop_reason: Optional[str] = None  # "precision_reached", "verdict_determined", "max_iterations"
+    probability_pass_ci_half_width: Optional[float] = None
+    mean_revision_rate_ci_half_width: Optional[float] = None
+
+
+@dataclass
+class SobolSensitivity:
+    """Variance-based (Sobol) sensitivity of the cohort revision rate."""
+    n_patients: int
+    n_base_samples: int
+    n_model_evaluations: int
+    output_mean: float
+    output_variance: float
+
+    # Factor -> index; first-order = main effect, total = main + interactions
+    first_order: Dict[str, float]
+    total_order: Dict[str, float]
+
+    # Factor -> bootstrap CI half-width
+    first_order_ci: Dict[str, float]
+    total_order_ci: Dict[str, float]
 
     # Execution metadata
     execution_time_ms: float
@@ -126,6 +324,7 @@ class ScenarioComparison:
     summary: MonteCarloSummary
     delta_probability: Optional[float] = None  # vs baseline
     delta_mean_rate: Optional[float] = None
+    delta_mean_rate_se: Optional[float] = None  # standard error of delta_mean_rate
 
 
 class MonteCarloService:
@@ -151,10 +350,51 @@ class MonteCarloService:
     DEFAULT_BASELINE_RATE = 0.052  # 5.2% from NJR/AOANJRR
     BASELINE_RATE_CI = (0.048, 0.056)  # Confidence interval
 
+    # Default risk factor prevalence based on registry data for revision THA
+    # Calibrated to produce mean revision rates consistent with NJR/AOANJRR (~5-8%)
+    DEFAULT_PREVALENCE = {
+        "age_over_80": 0.08,      # ~8% of revision THA patients are ≥80 (NJR 2024)
+        "bmi_over_35": 0.12,      # ~12% have BMI ≥35 (AOANJRR)
+        "diabetes": 0.15,         # ~15% have diabetes
+        "osteoporosis": 0.12,     # ~12% have osteoporosis
+        "rheumatoid_arthritis": 0.04,  # ~4% have RA
+        "chronic_kidney_disease": 0.06,  # ~6% have CKD
+        "smoking": 0.08,          # ~8% current smokers
+        "prior_revision": 0.10,   # ~10% have had prior revision (re-revision)
+        "severe_bone_loss": 0.15, # ~15% have severe bone loss (Paprosky 3)
+        "paprosky_3b": 0.06,      # ~6% have Paprosky 3B specifically
+    }
+
+    # Beta(52, 948) approximates the 5.2% baseline with CI (4.8%, 5.6%)
+    BASELINE_BETA = (52, 948)
+
+    # Simulation engines: "vectorized" (NumPy blocks), "parallel" (process pool
+    # with per-block Generators) or "loop" (per-patient reference)
+    ENGINES = ("vectorized", "parallel", "loop")
+
+    # compare_scenarios additionally accepts "crn": one shared pass with
+    # common random numbers across all scenarios
+    COMPARISON_ENGINES = ENGINES + ("crn",)
+
+    # Iteration x patient cells evaluated per vectorized block (bounds peak memory)
+    BLOCK_CELL_BUDGET = 2_000_000
+
+    # Iterations per independently seeded block in the parallel engine.
+    # Fixed so results do not depend on the worker count.
+    PARALLEL_BLOCK_ITERATIONS = 1000
+
+    # probability_pass cut-offs between "at_risk" / "uncertain" / "high_confidence"
+    VERDICT_BOUNDARIES = (0.50, 0.80)
+
+    # Fixed histogram layout for the cohort rate distribution
+    HISTOGRAM_BINS = 100
+    HISTOGRAM_MAX_RATE = 0.50
+
     def __init__(self):
         """Initialize Monte Carlo service with hazard ratios from literature."""
         self._doc_loader = get_hybrid_loader()
         self._hazard_ratio_specs = self._load_hazard_ratios()
+        self._process_pool: Optional[ProcessPoolExecutor] = None
 
     def _load_hazard_ratios(self) -> Dict[str, HazardRatioSpec]:
         """Load hazard ratio specifications from literature_benchmarks.yaml."""
@@ -206,9 +446,7 @@ class MonteCarloService:
     def _sample_baseline_rate(self) -> float:
         """Sample baseline revision rate from Beta distribution."""
         # Use Beta distribution with parameters derived from registry data
-        # For 5.2% rate with CI (4.8%, 5.6%), approximate with Beta(52, 948)
-        alpha = 52
-        beta = 948
+        alpha, beta = self.BASELINE_BETA
         return np.random.beta(alpha, beta)
 
     def _sample_all_hazard_ratios(self) -> Dict[str, float]:
@@ -221,7 +459,8 @@ class MonteCarloService:
     def generate_synthetic_cohort(
         self,
         n_patients: int,
-        risk_distribution: Optional[Dict[str, float]] = None
+        risk_distribution: Optional[Dict[str, float]] = None,
+        seed: Optional[int] = None
     ) -> List[PatientRiskProfile]:
         """
         Generate a synthetic patient cohort with risk factor distribution.
@@ -230,31 +469,19 @@ class MonteCarloService:
             n_patients: Number of patients in cohort
             risk_distribution: Optional dict of factor -> prevalence (0-1)
                              If None, uses realistic population prevalence
+            seed: Optional seed for a private RNG; if None, draws from the
+                  global ``random`` state
 
         Returns:
             List of PatientRiskProfile objects
         """
-        # Default risk factor prevalence based on registry data for revision THA
-        # Calibrated to produce mean revision rates consistent with NJR/AOANJRR (~5-8%)
-        default_prevalence = {
-            "age_over_80": 0.08,      # ~8% of revision THA patients are ≥80 (NJR 2024)
-            "bmi_over_35": 0.12,      # ~12% have BMI ≥35 (AOANJRR)
-            "diabetes": 0.15,         # ~15% have diabetes
-            "osteoporosis": 0.12,     # ~12% have osteoporosis
-            "rheumatoid_arthritis": 0.04,  # ~4% have RA
-            "chronic_kidney_disease": 0.06,  # ~6% have CKD
-            "smoking": 0.08,          # ~8% current smokers
-            "prior_revision": 0.10,   # ~10% have had prior revision (re-revision)
-            "severe_bone_loss": 0.15, # ~15% have severe bone loss (Paprosky 3)
-            "paprosky_3b": 0.06,      # ~6% have Paprosky 3B specifically
-        }
-
-        prevalence = risk_distribution or default_prevalence
+        prevalence = risk_distribution or self.DEFAULT_PREVALENCE
+        rng = random.Random(seed) if seed is not None else random
 
         patients = []
         for i in range(n_patients):
             risk_factors = {
-                factor: random.random() < prev
+                factor: rng.random() < prev
                 for factor, prev in prevalence.items()
             }
             patients.append(PatientRiskProfile(
@@ -269,16 +496,28 @@ class MonteCarloService:
         cohort: List[PatientRiskProfile],
         threshold_key: str = "fda_510k",
         n_iterations: int = 10000,
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        engine: str = "vectorized",
+        n_workers: Optional[int] = None,
+        keep_raw_rates: bool = False,
     ) -> MonteCarloSummary:
         """
         Run Monte Carlo simulation for cohort outcome projection.
 
+        The "vectorized" and "loop" engines consume the global
+        ``np.random``/``random`` streams in the same order, so a given seed
+        yields identical statistics from either. The "parallel" engine leaves
+        global state untouched and draws from ``SeedSequence``-spawned
+        Generators instead; its results are identical for any worker count.
+
         Args:
             cohort: List of patient risk profiles
             threshold_key: Regulatory threshold to evaluate against
             n_iterations: Number of Monte Carlo iterations
             seed: Optional random seed for reproducibility
+            engine: "vectorized" (default), "parallel" or "loop"
+            n_workers: Worker processes for the parallel engine (default and cap: MONTE_CARLO_MAX_WORKERS)
+            keep_raw_rates: Also return every per-iteration rate
 
         Returns:
             MonteCarloSummary with results
@@ -286,22 +525,225 @@ class MonteCarloService:
         import time
         start_time = time.time()
 
-        if seed is not None:
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown simulation engine: {engine}")
+
+        if seed is not None and engine != "parallel":
             np.random.seed(seed)
             random.seed(seed)
 
+        threshold_info = self.THRESHOLDS.get(threshold_key, self.THRESHOLDS["fda_510k"])
+
+        if engine == "parallel":
+            rates_array, baseline_samples, hr_samples = self._simulate_parallel(
+                cohort, n_iterations, seed, n_workers
+            )
+        elif engine == "loop":
+            rates_array, baseline_samples, hr_samples = self._simulate_loop(cohort, n_iterations)
+        else:
+            rates_array, baseline_samples, hr_samples = self._simulate_vectorized(cohort, n_iterations)
+
+        return self._build_summary(
+            len(cohort), threshold_info, rates_array, baseline_samples, hr_samples,
+            start_time, keep_raw_rates,
+        )
+
+    def run_adaptive_simulation(
+        self,
+        cohort: List[PatientRiskProfile],
+        threshold_key: str = "fda_510k",
+        max_iterations: int = 10000,
+        precision: float = 0.01,
+        rate_precision: float = 0.001,
+        batch_size: int = 1000,
+        min_iterations: int = 2000,
+        confidence: float = 0.95,
+        seed: Optional[int] = None,
+        keep_raw_rates: bool = False,
+    ) -> MonteCarloSummary:
+        """
+        Run Monte Carlo simulation in batches until the answer has converged.
+
+        After each batch a Wilson interval on probability_pass and a normal
+        interval on mean_revision_rate are updated. The run stops early when
+        both half-widths are within the requested precision, or when the
+        probability_pass interval no longer straddles a verdict boundary.
+        Batches draw from ``SeedSequence``-spawned Generators, as in the
+        parallel engine, so a given seed always stops at the same point.
+
+        Args:
+            cohort: List of patient risk profiles
+            threshold_key: Regulatory threshold to evaluate against
+            max_iterations: Upper bound on iterations
+            precision: Target CI half-width for probability_pass
+            rate_precision: Target CI half-width for mean_revision_rate
+            batch_size: Iterations per batch between convergence checks
+            min_iterations: Iterations to run before early stopping is allowed
+            confidence: Two-sided confidence level for the intervals
+            seed: Optional random seed for reproducibility
+            keep_raw_rates: Also return every per-iteration rate
+
+        Returns:
+            MonteCarloSummary with n_iterations set to the iterations used
+        """
+        import time
+        from statistics import NormalDist
+        start_time = time.time()
+
         threshold_info = self.THRESHOLDS.get(threshold_key, self.THRESHOLDS["fda_510k"])
         threshold_rate = threshold_info["rate"]
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
 
+        log_means = np.array([spec.log_mean for spec in self._hazard_ratio_specs.values()])
+        log_stds = np.array([spec.log_std for spec in self._hazard_ratio_specs.values()])
+        spec_factors = list(self._hazard_ratio_specs.keys())
+        cohort_factors, factor_matrix = self._cohort_matrix(cohort)
+        hr_columns = [spec_factors.index(factor) for factor in cohort_factors]
         n_patients = len(cohort)
-        revision_rates = []
+        seed_sequence = np.random.SeedSequence(seed)
+
+        rate_batches: List[np.ndarray] = []
+        baseline_batches: List[np.ndarray] = []
+        hr_batches: List[np.ndarray] = []
+        n_done = 0
         pass_count = 0
+        rate_sum = 0.0
+        rate_sq_sum = 0.0
+        stop_reason = "max_iterations"
+        pass_half_width = rate_half_width = float("nan")
+
+        while n_done < max_iterations:
+            size = min(batch_size, max_iterations - n_done)
+            n_revisions, baseline_samples, hr_samples = _simulate_block(
+                factor_matrix, hr_columns, log_means, log_stds, self.BASELINE_BETA,
+                size, seed_sequence.spawn(1)[0], self.BLOCK_CELL_BUDGET,
+            )
+            rates = n_revisions / n_patients if n_patients > 0 else np.zeros(size)
+            rate_batches.append(rates)
+            baseline_batches.append(baseline_samples)
+            hr_batches.append(hr_samples)
+
+            n_done += size
+            pass_count += int(np.count_nonzero(rates <= threshold_rate))
+            rate_sum += float(rates.sum())
+            rate_sq_sum += float(np.square(rates).sum())
+
+            pass_lower, pass_upper = _wilson_interval(pass_count, n_done, z)
+            pass_half_width = (pass_upper - pass_lower) / 2
+            rate_mean = rate_sum / n_done
+            rate_var = max(0.0, rate_sq_sum / n_done - rate_mean ** 2) * n_done / max(n_done - 1, 1)
+            rate_half_width = z * math.sqrt(rate_var / n_done)
+
+            if n_done < min_iterations:
+                continue
+            if pass_half_width <= precision and rate_half_width <= rate_precision:
+                stop_reason = "precision_reached"
+                break
+            if not any(pass_lower < boundary <= pass_upper for boundary in self.VERDICT_BOUNDARIES):
+                stop_reason = "verdict_determined"
+                break
+
+        logger.info(
+            f"Adaptive simulation stopped after {n_done}/{max_iterations} iterations "
+            f"({stop_reason})"
+        )
+
+        summary = self._build_summary(
+            n_patients,
+            threshold_info,
+            np.concatenate(rate_batches),
+            np.concatenate(baseline_batches),
+            np.concatenate(hr_batches).reshape(n_done, len(spec_factors)),
+            start_time,
+            keep_raw_rates,
+        )
+        summary.max_iterations = max_iterations
+        summary.stop_reason = stop_reason
+        summary.probability_pass_ci_half_width = pass_half_width
+        summary.mean_revision_rate_ci_half_width = rate_half_width
+        return summary
+
+    def _build_summary(
+        self,
+        n_patients: int,
+        threshold_info: Dict[str, Any],
+        rates_array: np.ndarray,
+        baseline_samples: np.ndarray,
+        hr_samples: np.ndarray,
+        start_time: float,
+        keep_raw_rates: bool = False
+    ) -> MonteCarloSummary:
+        """
+        Aggregate per-iteration engine output into a MonteCarloSummary.
+
+        Distribution statistics come from a RevisionRateSketch, so the summary
+        stays the same size however many iterations were run.
+        """
+        import time
 
-        # For variance decomposition
-        hr_samples_by_factor: Dict[str, List[float]] = {
-            factor: [] for factor in self._hazard_ratio_specs.keys()
+        threshold_rate = threshold_info["rate"]
+        n_iterations = len(rates_array)
+        sketch = RevisionRateSketch.from_rates(rates_array, n_patients)
+
+        # Calculate summary statistics
+        probability_pass = sketch.fraction_at_or_below(threshold_rate)
+
+        # Determine verdict
+        uncertain_from, high_confidence_from = self.VERDICT_BOUNDARIES
+        if probability_pass >= high_confidence_from:
+            verdict = "high_confidence"
+        elif probability_pass >= uncertain_from:
+            verdict = "uncertain"
+        else:
+            verdict = "at_risk"
+
+        # Variance decomposition using correlation with cohort rate
+        hr_samples_by_factor = {
+            factor: hr_samples[:, j]
+            for j, factor in enumerate(self._hazard_ratio_specs.keys())
         }
-        baseline_samples: List[float] = []
+        variance_contributions = self._calculate_variance_contributions(
+            rates_array, hr_samples_by_factor, baseline_samples
+        )
+
+        execution_time_ms = (time.time() - start_time) * 1000
+
+        return MonteCarloSummary(
+            n_iterations=n_iterations,
+            n_patients=n_patients,
+            threshold=threshold_rate,
+            threshold_name=threshold_info["label"],
+            mean_revision_rate=sketch.mean(),
+            median_revision_rate=sketch.percentile(50),
+            p5_revision_rate=sketch.percentile(5),
+            p95_revision_rate=sketch.percentile(95),
+            std_revision_rate=sketch.std(),
+            probability_pass=probability_pass,
+            verdict=verdict,
+            variance_contributions=variance_contributions,
+            histogram=sketch.histogram(self.HISTOGRAM_BINS, self.HISTOGRAM_MAX_RATE),
+            rate_sketch=sketch,
+            revision_rates=rates_array.tolist() if keep_raw_rates else None,
+            execution_time_ms=execution_time_ms,
+            generated_at=datetime.utcnow().isoformat(),
+        )
+
+    def _simulate_loop(
+        self,
+        cohort: List[PatientRiskProfile],
+        n_iterations: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Reference engine: one Python call per patient per iteration.
+
+        Returns:
+            Tuple of (cohort revision rates, baseline samples,
+            iteration x factor HR samples in ``_hazard_ratio_specs`` order)
+        """
+        n_patients = len(cohort)
+        revision_rates = []
+        baseline_samples = []
+        hr_rows = []
 
         for iteration in range(n_iterations):
             # Sample baseline rate
@@ -310,8 +752,7 @@ class MonteCarloService:
 
             # Sample all hazard ratios
             sampled_hrs = self._sample_all_hazard_ratios()
-            for factor, hr in sampled_hrs.items():
-                hr_samples_by_factor[factor].append(hr)
+            hr_rows.append(list(sampled_hrs.values()))
 
             # Calculate cohort outcome
             n_revisions = 0
@@ -324,51 +765,339 @@ class MonteCarloService:
             cohort_rate = n_revisions / n_patients if n_patients > 0 else 0
             revision_rates.append(cohort_rate)
 
-            if cohort_rate <= threshold_rate:
-                pass_count += 1
+        hr_samples = np.array(hr_rows, dtype=float).reshape(
+            n_iterations, len(self._hazard_ratio_specs)
+        )
+        return np.array(revision_rates, dtype=float), np.array(baseline_samples), hr_samples
 
-        # Calculate summary statistics
-        rates_array = np.array(revision_rates)
-        probability_pass = pass_count / n_iterations
+    def _simulate_vectorized(
+        self,
+        cohort: List[PatientRiskProfile],
+        n_iterations: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized engine: NumPy broadcasting over iteration blocks.
 
-        # Determine verdict
-        if probability_pass >= 0.80:
-            verdict = "high_confidence"
-        elif probability_pass >= 0.50:
-            verdict = "uncertain"
+        Parameters are drawn from ``np.random`` in the loop engine's order, and
+        patient outcomes from a mirror of the ``random`` module stream, so the
+        results match ``_simulate_loop`` draw for draw.
+
+        Returns:
+            Tuple of (cohort revision rates, baseline samples,
+            iteration x factor HR samples in ``_hazard_ratio_specs`` order)
+        """
+        spec_factors = list(self._hazard_ratio_specs.keys())
+        log_means = np.array([spec.log_mean for spec in self._hazard_ratio_specs.values()])
+        log_stds = np.array([spec.log_std for spec in self._hazard_ratio_specs.values()])
+
+        baseline_samples = np.empty(n_iterations)
+        hr_samples = np.empty((n_iterations, len(spec_factors)))
+        for iteration in range(n_iterations):
+            baseline_samples[iteration] = self._sample_baseline_rate()
+            hr_samples[iteration] = np.random.lognormal(log_means, log_stds)
+
+        n_patients = len(cohort)
+        if n_patients == 0:
+            return np.zeros(n_iterations), baseline_samples, hr_samples
+
+        cohort_factors, factor_matrix = self._cohort_matrix(cohort)
+        hr_columns = [spec_factors.index(factor) for factor in cohort_factors]
+
+        block_size = max(1, self.BLOCK_CELL_BUDGET // n_patients)
+        n_revisions = np.empty(n_iterations, dtype=np.int64)
+        rng = _python_rng_as_numpy()
+        for start in range(0, n_iterations, block_size):
+            stop = min(start + block_size, n_iterations)
+            risks = self._cohort_risks(
+                factor_matrix,
+                baseline_samples[start:stop],
+                hr_samples[start:stop][:, hr_columns],
+            )
+            draws = rng.random_sample(risks.shape)
+            n_revisions[start:stop] = np.count_nonzero(draws < risks, axis=1)
+        _sync_python_rng(rng)
+
+        return n_revisions / n_patients, baseline_samples, hr_samples
+
+    def _simulate_parallel(
+        self,
+        cohort: List[PatientRiskProfile],
+        n_iterations: int,
+        seed: Optional[int],
+        n_workers: Optional[int]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Parallel engine: fixed-size iteration blocks across a process pool.
+
+        Each block gets its own Generator spawned from ``SeedSequence(seed)``
+        and blocks are merged in spawn order, so output is identical whatever
+        ``n_workers`` is (including in-process execution with one worker).
+
+        Returns:
+            Tuple of (cohort revision rates, baseline samples,
+            iteration x factor HR samples in ``_hazard_ratio_specs`` order)
+        """
+        max_workers = self._max_workers()
+        n_workers = min(n_workers or max_workers, max_workers)
+        spec_factors = list(self._hazard_ratio_specs.keys())
+        log_means = np.array([spec.log_mean for spec in self._hazard_ratio_specs.values()])
+        log_stds = np.array([spec.log_std for spec in self._hazard_ratio_specs.values()])
+        cohort_factors, factor_matrix = self._cohort_matrix(cohort)
+        hr_columns = [spec_factors.index(factor) for factor in cohort_factors]
+
+        block_sizes = [
+            min(self.PARALLEL_BLOCK_ITERATIONS, n_iterations - start)
+            for start in range(0, n_iterations, self.PARALLEL_BLOCK_ITERATIONS)
+        ]
+        seed_sequences = np.random.SeedSequence(seed).spawn(len(block_sizes))
+        block_args = [
+            (factor_matrix, hr_columns, log_means, log_stds, self.BASELINE_BETA,
+             size, seed_sequence, self.BLOCK_CELL_BUDGET)
+            for size, seed_sequence in zip(block_sizes, seed_sequences)
+        ]
+
+        if n_workers == 1 or len(block_args) == 1:
+            blocks = [_simulate_block(*args) for args in block_args]
         else:
-            verdict = "at_risk"
+            blocks = self._run_blocks(block_args, n_workers)
 
-        # Variance decomposition using correlation with cohort rate
-        variance_contributions = self._calculate_variance_contributions(
-            revision_rates, hr_samples_by_factor, baseline_samples
+        n_revisions = np.concatenate([block[0] for block in blocks])
+        baseline_samples = np.concatenate([block[1] for block in blocks])
+        hr_samples = np.concatenate([block[2] for block in blocks]).reshape(
+            n_iterations, len(spec_factors)
         )
+        n_patients = len(cohort)
+        rates = n_revisions / n_patients if n_patients > 0 else np.zeros(n_iterations)
+        return rates, baseline_samples, hr_samples
 
-        execution_time_ms = (time.time() - start_time) * 1000
+    @staticmethod
+    def _max_workers() -> int:
+        """Process pool size: MONTE_CARLO_MAX_WORKERS, or the CPU count if unset."""
+        return settings.monte_carlo_max_workers or os.cpu_count() or 1
 
-        return MonteCarloSummary(
-            n_iterations=n_iterations,
-            n_patients=n_patients,
-            threshold=threshold_rate,
-            threshold_name=threshold_info["label"],
-            mean_revision_rate=float(np.mean(rates_array)),
-            median_revision_rate=float(np.median(rates_array)),
-            p5_revision_rate=float(np.percentile(rates_array, 5)),
-            p95_revision_rate=float(np.percentile(rates_array, 95)),
-            std_revision_rate=float(np.std(rates_array)),
-            probability_pass=probability_pass,
-            verdict=verdict,
-            variance_contributions=variance_contributions,
-            revision_rates=revision_rates,
-            execution_time_ms=execution_time_ms,
+    def _run_blocks(self, block_args: List[tuple], n_workers: int) -> List[tuple]:
+        """
+        Run iteration blocks on the shared pool with at most ``n_workers`` in flight.
+
+        The pool is sized once; requests asking for fewer workers just keep
+        fewer blocks pending. Results are returned in block order.
+        """
+        pool = self._get_process_pool()
+        futures = []
+        pending = set()
+        for args in block_args:
+            if len(pending) >= n_workers:
+                _, pending = wait(pending, return_when=FIRST_COMPLETED)
+            future = pool.submit(_simulate_block, *args)
+            futures.append(future)
+            pending.add(future)
+        return [future.result() for future in futures]
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Get the shared process pool, starting it on first use."""
+        if self._process_pool is None:
+            n_workers = self._max_workers()
+            self._process_pool = ProcessPoolExecutor(max_workers=n_workers)
+            logger.info(f"Started Monte Carlo process pool with {n_workers} workers")
+        return self._process_pool
+
+    def shutdown(self) -> None:
+        """Shut down the parallel engine's process pool, if running."""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=True)
+            self._process_pool = None
+
+    def _cohort_matrix(
+        self,
+        cohort: List[PatientRiskProfile]
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        Encode a cohort as a boolean patient x factor matrix.
+
+        Columns follow the cohort's own risk-factor order (the order in which
+        ``calculate_risk`` multiplies HRs) and are limited to factors with
+        hazard ratio specifications.
+
+        Returns:
+            Tuple of (factor names, bool array of shape (n_patients, n_factors))
+        """
+        factors: List[str] = []
+        for patient in cohort:
+            for factor in patient.risk_factors:
+                if factor in self._hazard_ratio_specs and factor not in factors:
+                    factors.append(factor)
+
+        matrix = np.array(
+            [[bool(patient.risk_factors.get(factor, False)) for factor in factors]
+             for patient in cohort],
+            dtype=bool,
+        ).reshape(len(cohort), len(factors))
+        return factors, matrix
+
+    @staticmethod
+    def _cohort_risks(
+        factor_matrix: np.ndarray,
+        baseline_rates: np.ndarray,
+        hazard_ratios: np.ndarray,
+        max_risk: float = 0.50
+    ) -> np.ndarray:
+        """
+        Patient revision probabilities for a block of iterations.
+
+        Vectorized ``PatientRiskProfile.calculate_risk``: HRs are multiplied in
+        column order so the products match the per-patient loop exactly.
+
+        Args:
+            factor_matrix: Bool array (n_patients, n_factors)
+            baseline_rates: Baseline revision probability per iteration (n_block,)
+            hazard_ratios: Sampled HRs aligned to matrix columns (n_block, n_factors)
+            max_risk: Cap on individual risk to prevent extremes
+
+        Returns:
+            Array (n_block, n_patients) of revision probabilities
+        """
+        combined_hr = np.ones((len(baseline_rates), factor_matrix.shape[0]))
+        for j in range(factor_matrix.shape[1]):
+            combined_hr *= np.where(factor_matrix[:, j], hazard_ratios[:, j:j + 1], 1.0)
+        return np.minimum(max_risk, combined_hr * baseline_rates[:, None])
+
+    def run_sensitivity_analysis(
+        self,
+        cohort: List[PatientRiskProfile],
+        n_samples: int = 4096,
+        n_bootstrap: int = 100,
+        confidence: float = 0.95,
+        seed: Optional[int] = None
+    ) -> SobolSensitivity:
+        """
+        Global sensitivity analysis of the cohort revision rate (Sobol indices).
+
+        Uses the Saltelli scheme: two independent input matrices A and B plus
+        one hybrid AB_i per input (A with column i taken from B), i.e.
+        (k + 2) * n_samples model evaluations for k uncertain inputs (baseline
+        rate and every hazard ratio). The model is the expected cohort revision
+        rate, evaluated with the vectorized risk core in memory-bounded blocks.
+        First-order indices use the Saltelli (2010) estimator and total indices
+        the Jansen estimator; CIs come from bootstrap resampling of rows.
+
+        Args:
+            cohort: List of patient risk profiles
+            n_samples: Base sample size N
+            n_bootstrap: Bootstrap resamples for confidence intervals
+            confidence: Two-sided confidence level for the intervals
+            seed: Optional random seed for reproducibility
+
+        Returns:
+            SobolSensitivity with first-order and total indices per input
+        """
+        import time
+        start_time = time.time()
+
+        rng = np.random.default_rng(seed)
+        input_names = ["baseline_rate"] + list(self._hazard_ratio_specs.keys())
+        spec_factors = input_names[1:]
+        cohort_factors, factor_matrix = self._cohort_matrix(cohort)
+        hr_columns = [spec_factors.index(factor) for factor in cohort_factors]
+
+        inputs_a = self._sample_model_inputs(rng, n_samples)
+        inputs_b = self._sample_model_inputs(rng, n_samples)
+        outputs_a = self._expected_cohort_rates(factor_matrix, hr_columns, inputs_a)
+        outputs_b = self._expected_cohort_rates(factor_matrix, hr_columns, inputs_b)
+        outputs_ab = np.empty((len(input_names), n_samples))
+        for i in range(len(input_names)):
+            inputs_ab = inputs_a.copy()
+            inputs_ab[:, i] = inputs_b[:, i]
+            outputs_ab[i] = self._expected_cohort_rates(factor_matrix, hr_columns, inputs_ab)
+
+        first_order, total_order = self._sobol_indices(outputs_a, outputs_b, outputs_ab)
+
+        # Bootstrap CIs (percentile half-widths)
+        first_boot = np.empty((n_bootstrap, len(input_names)))
+        total_boot = np.empty((n_bootstrap, len(input_names)))
+        for r in range(n_bootstrap):
+            rows = rng.integers(0, n_samples, size=n_samples)
+            first_boot[r], total_boot[r] = self._sobol_indices(
+                outputs_a[rows], outputs_b[rows], outputs_ab[:, rows]
+            )
+        tail = (1 - confidence) / 2 * 100
+        if n_bootstrap > 1:
+            first_ci = np.diff(np.percentile(first_boot, [tail, 100 - tail], axis=0), axis=0)[0] / 2
+            total_ci = np.diff(np.percentile(total_boot, [tail, 100 - tail], axis=0), axis=0)[0] / 2
+        else:
+            first_ci = total_ci = np.full(len(input_names), float("nan"))
+
+        all_outputs = np.concatenate([outputs_a, outputs_b])
+        order = np.argsort(-total_order, kind="stable")
+
+        return SobolSensitivity(
+            n_patients=len(cohort),
+            n_base_samples=n_samples,
+            n_model_evaluations=(len(input_names) + 2) * n_samples,
+            output_mean=float(np.mean(all_outputs)),
+            output_variance=float(np.var(all_outputs, ddof=1)),
+            first_order={input_names[i]: float(first_order[i]) for i in order},
+            total_order={input_names[i]: float(total_order[i]) for i in order},
+            first_order_ci={input_names[i]: float(first_ci[i]) for i in order},
+            total_order_ci={input_names[i]: float(total_ci[i]) for i in order},
+            execution_time_ms=(time.time() - start_time) * 1000,
             generated_at=datetime.utcnow().isoformat(),
         )
 
+    def _sample_model_inputs(self, rng: np.random.Generator, n_samples: int) -> np.ndarray:
+        """Sample (n_samples, 1 + n_factors) inputs: baseline rate, then HRs in spec order."""
+        log_means = np.array([spec.log_mean for spec in self._hazard_ratio_specs.values()])
+        log_stds = np.array([spec.log_std for spec in self._hazard_ratio_specs.values()])
+        baseline = rng.beta(self.BASELINE_BETA[0], self.BASELINE_BETA[1], size=(n_samples, 1))
+        hazard_ratios = rng.lognormal(log_means, log_stds, size=(n_samples, len(log_means)))
+        return np.hstack([baseline, hazard_ratios])
+
+    def _expected_cohort_rates(
+        self,
+        factor_matrix: np.ndarray,
+        hr_columns: List[int],
+        inputs: np.ndarray
+    ) -> np.ndarray:
+        """Expected cohort revision rate (mean patient risk) for each input row."""
+        n_rows = inputs.shape[0]
+        n_patients = factor_matrix.shape[0]
+        rates = np.zeros(n_rows)
+        if n_patients == 0:
+            return rates
+
+        hazard_ratios = inputs[:, 1:][:, hr_columns]
+        block_size = max(1, self.BLOCK_CELL_BUDGET // n_patients)
+        for start in range(0, n_rows, block_size):
+            stop = min(start + block_size, n_rows)
+            risks = self._cohort_risks(
+                factor_matrix, inputs[start:stop, 0], hazard_ratios[start:stop]
+            )
+            rates[start:stop] = risks.mean(axis=1)
+        return rates
+
+    @staticmethod
+    def _sobol_indices(
+        outputs_a: np.ndarray,
+        outputs_b: np.ndarray,
+        outputs_ab: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """First-order (Saltelli 2010) and total (Jansen) indices from model outputs."""
+        all_outputs = np.concatenate([outputs_a, outputs_b])
+        variance = np.var(all_outputs, ddof=1)
+        if variance == 0:
+            zeros = np.zeros(outputs_ab.shape[0])
+            return zeros, zeros.copy()
+        # Centering leaves the estimator unbiased but cuts its variance sharply
+        # when the output mean is large relative to its spread
+        centered_b = outputs_b - np.mean(all_outputs)
+        first_order = np.mean(centered_b * (outputs_ab - outputs_a), axis=1) / variance
+        total_order = 0.5 * np.mean((outputs_a - outputs_ab) ** 2, axis=1) / variance
+        return first_order, total_order
+
     def _calculate_variance_contributions(
         self,
-        revision_rates: List[float],
-        hr_samples: Dict[str, List[float]],
-        baseline_samples: List[float]
+        revision_rates: Sequence[float],
+        hr_samples: Dict[str, Sequence[float]],
+        baseline_samples: Sequence[float]
     ) -> Dict[str, float]:
         """
         Calculate variance contribution of each factor using Spearman correlation.
@@ -416,7 +1145,9 @@ class MonteCarloService:
         n_patients: int = 549,
         threshold_key: str = "fda_510k",
         n_iterations: int = 10000,
-        seed: Optional[int] = 42
+        seed: Optional[int] = 42,
+        engine: str = "vectorized",
+        n_workers: Optional[int] = None,
     ) -> List[ScenarioComparison]:
         """
         Compare multiple enrollment/exclusion scenarios.
@@ -428,36 +1159,153 @@ class MonteCarloService:
             threshold_key: Regulatory threshold
             n_iterations: Iterations per scenario
             seed: Random seed for reproducibility
+            engine: Simulation engine (see ``run_simulation``), or "crn" to
+                    evaluate all scenarios in one pass with common random numbers
+            n_workers: Worker processes for the parallel engine
 
         Returns:
             List of ScenarioComparison results
         """
-        results = []
-        baseline_summary = None
+        if engine not in self.COMPARISON_ENGINES:
+            raise ValueError(f"Unknown simulation engine: {engine}")
+
+        if engine == "crn":
+            summaries, scenario_rates = self._simulate_scenarios_crn(
+                scenarios, n_patients, threshold_key, n_iterations, seed
+            )
+            return self._build_comparisons(scenarios, summaries, scenario_rates)
 
+        summaries = []
         for i, scenario in enumerate(scenarios):
-            # Generate cohort with scenario's risk distribution
+            scenario_seed = seed + i if seed else None
+
+            # Generate cohort with scenario's risk distribution. The parallel
+            # engine never touches global RNG state, so seed the cohort directly.
             cohort = self.generate_synthetic_cohort(
                 n_patients,
-                scenario.get("risk_distribution")
+                scenario.get("risk_distribution"),
+                seed=scenario_seed if engine == "parallel" else None,
             )
 
             # Run simulation
-            summary = self.run_simulation(
+            summaries.append(self.run_simulation(
                 cohort,
                 threshold_key,
                 n_iterations,
-                seed=seed + i if seed else None
+                seed=scenario_seed,
+                engine=engine,
+                n_workers=n_workers,
+            ))
+
+        return self._build_comparisons(scenarios, summaries)
+
+    def _simulate_scenarios_crn(
+        self,
+        scenarios: List[Dict[str, Any]],
+        n_patients: int,
+        threshold_key: str,
+        n_iterations: int,
+        seed: Optional[int]
+    ) -> Tuple[List[MonteCarloSummary], np.ndarray]:
+        """
+        Simulate every scenario in one vectorized pass with common random numbers.
+
+        All scenarios share the sampled baseline rates and hazard ratios, the
+        per-patient uniforms that assign risk factors (so a scenario that lowers
+        a prevalence removes the factor from the same patients), and the
+        per-iteration outcome uniforms. Differences between scenarios then
+        reflect only the change in risk distribution, not sampling noise.
+
+        Returns:
+            Tuple of (one MonteCarloSummary per scenario in input order,
+            iteration x scenario array of cohort rates)
+        """
+        import time
+        start_time = time.time()
+
+        threshold_info = self.THRESHOLDS.get(threshold_key, self.THRESHOLDS["fda_510k"])
+        rng = np.random.default_rng(seed)
+
+        spec_factors = list(self._hazard_ratio_specs.keys())
+        log_means = np.array([spec.log_mean for spec in self._hazard_ratio_specs.values()])
+        log_stds = np.array([spec.log_std for spec in self._hazard_ratio_specs.values()])
+
+        prevalences = [
+            scenario.get("risk_distribution") or self.DEFAULT_PREVALENCE
+            for scenario in scenarios
+        ]
+        factors = [f for f in spec_factors if any(f in prevalence for prevalence in prevalences)]
+        hr_columns = [spec_factors.index(factor) for factor in factors]
+
+        # Stack scenario cohorts into one (n_scenarios * n_patients, n_factors) matrix
+        patient_draws = rng.random((n_patients, len(factors)))
+        factor_matrix = np.concatenate([
+            patient_draws < np.array([prevalence.get(f, 0.0) for f in factors])
+            for prevalence in prevalences
+        ]).reshape(len(scenarios) * n_patients, len(factors))
+
+        baseline_samples = rng.beta(self.BASELINE_BETA[0], self.BASELINE_BETA[1], size=n_iterations)
+        hr_samples = rng.lognormal(log_means, log_stds, size=(n_iterations, len(spec_factors)))
+
+        n_scenarios = len(scenarios)
+        n_revisions = np.zeros((n_iterations, n_scenarios), dtype=np.int64)
+        if n_patients > 0:
+            block_size = max(1, self.BLOCK_CELL_BUDGET // (n_scenarios * n_patients))
+            for start in range(0, n_iterations, block_size):
+                stop = min(start + block_size, n_iterations)
+                risks = self._cohort_risks(
+                    factor_matrix,
+                    baseline_samples[start:stop],
+                    hr_samples[start:stop][:, hr_columns],
+                ).reshape(stop - start, n_scenarios, n_patients)
+                draws = rng.random((stop - start, 1, n_patients))
+                n_revisions[start:stop] = np.count_nonzero(draws < risks, axis=2)
+            rates = n_revisions / n_patients
+        else:
+            rates = np.zeros((n_iterations, n_scenarios))
+
+        summaries = [
+            self._build_summary(
+                n_patients, threshold_info, rates[:, i],
+                baseline_samples, hr_samples, start_time
             )
+            for i in range(n_scenarios)
+        ]
+        return summaries, rates
+
+    def _build_comparisons(
+        self,
+        scenarios: List[Dict[str, Any]],
+        summaries: List[MonteCarloSummary],
+        paired_rates: Optional[np.ndarray] = None
+    ) -> List[ScenarioComparison]:
+        """
+        Attach deltas vs the first (baseline) scenario.
 
+        With ``paired_rates`` (iteration x scenario rates from common random
+        numbers) the standard error of the mean rate delta comes from
+        per-iteration differences; otherwise the runs are independent and
+        their variances add.
+        """
+        results = []
+        baseline_summary = summaries[0] if summaries else None
+
+        for i, (scenario, summary) in enumerate(zip(scenarios, summaries)):
             # Calculate delta from baseline
             delta_prob = None
             delta_rate = None
-            if baseline_summary is not None:
+            delta_rate_se = None
+            if i > 0:
                 delta_prob = summary.probability_pass - baseline_summary.probability_pass
                 delta_rate = summary.mean_revision_rate - baseline_summary.mean_revision_rate
-            else:
-                baseline_summary = summary
+                if paired_rates is not None:
+                    differences = paired_rates[:, i] - paired_rates[:, 0]
+                    delta_rate_se = float(np.std(differences, ddof=1) / math.sqrt(len(differences)))
+                else:
+                    delta_rate_se = math.sqrt(
+                        summary.std_revision_rate ** 2 / summary.n_iterations
+                        + baseline_summary.std_revision_rate ** 2 / baseline_summary.n_iterations
+                    )
 
             results.append(ScenarioComparison(
                 scenario_name=scenario.get("name", f"Scenario {i+1}"),
@@ -465,10 +1313,36 @@ class MonteCarloService:
                 summary=summary,
                 delta_probability=delta_prob,
                 delta_mean_rate=delta_rate,
+                delta_mean_rate_se=delta_rate_se,
             ))
 
         return results
 
+    def sensitivity_to_dict(self, sensitivity: SobolSensitivity) -> Dict[str, Any]:
+        """Convert SobolSensitivity to API-friendly dict."""
+        return {
+            "n_patients": sensitivity.n_patients,
+            "n_base_samples": sensitivity.n_base_samples,
+            "n_model_evaluations": sensitivity.n_model_evaluations,
+            "output_mean": round(sensitivity.output_mean, 5),
+            "output_variance": sensitivity.output_variance,
+            "factors": [
+                {
+                    "factor": factor,
+                    "first_order": round(sensitivity.first_order[factor], 4),
+                    "first_order_ci": round(sensitivity.first_order_ci[factor], 4),
+                    "total_order": round(sensitivity.total_order[factor], 4),
+                    "total_order_ci": round(sensitivity.total_order_ci[factor], 4),
+                }
+                for factor in sensitivity.total_order
+            ],
+            "interaction_share": round(
+                max(0.0, 1.0 - sum(sensitivity.first_order.values())), 4
+            ),
+            "execution_time_ms": round(sensitivity.execution_time_ms, 1),
+            "generated_at": sensitivity.generated_at,
+        }
+
     def get_hazard_ratio_specs(self) -> List[Dict[str, Any]]:
         """Get all hazard ratio specifications for display."""
         return [
@@ -497,8 +1371,21 @@ class MonteCarloService:
             "probability_pass": round(summary.probability_pass, 4),
             "verdict": summary.verdict,
             "variance_contributions": summary.variance_contributions,
+            "histogram": summary.histogram,
+            "quantile_sketch": summary.rate_sketch.to_dict(),
+            "revision_rates": summary.revision_rates,
             "execution_time_ms": round(summary.execution_time_ms, 1),
             "generated_at": summary.generated_at,
+            "max_iterations": summary.max_iterations,
+            "stop_reason": summary.stop_reason,
+            "probability_pass_ci_half_width": (
+                round(summary.probability_pass_ci_half_width, 4)
+                if summary.probability_pass_ci_half_width is not None else None
+            ),
+            "mean_revision_rate_ci_half_width": (
+                round(summary.mean_revision_rate_ci_half_width, 5)
+                if summary.mean_revision_rate_ci_half_width is not None else None
+            ),
         }
 
 
@@ -512,3 +1399,9 @@ def get_monte_carlo_service() -> MonteCarloService:
     if _monte_carlo_service is None:
         _monte_carlo_service = MonteCarloService()
     return _monte_carlo_service
+
+
+def shutdown_monte_carlo_service() -> None:
+    """Release the singleton's worker processes, if it was ever created."""
+    if _monte_carlo_service is not None:
+        _monte_carlo_service.shutdown()
@@ -0,0 +1,259 @@
+"""
+Async rate limiting for calls to external model APIs.
+
+Provider quotas are expressed as requests (and tokens) per minute. A token
+bucket lets short bursts through (up to ``capacity``) and then paces callers
+to the sustained rate, so concurrent workers share a quota instead of each
+assuming they own it. ``AdmissionController`` combines a max-in-flight limit
+with request and token buckets and sheds requests that would queue past a
+deadline.
+"""
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket shared by coroutines.
+
+    Waiters are served in arrival order: each reserves its tokens up front
+    and sleeps until the refill covers its place in the queue.
+    """
+
+    def __init__(self, rate_per_second: float, capacity: Optional[float] = None):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate_per_second: Sustained refill rate
+            capacity: Maximum burst size (defaults to one second of tokens, at least 1)
+        """
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity if capacity is not None else max(1.0, rate_per_second)
+        if self.capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+        self.acquired = 0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_second)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> float:
+        """
+        Reserve ``tokens`` and wait until they have been refilled.
+
+        The reservation is made before awaiting, so callers are served in
+        arrival order without a lock (and without binding to an event loop).
+
+        Args:
+            tokens: Tokens to take (normally 1 per request)
+            timeout: Give up instead of waiting longer than this many seconds
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            TimeoutError: If the wait would exceed ``timeout`` (nothing is reserved)
+        """
+        if tokens > self.capacity:
+            raise ValueError("tokens exceeds bucket capacity")
+
+        self._refill()
+        balance = self._tokens - tokens  # negative balance = tokens owed to earlier waiters
+        delay = -balance / self.rate_per_second if balance < 0 else 0.0
+        if timeout is not None and delay > timeout:
+            raise TimeoutError(f"rate limit wait of {delay:.1f}s exceeds {timeout:.1f}s")
+        self._tokens = balance
+
+        self.acquired += 1
+        if delay:
+            self.throttled += 1
+            self.wait_seconds += delay
+            await asyncio.sleep(delay)
+        return delay
+
+    def consume(self, tokens: float) -> None:
+        """
+        Charge tokens without waiting (negative refunds).
+
+        Used to settle actual usage after the fact; an overdraft delays later
+        callers rather than this one.
+        """
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens - tokens)
+
+    def pause(self, seconds: float) -> None:
+        """Withhold tokens so no caller is admitted for ``seconds`` (e.g. after a 429)."""
+        self._refill()
+        self._tokens = min(self._tokens, -seconds * self.rate_per_second)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter configuration and counters."""
+        return {
+            "rate_per_second": self.rate_per_second,
+            "capacity": self.capacity,
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "wait_seconds": round(self.wait_seconds, 3),
+        }
+
+
+class AdmissionController:
+    """
+    Admission control for one provider/model: max in flight plus rate buckets.
+
+    Requests queue in arrival order for a concurrency slot, then for request
+    and token budget. A request that would wait past its deadline is rejected
+    with TimeoutError instead of joining an unbounded queue.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_in_flight: int,
+        requests_per_minute: float,
+        tokens_per_minute: Optional[float] = None,
+        queue_timeout: float = 60.0,
+    ):
+        """
+        Initialize admission controller.
+
+        Args:
+            name: Label for metrics (e.g. "gemini:gemini-2.5-flash")
+            max_in_flight: Concurrent requests allowed
+            requests_per_minute: Request quota
+            tokens_per_minute: Token quota (None to skip token accounting)
+            queue_timeout: Default seconds a request may wait for admission
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.name = name
+        self.max_in_flight = max_in_flight
+        self.queue_timeout = queue_timeout
+        self.requests = AsyncTokenBucket(
+            requests_per_minute / 60, capacity=max(1.0, min(requests_per_minute / 60, max_in_flight))
+        )
+        self.tokens = (
+            AsyncTokenBucket(tokens_per_minute / 60, capacity=tokens_per_minute / 6)
+            if tokens_per_minute else None
+        )
+
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.queued = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    @asynccontextmanager
+    async def admit(self, estimated_tokens: float = 0, timeout: Optional[float] = None) -> AsyncIterator[None]:
+        """
+        Hold a concurrency slot and rate budget for one request.
+
+        Args:
+            estimated_tokens: Expected token usage, charged up front
+            timeout: Seconds to wait for admission (defaults to queue_timeout)
+
+        Raises:
+            TimeoutError: If admission would take longer than the timeout
+        """
+        start = time.monotonic()
+        deadline = start + (timeout if timeout is not None else self.queue_timeout)
+        self.queued += 1
+        try:
+            await self._acquire_slot(deadline)
+            try:
+                await self.requests.acquire(1, timeout=max(0.0, deadline - time.monotonic()))
+                if self.tokens is not None and estimated_tokens > 0:
+                    await self.tokens.acquire(
+                        min(estimated_tokens, self.tokens.capacity),
+                        timeout=max(0.0, deadline - time.monotonic()),
+                    )
+            except BaseException:
+                self._release_slot()
+                raise
+        except TimeoutError:
+            self.rejected += 1
+            raise
+        finally:
+            self.queued -= 1
+            waited = time.monotonic() - start
+            self.total_wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+        self.admitted += 1
+        try:
+            yield
+        finally:
+            self._release_slot()
+
+    async def _acquire_slot(self, deadline: float) -> None:
+        """Take a concurrency slot, queueing FIFO until the deadline."""
+        if self._in_flight < self.max_in_flight and not self._waiters:
+            self._in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout=max(0.0, deadline - time.monotonic()))
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                self._release_slot()  # the slot arrived as we gave up; pass it on
+            else:
+                self._waiters.remove(waiter)
+            if isinstance(e, asyncio.TimeoutError):
+                raise TimeoutError(f"{self.name}: no free slot before the queue deadline") from None
+            raise
+
+    def _release_slot(self) -> None:
+        """Hand the slot to the next live waiter, or free it."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done() and not waiter.get_loop().is_closed():
+                waiter.set_result(None)  # slot passes over; _in_flight is unchanged
+                return
+        self._in_flight -= 1
+
+    def record_usage(self, estimated_tokens: float, actual_tokens: float) -> None:
+        """Settle the token bucket with actual usage once a response arrives."""
+        if self.tokens is not None:
+            self.tokens.consume(actual_tokens - min(estimated_tokens, self.tokens.capacity))
+
+    def pause(self, seconds: float) -> None:
+        """Stop admitting requests for ``seconds`` (the provider said retry-after)."""
+        self.rate_limited += 1
+        self.requests.pause(seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth, in-flight count, wait times and bucket counters."""
+        waits = self.admitted + self.rejected
+        return {
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queued,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "retries": self.retries,
+            "rate_limited": self.rate_limited,
+            "avg_wait_ms": round(self.total_wait_seconds / waits * 1000, 1) if waits else 0.0,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 1),
+            "requests": self.requests.get_stats(),
+            "tokens": self.tokens.get_stats() if self.tokens is not None else None,
+        }
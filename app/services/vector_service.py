@@ -4,6 +4,7 @@ Vector Service for Embedding and Retrieval.
 Provides vector storage and similarity search using ChromaDB.
 Handles document chunking, embedding generation, and semantic retrieval.
 """
+import asyncio
 import hashlib
 import logging
 import os
@@ -13,7 +14,10 @@ from typing import Any, Dict, List, Optional, Tuple
 import chromadb
 from chromadb.config import Settings as ChromaSettings
 
+from app.config import settings
 from app.services.llm_service import get_llm_service
+from app.services.rate_limiter import AsyncTokenBucket
+from data.vectorstore.pg_vector_store import EmbeddingFunction, create_embedding_function
 
 logger = logging.getLogger(__name__)
 
@@ -31,20 +35,36 @@ class VectorService:
 
     Features:
     - Document chunking with configurable overlap
-    - Embedding generation via Gemini
+    - Embedding generation via Gemini or an offline backend (EMBEDDING_BACKEND)
     - Semantic similarity search
     - Collection management per product
     """
 
-    def __init__(self, persist_directory: Optional[str] = None):
+    def __init__(
+        self,
+        persist_directory: Optional[str] = None,
+        embedding_function: Optional[EmbeddingFunction] = None,
+    ):
         """
         Initialize vector service with ChromaDB.
 
         Args:
             persist_directory: Path to store ChromaDB data
+            embedding_function: Embedding backend to use instead of the Gemini
+                API (defaults to the local backend when EMBEDDING_BACKEND=local)
         """
         self._persist_directory = persist_directory or str(CHROMA_DB_PATH)
 
+        # None means the Gemini API path in generate_embeddings (batched, retried)
+        if embedding_function is None and settings.embedding_backend != "gemini":
+            embedding_function = create_embedding_function()
+        self._embedding_function = embedding_function
+        # Shared by all generate_embeddings calls so concurrent ingestions share the quota
+        self._embedding_rate_limiter = AsyncTokenBucket(
+            settings.embedding_requests_per_minute / 60,
+            capacity=settings.embedding_max_concurrency,
+        )
+
         # Ensure directory exists
         Path(self._persist_directory).mkdir(parents=True, exist_ok=True)
 
@@ -141,60 +161,92 @@ class VectorService:
         texts: List[str],
         batch_size: int = 10,
         max_retries: int = 3,
+        max_concurrency: Optional[int] = None,
     ) -> List[List[float]]:
         """
         Generate embeddings for texts using Gemini with retry logic.
 
+        Batches are embedded concurrently on worker threads (the Gemini client
+        is blocking), at most ``max_concurrency`` at a time and paced by a
+        token bucket shared by all calls on this service. A failed batch is
+        retried on its own with exponential backoff; results keep input order.
+
+        With a configured embedding backend (e.g. the offline local backend),
+        texts are embedded by that backend instead, off the event loop.
+
         Args:
             texts: List of text strings to embed
             batch_size: Number of texts per batch
             max_retries: Maximum retry attempts per batch
+            max_concurrency: Batches in flight at once
+                (defaults to EMBEDDING_MAX_CONCURRENCY)
 
         Returns:
             List of embedding vectors
         """
-        import asyncio
         import google.generativeai as genai
 
-        embeddings = []
+        if self._embedding_function is not None:
+            return await asyncio.to_thread(self._embedding_function, texts)
+        if not texts:
+            return []
+
+        semaphore = asyncio.Semaphore(max_concurrency or settings.embedding_max_concurrency)
 
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            batch_embeddings = None
+        async def embed_batch(start: int) -> List[List[float]]:
+            batch = texts[start:start + batch_size]
             last_error = None
 
             for attempt in range(max_retries):
-                try:
-                    # Use Gemini embedding model
-                    result = genai.embed_content(
-                        model="models/text-embedding-004",
-                        content=batch,
-                        task_type="retrieval_document",
-                    )
-                    batch_embeddings = result["embedding"]
-                    break
-                except Exception as e:
-                    last_error = e
-                    logger.warning(
-                        f"Embedding attempt {attempt + 1}/{max_retries} failed for batch {i}: {e}"
-                    )
-                    if attempt < max_retries - 1:
-                        # Exponential backoff: 1s, 2s, 4s
-                        await asyncio.sleep(2 ** attempt)
-
-            if batch_embeddings:
-                embeddings.extend(batch_embeddings)
-            else:
-                # All retries failed - raise error instead of using zero vectors
-                logger.error(
-                    f"All {max_retries} embedding attempts failed for batch {i}. "
-                    f"Last error: {last_error}"
-                )
-                raise RuntimeError(
-                    f"Failed to generate embeddings after {max_retries} attempts: {last_error}"
-                )
-
-        return embeddings
+                async with semaphore:
+                    await self._embedding_rate_limiter.acquire()
+                    try:
+                        result = await asyncio.to_thread(
+                            genai.embed_content,
+                            model="models/text-embedding-004",
+                            content=batch,
+                            task_type="retrieval_document",
+                        )
+                        batch_embeddings = result["embedding"]
+                        if len(batch_embeddings) != len(batch):
+                            raise ValueError(
+                                f"expected {len(batch)} embeddings, got {len(batch_embeddings)}"
+                            )
+                        return batch_embeddings
+                    except Exception as e:
+                        last_error = e
+                        logger.warning(
+                            f"Embedding attempt {attempt + 1}/{max_retries} failed for batch {start}: {e}"
+                        )
+                # Back off outside the semaphore so other batches keep flowing: 1s, 2s, 4s
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(2 ** attempt)
+
+            # All retries failed - raise error instead of using zero vectors
+            logger.error(
+                f"All {max_retries} embedding attempts failed for batch {start}. "
+                f"Last error: {last_error}"
+            )
+            raise RuntimeError(
+                f"Failed to generate embeddings after {max_retries} attempts: {last_error}"
+            )
+
+        tasks = [
+            asyncio.create_task(embed_batch(start))
+            for start in range(0, len(texts), batch_size)
+        ]
+        try:
+            batch_results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        return [embedding for batch_embeddings in batch_results for embedding in batch_embeddings]
+
+    def get_embedding_rate_limit_stats(self) -> Dict[str, Any]:
+        """Get token bucket counters for Gemini embedding requests."""
+        return self._embedding_rate_limiter.get_stats()
 
     async def embed_and_store(
         self,
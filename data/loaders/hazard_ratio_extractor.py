@@ -72,11 +72,12 @@ class HazardRatioExtractor:
             logger.info(f"Searching for: {factor_query}")
 
             # Search literature for this factor
-            results = self._vector_store.search(
+            results = await self._vector_store.as_async().search(
                 query=f"hazard ratio risk factor {factor_query} revision",
                 source_type="literature",
                 n_results=n_results_per_factor,
-                include_distances=True
+                include_distances=True,
+                mode="hybrid"
             )
 
             if not results:
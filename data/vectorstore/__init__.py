@@ -5,7 +5,16 @@ Components:
     DocumentChunk: Data class representing a document chunk
     PDFExtractor: Extract and chunk PDF documents
     get_vector_store: Get singleton PgVectorStore instance
-    index_all_documents: Utility to index all documents
+    close_vector_store: Release the singleton's pooled connections (shutdown)
+    VectorConnectionPool: Pooled pgvector-ready connections shared by the store
+    get_async_vector_store: Non-blocking search front-end for async handlers
+    EmbeddingCache: Persistent (memory LRU + SQLite) query embedding cache
+    index_all_documents: Utility to index all documents (incremental)
+    IndexManifest: Record of indexed files used to skip unchanged PDFs
+    IngestionPipeline: Streaming extract -> embed -> store pipeline
+    HashingEmbeddingFunction: Deterministic offline embedding for benchmarks and local use
+    create_embedding_function: Embedding backend selected by EMBEDDING_BACKEND
+    mmr_rerank: Diversity (MMR) re-ranking with per-source and per-page caps
 
 Usage:
     from data.vectorstore import get_vector_store, PDFExtractor
@@ -23,17 +32,53 @@ Usage:
 from data.vectorstore.pg_vector_store import (
     PgVectorStore,
     get_vector_store,
+    close_vector_store,
+    get_vector_store_pool_stats,
+    get_vector_store_embedding_cache_stats,
     DocumentChunk,
+    EmbeddingFunction,
+    create_embedding_function,
 )
+from data.vectorstore.async_vector_store import (
+    AsyncPgVectorStore,
+    get_async_vector_store,
+)
+from data.vectorstore.embedding_cache import (
+    EmbeddingCache,
+    get_embedding_cache,
+)
+from data.vectorstore.connection_pool import (
+    VectorConnectionPool,
+    PoolTimeoutError,
+)
+from data.vectorstore.index_manifest import IndexManifest
 from data.vectorstore.pdf_extractor import (
     PDFExtractor,
     index_all_documents,
 )
+from data.vectorstore.ingestion_pipeline import IngestionPipeline
+from data.vectorstore.local_embedding import HashingEmbeddingFunction
+from data.vectorstore.reranking import mmr_rerank
 
 __all__ = [
     "PgVectorStore",
     "get_vector_store",
+    "close_vector_store",
+    "get_vector_store_pool_stats",
+    "get_vector_store_embedding_cache_stats",
+    "AsyncPgVectorStore",
+    "get_async_vector_store",
     "DocumentChunk",
+    "EmbeddingFunction",
+    "create_embedding_function",
+    "EmbeddingCache",
+    "get_embedding_cache",
+    "VectorConnectionPool",
+    "PoolTimeoutError",
     "PDFExtractor",
     "index_all_documents",
+    "IndexManifest",
+    "IngestionPipeline",
+    "HashingEmbeddingFunction",
+    "mmr_rerank",
 ]
@@ -0,0 +1,147 @@
+"""Asyncio front-end for the pgvector store.
+
+``PgVectorStore.search`` blocks on a network embedding call and a pgvector
+query. Called directly from an ``async`` FastAPI handler, that stalls every
+other request on the worker's event loop. ``AsyncPgVectorStore`` runs the
+blocking work on a dedicated thread pool, sized to the connection pool, so the
+event loop stays free and the default executor is left for other work.
+
+Usage:
+    store = get_async_vector_store()
+    results = await store.search("visit windows", source_type="protocol")
+
+Scripts and other synchronous callers keep using ``PgVectorStore`` directly.
+"""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from data.vectorstore.pg_vector_store import PgVectorStore
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncPgVectorStore:
+    """Non-blocking wrapper around a PgVectorStore.
+
+    Obtain one via ``PgVectorStore.as_async()`` (or ``get_async_vector_store()``
+    for the shared store) so that each store has a single executor.
+    """
+
+    def __init__(self, store: "PgVectorStore", max_workers: int):
+        """Initialize async vector store.
+
+        Args:
+            store: Synchronous store that performs the actual work.
+            max_workers: Threads in the dedicated executor (match the pool size;
+                more threads would only queue for connections).
+        """
+        self._store = store
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="pgvector",
+        )
+
+    @property
+    def sync_store(self) -> "PgVectorStore":
+        """The underlying synchronous store."""
+        return self._store
+
+    async def _run(self, func, *args, **kwargs) -> Any:
+        """Run a blocking store call on the dedicated executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def search(
+        self,
+        query: str,
+        source_type: str = "all",
+        n_results: int = 5,
+        where: Optional[Dict[str, Any]] = None,
+        include_distances: bool = True,
+        mode: str = "vector",
+        ef_search: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Search for relevant document chunks without blocking the event loop.
+
+        See ``PgVectorStore.search`` for arguments and result shape.
+        """
+        return await self._run(
+            self._store.search,
+            query=query,
+            source_type=source_type,
+            n_results=n_results,
+            where=where,
+            include_distances=include_distances,
+            mode=mode,
+            ef_search=ef_search,
+        )
+
+    async def search_diverse(
+        self,
+        query: str,
+        source_type: str = "all",
+        n_results: int = 5,
+        fetch_k: Optional[int] = None,
+        lambda_mult: Optional[float] = None,
+        max_per_source: Optional[int] = None,
+        max_per_page: Optional[int] = 1,
+        mode: str = "vector",
+        ef_search: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Diversity re-ranked search without blocking the event loop.
+
+        See ``PgVectorStore.search_diverse`` for arguments and result shape.
+        """
+        return await self._run(
+            self._store.search_diverse,
+            query=query,
+            source_type=source_type,
+            n_results=n_results,
+            fetch_k=fetch_k,
+            lambda_mult=lambda_mult,
+            max_per_source=max_per_source,
+            max_per_page=max_per_page,
+            mode=mode,
+            ef_search=ef_search,
+        )
+
+    async def search_multi_source(
+        self,
+        query: str,
+        source_types: List[str],
+        n_results_per_source: int = 3,
+        ef_search: Optional[int] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Search across multiple source types without blocking the event loop.
+
+        See ``PgVectorStore.search_multi_source`` for arguments and result shape.
+        """
+        return await self._run(
+            self._store.search_multi_source,
+            query=query,
+            source_types=source_types,
+            n_results_per_source=n_results_per_source,
+            ef_search=ef_search,
+        )
+
+    async def get_collection_stats(self) -> Dict[str, int]:
+        """Get document counts per source type without blocking the event loop."""
+        return await self._run(self._store.get_collection_stats)
+
+    def close(self) -> None:
+        """Stop the executor; queued calls still complete."""
+        self._executor.shutdown(wait=False)
+
+
+def get_async_vector_store() -> AsyncPgVectorStore:
+    """Get the async front-end for the shared vector store singleton."""
+    from data.vectorstore.pg_vector_store import get_vector_store
+
+    return get_vector_store().as_async()
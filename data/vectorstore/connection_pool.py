@@ -0,0 +1,221 @@
+"""Pooled PostgreSQL connections for the pgvector store.
+
+Opening a psycopg2 connection costs a TCP/TLS handshake plus authentication,
+and every vector-store connection also needs ``register_vector`` and a
+statement timeout. This module keeps a bounded set of ready-to-use
+connections so RAG queries only pay that cost once per connection.
+
+Usage:
+    pool = VectorConnectionPool(database_url, min_size=1, max_size=10)
+
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+
+    pool.get_stats()  # {"in_use": 0, "idle": 1, "waits": 0, ...}
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+import psycopg2
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+from pgvector.psycopg2 import register_vector
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no pooled connection becomes free within the timeout."""
+    pass
+
+
+class VectorConnectionPool:
+    """Thread-safe pool of pgvector-ready PostgreSQL connections.
+
+    Connections are configured once, when opened: the statement timeout is
+    passed as a connect option and ``register_vector`` runs immediately.
+    Idle connections are reused LIFO so the warmest one is handed out first.
+    When all ``max_size`` connections are checked out, callers queue for up to
+    ``acquire_timeout`` seconds instead of failing.
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        min_size: int = 1,
+        max_size: int = 10,
+        acquire_timeout: float = 30.0,
+        connect_timeout: int = 30,
+        statement_timeout_ms: int = 60000,
+    ):
+        """Initialize connection pool.
+
+        Args:
+            database_url: PostgreSQL connection URL.
+            min_size: Connections opened eagerly at startup.
+            max_size: Upper bound on concurrently open connections.
+            acquire_timeout: Seconds to wait for a free connection.
+            connect_timeout: Seconds to wait when opening a new connection.
+            statement_timeout_ms: Server-side statement timeout per connection.
+        """
+        self.database_url = database_url
+        self.min_size = min_size
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self.connect_timeout = connect_timeout
+        self.statement_timeout_ms = statement_timeout_ms
+
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._idle: List[Any] = []
+        self._open = 0
+        self._closed = False
+
+        self._in_use = 0
+        self._checkouts = 0
+        self._connections_opened = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._total_wait_ms = 0.0
+        self._discarded = 0
+
+        for _ in range(min_size):
+            conn = self._connect()
+            with self._lock:
+                self._open += 1
+                self._idle.append(conn)
+
+        logger.info(f"Vector store connection pool ready (min={min_size}, max={max_size})")
+
+    def _connect(self) -> Any:
+        """Open and configure a new connection."""
+        conn = psycopg2.connect(
+            self.database_url,
+            connect_timeout=self.connect_timeout,
+            options=f"-c statement_timeout={self.statement_timeout_ms}",
+        )
+        register_vector(conn)
+        conn.rollback()  # end the implicit transaction opened by the type lookup
+        with self._lock:
+            self._connections_opened += 1
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Check out a connection, returning it to the pool afterwards.
+
+        Uncommitted work is rolled back. Connections that were closed or
+        broken while checked out are discarded rather than reused.
+
+        Raises:
+            PoolTimeoutError: If no connection frees up within acquire_timeout.
+        """
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+
+        self._acquire_slot()
+        conn = None
+        try:
+            conn = self._checkout()
+            yield conn
+        finally:
+            if conn is not None:
+                self._checkin(conn)
+            self._slots.release()
+
+    def _acquire_slot(self) -> None:
+        """Reserve one of max_size slots, waiting if all are in use."""
+        if self._slots.acquire(blocking=False):
+            return
+
+        start = time.perf_counter()
+        acquired = self._slots.acquire(timeout=self.acquire_timeout)
+        waited_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self._waits += 1
+            self._total_wait_ms += waited_ms
+            if not acquired:
+                self._timeouts += 1
+        if not acquired:
+            raise PoolTimeoutError(
+                f"No vector store connection available after {self.acquire_timeout}s"
+            )
+
+    def _checkout(self) -> Any:
+        """Take an idle connection, or open one if none is idle."""
+        conn = None
+        with self._lock:
+            while self._idle and conn is None:
+                candidate = self._idle.pop()
+                if candidate.closed:
+                    self._open -= 1
+                    self._discarded += 1
+                else:
+                    conn = candidate
+            if conn is None:
+                self._open += 1  # reserve before connecting outside the lock
+
+        if conn is None:
+            try:
+                conn = self._connect()
+            except Exception:
+                with self._lock:
+                    self._open -= 1
+                raise
+
+        with self._lock:
+            self._in_use += 1
+            self._checkouts += 1
+        return conn
+
+    def _checkin(self, conn: Any) -> None:
+        """Return a connection to the idle list, closing it if unusable."""
+        broken = bool(conn.closed)
+        if not broken and conn.info.transaction_status != TRANSACTION_STATUS_IDLE:
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                broken = True
+
+        with self._lock:
+            self._in_use -= 1
+            if broken or self._closed:
+                self._open -= 1
+                self._discarded += int(broken)
+            else:
+                self._idle.append(conn)
+
+        if (broken or self._closed) and not conn.closed:
+            conn.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool usage counters for monitoring."""
+        with self._lock:
+            return {
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "open": self._open,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "checkouts": self._checkouts,
+                "connections_opened": self._connections_opened,
+                "waits": self._waits,
+                "timeouts": self._timeouts,
+                "avg_wait_ms": round(self._total_wait_ms / self._waits, 2) if self._waits else 0.0,
+                "discarded": self._discarded,
+            }
+
+    def close(self) -> None:
+        """Close idle connections; checked-out ones close when returned."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+        for conn in idle:
+            if not conn.closed:
+                conn.close()
+        logger.info("Vector store connection pool closed")
@@ -0,0 +1,187 @@
+"""Persistent cache for query embeddings.
+
+Chat users ask the same questions repeatedly, and every search embeds its
+query with a network call. ``EmbeddingCache`` keys embeddings by
+(model, task_type, normalised text) and keeps them in a bounded in-memory LRU
+backed by SQLite, so repeated queries skip the embedding round trip, including
+after a restart.
+
+Usage:
+    cache = get_embedding_cache()
+    embedding = cache.get(model, "retrieval_query", query)
+    if embedding is None:
+        embedding = embed(query)
+        cache.put(model, "retrieval_query", query, embedding)
+
+    cache.get_stats()  # {"hits": 10, "memory_hits": 8, "disk_hits": 2, "misses": 3, ...}
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(text: str) -> str:
+    """Normalise text for cache keying: case-folded, whitespace collapsed."""
+    return " ".join(text.split()).casefold()
+
+
+class EmbeddingCache:
+    """Two-level (memory LRU + SQLite) content-addressed embedding cache.
+
+    Embeddings are stored as float64 blobs so cached vectors are bit-identical
+    to the ones the API returned. Thread-safe; a single SQLite connection is
+    shared behind a lock.
+    """
+
+    def __init__(self, db_path: Path, max_memory_entries: int = 2048):
+        """Initialize embedding cache.
+
+        Args:
+            db_path: SQLite file for the persistent layer (created if missing).
+            max_memory_entries: Capacity of the in-memory LRU.
+        """
+        if max_memory_entries < 0:
+            raise ValueError("max_memory_entries must be non-negative")
+
+        self.db_path = Path(db_path)
+        self.max_memory_entries = max_memory_entries
+
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._writes = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS query_embeddings (
+                cache_key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                task_type TEXT NOT NULL,
+                dimension INTEGER NOT NULL,
+                embedding BLOB NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, task_type: str, text: str) -> str:
+        """Build the content-addressed cache key."""
+        payload = "\x1f".join((model, task_type, normalize_text(text)))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, model: str, task_type: str, text: str) -> Optional[List[float]]:
+        """Look up a cached embedding.
+
+        Returns:
+            The embedding, or None on a miss.
+        """
+        key = self.make_key(model, task_type, text)
+        with self._lock:
+            embedding = self._memory.get(key)
+            if embedding is not None:
+                self._memory.move_to_end(key)
+                self._memory_hits += 1
+                return list(embedding)
+
+            row = self._conn.execute(
+                "SELECT embedding FROM query_embeddings WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+
+            embedding = array("d", row[0]).tolist()
+            self._remember(key, embedding)
+            self._disk_hits += 1
+            return list(embedding)
+
+    def put(self, model: str, task_type: str, text: str, embedding: List[float]) -> None:
+        """Store an embedding in both layers."""
+        key = self.make_key(model, task_type, text)
+        blob = array("d", embedding).tobytes()
+        with self._lock:
+            self._remember(key, list(embedding))
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO query_embeddings
+                    (cache_key, model, task_type, dimension, embedding)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (key, model, task_type, len(embedding), blob)
+            )
+            self._conn.commit()
+            self._writes += 1
+
+    def _remember(self, key: str, embedding: List[float]) -> None:
+        """Insert into the LRU, evicting the least recently used entry. Caller holds the lock."""
+        if self.max_memory_entries == 0:
+            return
+        self._memory[key] = embedding
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached embeddings from memory and disk."""
+        with self._lock:
+            self._memory.clear()
+            self._conn.execute("DELETE FROM query_embeddings")
+            self._conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters for monitoring."""
+        with self._lock:
+            hits = self._memory_hits + self._disk_hits
+            lookups = hits + self._misses
+            disk_entries = self._conn.execute(
+                "SELECT COUNT(*) FROM query_embeddings"
+            ).fetchone()[0]
+            return {
+                "hits": hits,
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "writes": self._writes,
+                "memory_entries": len(self._memory),
+                "max_memory_entries": self.max_memory_entries,
+                "disk_entries": disk_entries,
+            }
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_embedding_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """Get the shared embedding cache, or None if disabled in settings."""
+    global _embedding_cache
+    if not settings.embedding_cache_enabled:
+        return None
+    if _embedding_cache is None:
+        db_path = Path(settings.embedding_cache_path)
+        if not db_path.is_absolute():
+            db_path = settings.project_root / db_path
+        _embedding_cache = EmbeddingCache(
+            db_path, max_memory_entries=settings.embedding_cache_memory_size
+        )
+    return _embedding_cache
@@ -0,0 +1,202 @@
+"""Manifest of indexed source files for incremental vector store indexing.
+
+Records, per source PDF, the size, mtime, content hash and chunk ids written
+to the vector store. ``index_all_documents`` compares the files on disk with
+the manifest so re-runs only extract and embed added or modified PDFs, and
+can delete the chunks of PDFs that were removed.
+
+Usage:
+    manifest = IndexManifest.load("data/vectorstore/index_manifest.json")
+    plan = manifest.plan(discovered_files)
+    print(plan.summary())
+"""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MANIFEST_PATH = Path(__file__).parent / "index_manifest.json"
+
+
+def file_sha256(path: Path, block_size: int = 1 << 20) -> str:
+    """Hash a file's bytes without reading it into memory at once."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@dataclass
+class ManifestEntry:
+    """Indexing record for one source file."""
+
+    path: str  # relative to the data root, POSIX separators
+    source_type: str
+    size: int
+    mtime: float
+    content_hash: str
+    chunk_ids: List[str] = field(default_factory=list)
+    indexed_at: str = ""
+
+
+@dataclass
+class IndexPlan:
+    """Work needed to bring the vector store in line with the files on disk.
+
+    ``added`` and ``modified`` map manifest keys to (absolute path, source type);
+    ``removed`` lists manifest keys whose files no longer exist.
+    """
+
+    added: Dict[str, Tuple[Path, str]] = field(default_factory=dict)
+    modified: Dict[str, Tuple[Path, str]] = field(default_factory=dict)
+    unchanged: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    # Files whose bytes match the manifest but whose mtime moved (e.g. a copy).
+    touched: Dict[str, Tuple[float, int]] = field(default_factory=dict)
+
+    @property
+    def has_work(self) -> bool:
+        """Whether anything needs extracting or deleting."""
+        return bool(self.added or self.modified or self.removed)
+
+    def summary(self) -> Dict[str, object]:
+        """Counts and file lists for reporting (e.g. --dry-run)."""
+        return {
+            "added": sorted(self.added),
+            "modified": sorted(self.modified),
+            "removed": sorted(self.removed),
+            "unchanged": len(self.unchanged),
+        }
+
+
+class IndexManifest:
+    """JSON-backed manifest of indexed files.
+
+    Change detection is two-stage: a file whose size and mtime match its
+    entry is unchanged without being read; otherwise its bytes are hashed, so
+    a touched-but-identical file is still not re-extracted.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path, entries: Optional[Dict[str, ManifestEntry]] = None):
+        """Initialize manifest.
+
+        Args:
+            path: JSON file the manifest is saved to.
+            entries: Initial entries keyed by relative path.
+        """
+        self.path = Path(path)
+        self.entries: Dict[str, ManifestEntry] = entries or {}
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None) -> "IndexManifest":
+        """Load a manifest, or start an empty one if the file does not exist."""
+        path = Path(path) if path is not None else DEFAULT_MANIFEST_PATH
+        if not path.exists():
+            return cls(path)
+
+        with open(path, "r") as f:
+            data = json.load(f)
+        if data.get("version") != cls.VERSION:
+            logger.warning(f"Ignoring index manifest with unsupported version: {path}")
+            return cls(path)
+
+        entries = {
+            key: ManifestEntry(**entry)
+            for key, entry in data.get("files", {}).items()
+        }
+        return cls(path, entries)
+
+    def save(self) -> None:
+        """Write the manifest atomically (temp file + rename)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {
+                    "version": self.VERSION,
+                    "files": {key: asdict(entry) for key, entry in sorted(self.entries.items())},
+                },
+                f,
+                indent=2,
+            )
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        """Forget all entries (call save() to persist)."""
+        self.entries = {}
+
+    def plan(self, files: Dict[str, Tuple[Path, str]]) -> IndexPlan:
+        """Compare files on disk with the manifest.
+
+        Args:
+            files: Discovered files, keyed by relative path, as (absolute path, source type).
+
+        Returns:
+            IndexPlan describing added, modified, unchanged and removed files.
+        """
+        plan = IndexPlan()
+        for key, (path, source_type) in files.items():
+            entry = self.entries.get(key)
+            if entry is None:
+                plan.added[key] = (path, source_type)
+                continue
+
+            stat = path.stat()
+            if (
+                entry.source_type == source_type
+                and entry.size == stat.st_size
+                and entry.mtime == stat.st_mtime
+            ):
+                plan.unchanged.append(key)
+            elif entry.source_type == source_type and entry.content_hash == file_sha256(path):
+                plan.unchanged.append(key)
+                plan.touched[key] = (stat.st_mtime, stat.st_size)
+            else:
+                plan.modified[key] = (path, source_type)
+
+        plan.removed = [key for key in self.entries if key not in files]
+        return plan
+
+    def record(self, key: str, path: Path, source_type: str, chunk_ids: List[str]) -> ManifestEntry:
+        """Record a freshly indexed file."""
+        stat = path.stat()
+        entry = ManifestEntry(
+            path=key,
+            source_type=source_type,
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            content_hash=file_sha256(path),
+            chunk_ids=chunk_ids,
+            indexed_at=datetime.now().isoformat(),
+        )
+        self.entries[key] = entry
+        return entry
+
+    def touch(self, key: str, mtime: float, size: int) -> None:
+        """Refresh the stat fields of an entry whose content is unchanged."""
+        entry = self.entries[key]
+        entry.mtime = mtime
+        entry.size = size
+
+    def remove(self, key: str) -> Optional[ManifestEntry]:
+        """Drop an entry, returning it if present."""
+        return self.entries.pop(key, None)
+
+    def chunk_ids_in_use(self, exclude: Optional[str] = None) -> Set[str]:
+        """All chunk ids referenced by entries other than ``exclude``."""
+        return {
+            chunk_id
+            for key, entry in self.entries.items()
+            if key != exclude
+            for chunk_id in entry.chunk_ids
+        }
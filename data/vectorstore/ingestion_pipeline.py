@@ -0,0 +1,344 @@
+"""Streaming extract -> embed -> store ingestion pipeline.
+
+Indexing used to materialise every chunk of a directory, embed them all, then
+insert them all, so peak memory grew with the corpus and nothing overlapped.
+``IngestionPipeline`` runs the three stages concurrently with bounded queues
+between them:
+
+    PDFExtractor.iter_extract_files  (process pool)
+        -> [extract queue] -> embed workers (filter unchanged, embed)
+        -> [store queue]   -> store workers (PgVectorStore.write_chunks)
+
+A full queue blocks the stage upstream of it (backpressure), so at most
+``queue_size`` batches wait between any two stages and memory stays constant
+however large the drop is. Each stage reports throughput and how long it
+spent working, waiting for input, and blocked on a full downstream queue.
+
+Usage:
+    pipeline = IngestionPipeline(store, embed_workers=4)
+    result = pipeline.run([(Path("a.pdf"), "literature", None)])
+    result["stages"]["embed"]["chunks_per_second"]
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from data.vectorstore.pdf_extractor import PDFExtractor
+from data.vectorstore.pg_vector_store import DocumentChunk, PgVectorStore
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+@dataclass
+class StageMetrics:
+    """Throughput counters for one pipeline stage."""
+
+    name: str
+    workers: int = 1
+    batches: int = 0
+    chunks: int = 0
+    busy_seconds: float = 0.0
+    idle_seconds: float = 0.0  # waiting for input
+    blocked_seconds: float = 0.0  # waiting on a full downstream queue
+    errors: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-friendly dict with derived throughput."""
+        data = asdict(self)
+        for key in ("busy_seconds", "idle_seconds", "blocked_seconds"):
+            data[key] = round(data[key], 3)
+        data["chunks_per_second"] = (
+            round(self.chunks * self.workers / self.busy_seconds, 1) if self.busy_seconds else 0.0
+        )
+        return data
+
+
+@dataclass
+class FileResult:
+    """Outcome of ingesting one source file, passed to on_file_complete."""
+
+    pdf_path: Path
+    source_type: str
+    chunk_ids: List[str] = field(default_factory=list)
+    counts: Dict[str, int] = field(
+        default_factory=lambda: {"inserted": 0, "updated": 0, "skipped": 0}
+    )
+    error: Optional[str] = None
+
+
+class _FileTracker:
+    """Tracks in-flight batches per file and reports files once fully stored."""
+
+    def __init__(self, on_file_complete: Optional[Callable[[FileResult], None]]):
+        self._on_file_complete = on_file_complete
+        self._lock = threading.Lock()
+        self._files: Dict[Path, Dict[str, Any]] = {}
+        self.completed: List[FileResult] = []
+
+    def add_batch(self, pdf_path: Path, source_type: str, chunks: List[DocumentChunk], is_last: bool, error: Optional[str]) -> None:
+        """Register a batch emitted by the extract stage."""
+        with self._lock:
+            state = self._files.setdefault(pdf_path, {
+                "result": FileResult(pdf_path, source_type),
+                "outstanding": 0,
+                "sealed": False,
+            })
+            state["result"].chunk_ids.extend(chunk.chunk_id for chunk in chunks)
+            if chunks:
+                state["outstanding"] += 1
+            if error is not None:
+                state["result"].error = error
+            state["sealed"] = is_last
+            self._maybe_complete(pdf_path)
+
+    def finish_batch(self, pdf_path: Path, counts: Optional[Dict[str, int]] = None, error: Optional[str] = None) -> None:
+        """Record that a batch was stored (or failed) downstream."""
+        with self._lock:
+            state = self._files[pdf_path]
+            state["outstanding"] -= 1
+            if counts:
+                for key, value in counts.items():
+                    state["result"].counts[key] += value
+            if error is not None and state["result"].error is None:
+                state["result"].error = error
+            self._maybe_complete(pdf_path)
+
+    def _maybe_complete(self, pdf_path: Path) -> None:
+        """Report a file once sealed with no outstanding batches. Caller holds the lock."""
+        state = self._files[pdf_path]
+        if not state["sealed"] or state["outstanding"]:
+            return
+        result = self._files.pop(pdf_path)["result"]
+        result.chunk_ids = list(dict.fromkeys(result.chunk_ids))
+        self.completed.append(result)
+        if self._on_file_complete is not None:
+            try:
+                self._on_file_complete(result)
+            except Exception as e:
+                logger.error(f"on_file_complete failed for {pdf_path.name}: {e}")
+
+
+class IngestionPipeline:
+    """Concurrent, backpressured PDF ingestion into a PgVectorStore.
+
+    Embedding skips chunks whose content is already stored (see
+    ``PgVectorStore.filter_unchanged``), so re-ingesting unchanged files costs
+    only the hash lookups.
+    """
+
+    def __init__(
+        self,
+        store: PgVectorStore,
+        extractor: Optional[PDFExtractor] = None,
+        extract_workers: Optional[int] = None,
+        embed_workers: int = 2,
+        store_workers: int = 1,
+        batch_size: int = 64,
+        queue_size: int = 4,
+        pages_per_task: int = 50
+    ):
+        """Initialize ingestion pipeline.
+
+        Args:
+            store: Destination vector store (its embedding_function embeds).
+            extractor: PDF extractor. Defaults to PDFExtractor().
+            extract_workers: Extraction processes. Defaults to the CPU count.
+            embed_workers: Threads issuing embedding requests concurrently.
+            store_workers: Threads writing to the database concurrently.
+            batch_size: Chunks per batch flowing through the pipeline (one
+                embedding call and one INSERT per batch).
+            queue_size: Maximum batches waiting between two stages.
+            pages_per_task: Page-range size for splitting large PDFs.
+        """
+        if embed_workers < 1 or store_workers < 1:
+            raise ValueError("embed_workers and store_workers must be at least 1")
+        if batch_size < 1 or queue_size < 1:
+            raise ValueError("batch_size and queue_size must be positive")
+
+        self.store = store
+        self.extractor = extractor or PDFExtractor()
+        self.extract_workers = extract_workers
+        self.embed_workers = embed_workers
+        self.store_workers = store_workers
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.pages_per_task = pages_per_task
+
+    def run(
+        self,
+        files: List[Tuple[Path, str, Optional[dict]]],
+        on_file_complete: Optional[Callable[[FileResult], None]] = None
+    ) -> Dict[str, Any]:
+        """Ingest files, returning totals and per-stage metrics.
+
+        Args:
+            files: (PDF path, source type, extra chunk metadata) per file.
+            on_file_complete: Called (serially) once every chunk of a file has
+                been stored, or the file failed. Use it to update an index
+                manifest as files finish.
+
+        Returns:
+            Dictionary with 'inserted', 'updated', 'skipped', 'files',
+            'failed_files', 'wall_seconds' and per-stage metrics under 'stages'.
+        """
+        start = time.perf_counter()
+        tracker = _FileTracker(on_file_complete)
+        extract_queue: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+        store_queue: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+        metrics = {
+            "extract": StageMetrics("extract", workers=1),
+            "embed": StageMetrics("embed", workers=self.embed_workers),
+            "store": StageMetrics("store", workers=self.store_workers),
+        }
+        metrics_lock = threading.Lock()
+        failure: List[BaseException] = []
+
+        def put(q: "queue.Queue[Any]", item: Any, stage: StageMetrics) -> None:
+            t0 = time.perf_counter()
+            q.put(item)
+            with metrics_lock:
+                stage.blocked_seconds += time.perf_counter() - t0
+
+        def get(q: "queue.Queue[Any]", stage: StageMetrics) -> Any:
+            t0 = time.perf_counter()
+            item = q.get()
+            with metrics_lock:
+                stage.idle_seconds += time.perf_counter() - t0
+            return item
+
+        def extract_stage() -> None:
+            stage = metrics["extract"]
+            batches = self.extractor.iter_extract_files(
+                files,
+                n_workers=self.extract_workers,
+                batch_size=self.batch_size,
+                pages_per_task=self.pages_per_task,
+            )
+            try:
+                while True:
+                    t0 = time.perf_counter()
+                    file_batch = next(batches, None)
+                    stage.busy_seconds += time.perf_counter() - t0
+                    if file_batch is None:
+                        break
+                    if file_batch.error is not None:
+                        stage.errors += 1
+                        logger.warning(f"Skipping {file_batch.pdf_path.name}: {file_batch.error}")
+                    tracker.add_batch(
+                        file_batch.pdf_path,
+                        file_batch.source_type,
+                        file_batch.chunks,
+                        file_batch.is_last,
+                        file_batch.error,
+                    )
+                    if file_batch.chunks:
+                        stage.batches += 1
+                        stage.chunks += len(file_batch.chunks)
+                        put(extract_queue, file_batch, stage)
+            except BaseException as e:
+                failure.append(e)
+            finally:
+                batches.close()
+                for _ in range(self.embed_workers):
+                    extract_queue.put(_DONE)
+
+        def embed_stage() -> None:
+            stage = metrics["embed"]
+            while True:
+                file_batch = get(extract_queue, stage)
+                if file_batch is _DONE:
+                    return
+                t0 = time.perf_counter()
+                try:
+                    pending, counts = self.store.filter_unchanged(file_batch.chunks)
+                    embeddings = (
+                        self.store.embedding_function([chunk.content for chunk in pending])
+                        if pending else []
+                    )
+                except Exception as e:
+                    with metrics_lock:
+                        stage.errors += 1
+                        stage.busy_seconds += time.perf_counter() - t0
+                    logger.error(f"Error embedding batch from {file_batch.pdf_path.name}: {e}")
+                    tracker.finish_batch(file_batch.pdf_path, error=str(e))
+                    continue
+                with metrics_lock:
+                    stage.busy_seconds += time.perf_counter() - t0
+                    stage.batches += 1
+                    stage.chunks += len(pending)
+                put(store_queue, (file_batch.pdf_path, pending, embeddings, counts), stage)
+
+        def store_stage() -> None:
+            stage = metrics["store"]
+            while True:
+                item = get(store_queue, stage)
+                if item is _DONE:
+                    return
+                pdf_path, pending, embeddings, counts = item
+                t0 = time.perf_counter()
+                try:
+                    written = self.store.write_chunks(pending, embeddings)
+                except Exception as e:
+                    with metrics_lock:
+                        stage.errors += 1
+                        stage.busy_seconds += time.perf_counter() - t0
+                    logger.error(f"Error storing batch from {pdf_path.name}: {e}")
+                    tracker.finish_batch(pdf_path, error=str(e))
+                    continue
+                with metrics_lock:
+                    stage.busy_seconds += time.perf_counter() - t0
+                    stage.batches += 1
+                    stage.chunks += written
+                tracker.finish_batch(pdf_path, counts=counts)
+
+        extract_thread = threading.Thread(target=extract_stage, name="ingest-extract", daemon=True)
+        embed_threads = [
+            threading.Thread(target=embed_stage, name=f"ingest-embed-{i}", daemon=True)
+            for i in range(self.embed_workers)
+        ]
+        store_threads = [
+            threading.Thread(target=store_stage, name=f"ingest-store-{i}", daemon=True)
+            for i in range(self.store_workers)
+        ]
+        for thread in [extract_thread, *embed_threads, *store_threads]:
+            thread.start()
+
+        extract_thread.join()
+        for thread in embed_threads:
+            thread.join()
+        for _ in store_threads:
+            store_queue.put(_DONE)
+        for thread in store_threads:
+            thread.join()
+
+        if failure:
+            raise failure[0]
+
+        totals = {"inserted": 0, "updated": 0, "skipped": 0}
+        failed_files = []
+        for result in tracker.completed:
+            for key in totals:
+                totals[key] += result.counts[key]
+            if result.error is not None:
+                failed_files.append(str(result.pdf_path))
+
+        wall_seconds = time.perf_counter() - start
+        summary = {
+            **totals,
+            "files": len(tracker.completed),
+            "failed_files": failed_files,
+            "wall_seconds": round(wall_seconds, 3),
+            "stages": {name: stage.to_dict() for name, stage in metrics.items()},
+        }
+        logger.info(
+            f"Ingested {summary['files']} files in {summary['wall_seconds']}s: "
+            f"{totals['inserted']} inserted, {totals['updated']} updated, {totals['skipped']} unchanged"
+        )
+        return summary
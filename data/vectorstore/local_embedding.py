@@ -0,0 +1,90 @@
+"""Deterministic, offline embedding function.
+
+``HashingEmbeddingFunction`` maps text to a fixed-size vector by feature
+hashing word unigrams and bigrams (signed, L2-normalised). It needs no
+network or API key and always returns the same vector for the same text, so
+it stands in for Gemini embeddings in benchmarks and local development.
+Texts that share words land close together, which gives the vector index a
+realistic neighbourhood structure, unlike random vectors.
+
+Select it with EMBEDDING_BACKEND=local, or pass it explicitly:
+    embed = HashingEmbeddingFunction(dimension=768)
+    store = PgVectorStore(database_url, embedding_function=embed)
+"""
+
+import hashlib
+import re
+from typing import List
+
+import numpy as np
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+class HashingEmbeddingFunction:
+    """Feature-hashing embedding backend ("local"; see ``EmbeddingFunction``)."""
+
+    BIGRAM_WEIGHT = 0.5
+
+    def __init__(self, dimension: int = 768):
+        """Initialize hashing embedding function.
+
+        Args:
+            dimension: Output vector size (match the vector column dimension).
+        """
+        if dimension < 1:
+            raise ValueError("dimension must be positive")
+        self._dimension = dimension
+        self.model = f"local-hashing-v1-{dimension}"
+
+    @property
+    def dimension(self) -> int:
+        """Return embedding dimension."""
+        return self._dimension
+
+    def _bucket(self, feature: str) -> tuple:
+        """Stable (index, sign) for a feature; Python's hash() is salted per process."""
+        digest = int.from_bytes(
+            hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little"
+        )
+        return digest % self._dimension, 1.0 if (digest >> 63) & 1 else -1.0
+
+    def _embed(self, text: str) -> List[float]:
+        """Embed one text."""
+        vector = np.zeros(self._dimension)
+        tokens = _TOKEN_PATTERN.findall(text.lower())
+        for token in tokens:
+            index, sign = self._bucket(token)
+            vector[index] += sign
+        for left, right in zip(tokens, tokens[1:]):
+            index, sign = self._bucket(f"{left} {right}")
+            vector[index] += sign * self.BIGRAM_WEIGHT
+
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector.tolist()
+
+    def __call__(self, input: List[str]) -> List[List[float]]:
+        """Generate embeddings for a list of texts.
+
+        Args:
+            input: List of text strings to embed.
+
+        Returns:
+            List of embedding vectors (zero vectors for texts without words).
+        """
+        return [self._embed(text) for text in input]
+
+    def embed_query(self, query: str) -> List[float]:
+        """Generate embedding for a search query.
+
+        Args:
+            query: Search query text.
+
+        Returns:
+            Embedding vector.
+        """
+        if not query or not query.strip():
+            raise ValueError("Query cannot be empty")
+        return self._embed(query)
@@ -4,19 +4,36 @@ This module provides utilities for:
 - Extracting text from PDF documents
 - Chunking text for optimal retrieval
 - Creating DocumentChunk objects for vector store
+- Parallel extraction across a process pool, streamed as chunk batches
 """
 
 import fitz  # PyMuPDF
+import os
+from collections import deque
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Generator
+from typing import Any, Dict, Iterator, List, Optional, Generator, Tuple
 import logging
 import re
 
 from data.vectorstore.pg_vector_store import DocumentChunk
+from data.vectorstore.index_manifest import IndexManifest
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class FileBatch:
+    """A batch of chunks from one source file, as streamed by iter_extract_files."""
+
+    pdf_path: Path
+    source_type: str
+    chunks: List[DocumentChunk]
+    is_last: bool = False  # no more batches follow for this file
+    error: Optional[str] = None  # set if the file could not be extracted
+
+
 class PDFExtractor:
     """Extract and chunk text from PDF documents.
 
@@ -62,14 +79,39 @@ class PDFExtractor:
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
-        chunks = []
-        metadata = metadata or {}
-
         try:
-            doc = fitz.open(str(pdf_path))
+            page_chunks = self._extract_page_chunks(pdf_path)
+            chunks = self._build_chunks(pdf_path, source_type, page_chunks, metadata)
+            logger.info(f"Extracted {len(chunks)} chunks from {pdf_path.name}")
 
-            for page_num, page in enumerate(doc, start=1):
-                page_text = page.get_text("text")
+        except Exception as e:
+            logger.error(f"Error extracting PDF {pdf_path}: {e}")
+            raise
+
+        return chunks
+
+    def _extract_page_chunks(
+        self,
+        pdf_path: Path,
+        page_start: int = 0,
+        page_end: Optional[int] = None
+    ) -> List[Tuple[int, List[str]]]:
+        """Extract, clean and chunk the text of a range of pages.
+
+        Args:
+            pdf_path: Path to PDF file.
+            page_start: First page (0-based, inclusive).
+            page_end: Last page (0-based, exclusive). Defaults to the end.
+
+        Returns:
+            List of (1-based page number, chunk texts) for non-empty pages.
+        """
+        page_chunks = []
+        doc = fitz.open(str(pdf_path))
+        try:
+            page_end = doc.page_count if page_end is None else min(page_end, doc.page_count)
+            for page_index in range(page_start, page_end):
+                page_text = doc[page_index].get_text("text")
 
                 # Clean text
                 page_text = self._clean_text(page_text)
@@ -78,29 +120,35 @@ class PDFExtractor:
                     continue
 
                 # Create chunks from page
-                page_chunks = self._chunk_text(page_text)
-
-                for chunk_idx, chunk_text in enumerate(page_chunks):
-                    chunk = DocumentChunk(
-                        content=chunk_text,
-                        source_file=str(pdf_path.name),
-                        source_type=source_type,
-                        page_number=page_num,
-                        chunk_index=len(chunks),
-                        metadata={
-                            "page_chunk_index": chunk_idx,
-                            **metadata
-                        }
-                    )
-                    chunks.append(chunk)
-
+                page_chunks.append((page_index + 1, self._chunk_text(page_text)))
+        finally:
             doc.close()
-            logger.info(f"Extracted {len(chunks)} chunks from {pdf_path.name}")
-
-        except Exception as e:
-            logger.error(f"Error extracting PDF {pdf_path}: {e}")
-            raise
+        return page_chunks
 
+    @staticmethod
+    def _build_chunks(
+        pdf_path: Path,
+        source_type: str,
+        page_chunks: List[Tuple[int, List[str]]],
+        metadata: Optional[dict] = None
+    ) -> List[DocumentChunk]:
+        """Number per-page chunk texts into DocumentChunks for one file."""
+        chunks = []
+        metadata = metadata or {}
+        for page_num, texts in page_chunks:
+            for chunk_idx, chunk_text in enumerate(texts):
+                chunk = DocumentChunk(
+                    content=chunk_text,
+                    source_file=str(pdf_path.name),
+                    source_type=source_type,
+                    page_number=page_num,
+                    chunk_index=len(chunks),
+                    metadata={
+                        "page_chunk_index": chunk_idx,
+                        **metadata
+                    }
+                )
+                chunks.append(chunk)
         return chunks
 
     def extract_directory(
@@ -108,7 +156,8 @@ class PDFExtractor:
         directory: str,
         source_type: str,
         pattern: str = "*.pdf",
-        recursive: bool = False
+        recursive: bool = False,
+        n_workers: int = 1
     ) -> List[DocumentChunk]:
         """Extract all PDFs from a directory.
 
@@ -117,6 +166,7 @@ class PDFExtractor:
             source_type: Type of documents.
             pattern: Glob pattern for PDF files.
             recursive: If True, search subdirectories recursively.
+            n_workers: Worker processes; above 1 uses iter_extract_directory.
 
         Returns:
             List of DocumentChunk objects from all PDFs.
@@ -125,6 +175,14 @@ class PDFExtractor:
         if not dir_path.exists():
             raise FileNotFoundError(f"Directory not found: {directory}")
 
+        if n_workers > 1:
+            all_chunks = []
+            for batch in self.iter_extract_directory(
+                directory, source_type, pattern=pattern, recursive=recursive, n_workers=n_workers
+            ):
+                all_chunks.extend(batch)
+            return all_chunks
+
         all_chunks = []
         glob_pattern = f"**/{pattern}" if recursive else pattern
         pdf_files = list(dir_path.glob(glob_pattern))
@@ -144,6 +202,214 @@ class PDFExtractor:
         logger.info(f"Extracted {len(all_chunks)} total chunks from {len(pdf_files)} PDFs")
         return all_chunks
 
+    def iter_extract_directory(
+        self,
+        directory: str,
+        source_type: str,
+        pattern: str = "*.pdf",
+        recursive: bool = False,
+        n_workers: Optional[int] = None,
+        batch_size: int = 256,
+        pages_per_task: int = 50
+    ) -> Iterator[List[DocumentChunk]]:
+        """Extract all PDFs from a directory in parallel, streaming chunk batches.
+
+        See ``iter_extract_pdfs``.
+        """
+        dir_path = Path(directory)
+        if not dir_path.exists():
+            raise FileNotFoundError(f"Directory not found: {directory}")
+
+        glob_pattern = f"**/{pattern}" if recursive else pattern
+        pdf_files = sorted(dir_path.glob(glob_pattern))
+        yield from self.iter_extract_pdfs(
+            pdf_files,
+            source_type,
+            metadata={"source_directory": str(directory)},
+            n_workers=n_workers,
+            batch_size=batch_size,
+            pages_per_task=pages_per_task,
+        )
+
+    def iter_extract_pdfs(
+        self,
+        pdf_paths: List[Path],
+        source_type: str,
+        metadata: Optional[dict] = None,
+        n_workers: Optional[int] = None,
+        batch_size: int = 256,
+        pages_per_task: int = 50
+    ) -> Iterator[List[DocumentChunk]]:
+        """Extract PDFs across a process pool, streaming chunk batches.
+
+        Files that fail to open or extract are logged and skipped, as in
+        ``extract_directory``. See ``iter_extract_files`` for the scheduling.
+
+        Args:
+            pdf_paths: PDF files to extract.
+            source_type: Type of documents.
+            metadata: Additional metadata to include in chunks.
+            n_workers: Worker processes. Defaults to the CPU count; 1 extracts
+                in-process.
+            batch_size: Maximum chunks per yielded batch.
+            pages_per_task: Page-range size for splitting large files.
+
+        Yields:
+            Lists of at most batch_size DocumentChunk objects.
+        """
+        files = [(Path(pdf_path), source_type, metadata) for pdf_path in pdf_paths]
+        for file_batch in self.iter_extract_files(
+            files, n_workers=n_workers, batch_size=batch_size, pages_per_task=pages_per_task
+        ):
+            if file_batch.error is not None:
+                logger.warning(f"Skipping {file_batch.pdf_path.name}: {file_batch.error}")
+            elif file_batch.chunks:
+                yield file_batch.chunks
+
+    def iter_extract_files(
+        self,
+        files: List[Tuple[Path, str, Optional[dict]]],
+        n_workers: Optional[int] = None,
+        batch_size: int = 256,
+        pages_per_task: int = 50
+    ) -> Iterator["FileBatch"]:
+        """Extract PDFs across a process pool, streaming per-file chunk batches.
+
+        Each file, or each ``pages_per_task`` page range of a large file, is
+        one pool task. At most ``2 * n_workers`` tasks are in flight, and
+        results are consumed in submission order, so memory stays bounded and
+        the first batches are available to embed while later files are still
+        being extracted. Chunks are identical to ``extract_pdf`` output.
+
+        Batches never span files, and every file ends with exactly one batch
+        marked ``is_last`` (empty for files without text, or carrying
+        ``error`` if the file could not be extracted).
+
+        Args:
+            files: (PDF path, source type, extra metadata) per file.
+            n_workers: Worker processes. Defaults to the CPU count; 1 extracts
+                in-process.
+            batch_size: Maximum chunks per yielded batch.
+            pages_per_task: Page-range size for splitting large files.
+
+        Yields:
+            FileBatch objects in file order.
+        """
+        if batch_size < 1 or pages_per_task < 1:
+            raise ValueError("batch_size and pages_per_task must be positive")
+
+        n_workers = n_workers or os.cpu_count() or 1
+        config = (self.chunk_size, self.chunk_overlap, self.min_chunk_size)
+
+        # (file index, page_start, page_end, is last range of the file)
+        tasks = []
+        open_errors = {}
+        for file_index, (pdf_path, _, _) in enumerate(files):
+            try:
+                with fitz.open(str(pdf_path)) as doc:
+                    page_count = doc.page_count
+            except Exception as e:
+                open_errors[file_index] = e
+                tasks.append((file_index, 0, 0, True))
+                continue
+            starts = list(range(0, page_count, pages_per_task)) or [0]
+            for i, page_start in enumerate(starts):
+                tasks.append((file_index, page_start, page_start + pages_per_task, i == len(starts) - 1))
+
+        def submit_args(task):
+            file_index, page_start, page_end, _ = task
+            return config, Path(files[file_index][0]), page_start, page_end
+
+        if n_workers == 1:
+            def results() -> Iterator[Any]:
+                for task in tasks:
+                    if task[0] in open_errors:
+                        yield open_errors[task[0]]
+                        continue
+                    try:
+                        yield _extract_page_range(*submit_args(task))
+                    except Exception as e:
+                        yield e
+
+            yield from self._batch_file_results(files, tasks, results(), batch_size)
+            return
+
+        executor = ProcessPoolExecutor(max_workers=n_workers)
+        try:
+            pending = deque()
+            task_iter = iter(tasks)
+
+            def submit_next() -> bool:
+                for task in task_iter:
+                    if task[0] in open_errors:
+                        pending.append(open_errors[task[0]])
+                    else:
+                        pending.append(executor.submit(_extract_page_range, *submit_args(task)))
+                    return True
+                return False
+
+            def results() -> Iterator[Any]:
+                while len(pending) < 2 * n_workers and submit_next():
+                    pass
+                while pending:
+                    future = pending.popleft()
+                    if isinstance(future, Exception):
+                        yield future
+                    else:
+                        try:
+                            yield future.result()
+                        except Exception as e:
+                            yield e
+                    submit_next()
+
+            yield from self._batch_file_results(files, tasks, results(), batch_size)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _batch_file_results(
+        self,
+        files: List[Tuple[Path, str, Optional[dict]]],
+        tasks: List[Tuple[int, int, int, bool]],
+        results: Iterator[Any],
+        batch_size: int
+    ) -> Iterator["FileBatch"]:
+        """Reassemble ordered page-range results per file and yield FileBatches."""
+        file_pages: List[Tuple[int, List[str]]] = []
+        error = None
+        total_chunks = 0
+        n_files = 0
+
+        for (file_index, _, _, last_range), result in zip(tasks, results):
+            if isinstance(result, Exception):
+                error = error or result
+            elif error is None:
+                file_pages.extend(result)
+
+            if not last_range:
+                continue
+
+            pdf_path, source_type, metadata = files[file_index]
+            pdf_path = Path(pdf_path)
+            if error is not None:
+                yield FileBatch(pdf_path, source_type, [], is_last=True, error=str(error))
+            else:
+                chunks = self._build_chunks(pdf_path, source_type, file_pages, metadata)
+                logger.info(f"Extracted {len(chunks)} chunks from {pdf_path.name}")
+                total_chunks += len(chunks)
+                n_files += 1
+                starts = list(range(0, len(chunks), batch_size)) or [0]
+                for i in starts:
+                    yield FileBatch(
+                        pdf_path,
+                        source_type,
+                        chunks[i:i + batch_size],
+                        is_last=i == starts[-1]
+                    )
+            file_pages = []
+            error = None
+
+        logger.info(f"Extracted {total_chunks} total chunks from {n_files} PDFs")
+
     def _clean_text(self, text: str) -> str:
         """Clean extracted text.
 
@@ -218,66 +484,167 @@ class PDFExtractor:
         return chunks
 
 
+def _extract_page_range(
+    config: Tuple[int, int, int],
+    pdf_path: Path,
+    page_start: int,
+    page_end: int
+) -> List[Tuple[int, List[str]]]:
+    """Pool task: extract and chunk one page range (module-level so it pickles)."""
+    return PDFExtractor(*config)._extract_page_chunks(pdf_path, page_start, page_end)
+
+
+# Source directories under the data root: (source type, search subdirectories)
+SOURCE_DIRECTORIES = (
+    ("protocol", False),
+    ("literature", False),
+    ("registry", True),  # registry PDFs may be in subdirectories
+)
+
+
+def discover_source_files(
+    base_data_path: Path,
+    pattern: str = "*.pdf"
+) -> Dict[str, Tuple[Path, str]]:
+    """Find indexable PDFs under the data root.
+
+    Args:
+        base_data_path: Base path to data directory.
+        pattern: Glob pattern for PDF files.
+
+    Returns:
+        Mapping of path relative to base_data_path to (absolute path, source type).
+    """
+    files = {}
+    for source_type, recursive in SOURCE_DIRECTORIES:
+        source_dir = base_data_path / source_type
+        if not source_dir.exists():
+            continue
+        glob_pattern = f"**/{pattern}" if recursive else pattern
+        for pdf_file in sorted(source_dir.glob(glob_pattern)):
+            files[pdf_file.relative_to(base_data_path).as_posix()] = (pdf_file, source_type)
+    return files
+
+
 def index_all_documents(
     base_data_path: Optional[str] = None,
-    force_reindex: bool = False
+    force_reindex: bool = False,
+    manifest_path: Optional[str] = None,
+    dry_run: bool = False,
+    extract_workers: Optional[int] = None,
+    embed_workers: int = 2
 ) -> dict:
     """Index all documents into the vector store.
 
+    Indexing is incremental: a manifest records each indexed PDF's size,
+    mtime, content hash and chunk ids, so re-runs only extract added or
+    modified PDFs and delete the chunks of removed ones. Added and modified
+    PDFs stream through an IngestionPipeline, and each file is recorded in
+    the manifest as soon as all of its chunks are stored.
+
     Args:
         base_data_path: Base path to data directory.
                        Defaults to data/raw/.
         force_reindex: Clear existing collections and reindex.
+        manifest_path: Manifest JSON file. Defaults to data/vectorstore/index_manifest.json.
+        dry_run: Only report the planned work; reads the vector store
+                 (to plan exactly as a real run would) but writes neither
+                 it nor the manifest.
+        extract_workers: PDF extraction processes (defaults to the CPU count).
+        embed_workers: Concurrent embedding threads in the ingestion pipeline.
 
     Returns:
-        Dictionary with indexing statistics.
+        Dictionary with chunk counts per source type, totals of 'inserted',
+        'updated', 'skipped' (unchanged, not re-embedded) and 'deleted'
+        chunks, the file-level plan under 'files', and per-stage ingestion
+        metrics under 'pipeline' when files were processed.
     """
     from data.vectorstore import get_vector_store
+    from data.vectorstore.ingestion_pipeline import FileResult, IngestionPipeline
 
     if base_data_path is None:
         base_data_path = Path(__file__).parent.parent / "raw"
     else:
         base_data_path = Path(base_data_path)
 
-    store = get_vector_store(force_new=force_reindex)
-    extractor = PDFExtractor()
+    manifest = IndexManifest.load(manifest_path)
+    if force_reindex:
+        manifest.clear()
 
+    # A dry run plans against the same (possibly cleared) manifest as a real
+    # run, but only in memory: it is never saved and the store is only read.
+    store = get_vector_store(force_new=force_reindex and not dry_run)
     if force_reindex:
-        store.clear_all()
+        if not dry_run:
+            store.clear_all()
+    elif manifest.entries and store.get_collection_stats().get("all", 0) == 0:
+        logger.warning("Vector store is empty but the index manifest is not; reindexing everything")
+        manifest.clear()
+
+    plan = manifest.plan(discover_source_files(base_data_path))
 
     stats = {
         "protocol": 0,
         "literature": 0,
-        "registry": 0
+        "registry": 0,
+        "inserted": 0,
+        "updated": 0,
+        "skipped": 0,
+        "deleted": 0,
+        "files": plan.summary(),
+        "dry_run": dry_run
     }
 
-    # Index protocol documents
-    protocol_dir = base_data_path / "protocol"
-    if protocol_dir.exists():
-        try:
-            chunks = extractor.extract_directory(str(protocol_dir), "protocol")
-            stats["protocol"] = store.add_documents(chunks)
-        except Exception as e:
-            logger.error(f"Error indexing protocol: {e}")
-
-    # Index literature documents
-    literature_dir = base_data_path / "literature"
-    if literature_dir.exists():
+    if dry_run:
+        logger.info(f"Dry run, planned work: {stats['files']}")
+        return stats
+
+    keys = {pdf_path: key for key, (pdf_path, _) in {**plan.added, **plan.modified}.items()}
+
+    def record_file(result: FileResult) -> None:
+        key = keys[result.pdf_path]
+        if result.error is not None:
+            logger.error(f"Error indexing {key}: {result.error}")
+            return
+        stats[result.source_type] += sum(result.counts.values())
+        for count_key, value in result.counts.items():
+            stats[count_key] += value
+
+        previous = manifest.entries.get(key)
+        if previous is not None:
+            stale = set(previous.chunk_ids) - set(result.chunk_ids) - manifest.chunk_ids_in_use(exclude=key)
+            stats["deleted"] += store.delete_chunks(sorted(stale))
+
+        manifest.record(key, result.pdf_path, result.source_type, result.chunk_ids)
+        manifest.save()
+
+    if keys:
+        pipeline = IngestionPipeline(store, extract_workers=extract_workers, embed_workers=embed_workers)
+        pipeline_stats = pipeline.run(
+            [
+                (pdf_path, source_type, {"source_directory": str(base_data_path / source_type)})
+                for pdf_path, source_type in {**plan.added, **plan.modified}.values()
+            ],
+            on_file_complete=record_file,
+        )
+        stats["pipeline"] = {
+            "wall_seconds": pipeline_stats["wall_seconds"],
+            "stages": pipeline_stats["stages"],
+        }
+
+    for key in plan.removed:
         try:
-            chunks = extractor.extract_directory(str(literature_dir), "literature")
-            stats["literature"] = store.add_documents(chunks)
+            stale = set(manifest.entries[key].chunk_ids) - manifest.chunk_ids_in_use(exclude=key)
+            stats["deleted"] += store.delete_chunks(sorted(stale))
+            manifest.remove(key)
+            manifest.save()
         except Exception as e:
-            logger.error(f"Error indexing literature: {e}")
+            logger.error(f"Error removing chunks of {key}: {e}")
 
-    # Index registry documents (PDFs may be in subdirectories)
-    registry_dir = base_data_path / "registry"
-    if registry_dir.exists():
-        try:
-            # PDFs in registry - search recursively for subdirectories
-            chunks = extractor.extract_directory(str(registry_dir), "registry", recursive=True)
-            stats["registry"] = store.add_documents(chunks)
-        except Exception as e:
-            logger.error(f"Error indexing registry: {e}")
+    if plan.touched:
+        for key, (mtime, size) in plan.touched.items():
+            manifest.touch(key, mtime, size)
+        manifest.save()
 
     logger.info(f"Indexing complete: {stats}")
     return stats
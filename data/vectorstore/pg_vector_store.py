@@ -10,18 +10,29 @@ Architecture:
 """
 
 import os
+import re
 import hashlib
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Protocol, TYPE_CHECKING
 from dataclasses import dataclass, field
 import logging
 
+import numpy as np
 import psycopg2
 from psycopg2.extras import execute_values, RealDictCursor
 from pgvector.psycopg2 import register_vector
 import google.generativeai as genai
 from dotenv import load_dotenv
 
+from app.config import settings
+from data.vectorstore.connection_pool import VectorConnectionPool
+from data.vectorstore.embedding_cache import EmbeddingCache, get_embedding_cache
+from data.vectorstore.local_embedding import HashingEmbeddingFunction
+from data.vectorstore.reranking import mmr_rerank
+
+if TYPE_CHECKING:
+    from data.vectorstore.async_vector_store import AsyncPgVectorStore
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
@@ -46,14 +57,38 @@ class DocumentChunk:
         return f"{self.source_type}_{Path(self.source_file).stem}_{self.chunk_index}_{content_hash}"
 
 
+class EmbeddingFunction(Protocol):
+    """Interface every embedding backend implements.
+
+    ``model`` identifies the vectors a backend produces; it is part of each
+    chunk's content hash, so switching backends re-embeds on the next index run.
+    """
+
+    model: str
+
+    @property
+    def dimension(self) -> int: ...
+
+    def __call__(self, input: List[str]) -> List[List[float]]: ...
+
+    def embed_query(self, query: str) -> List[float]: ...
+
+
 class GeminiEmbeddingFunction:
     """Custom embedding function using Gemini text-embedding-004."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    QUERY_TASK_TYPE = "retrieval_query"
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[EmbeddingCache] = None
+    ):
         """Initialize Gemini embedding function.
 
         Args:
             api_key: Gemini API key. If not provided, reads from GEMINI_API_KEY env var.
+            cache: Query embedding cache. Defaults to the shared cache (None if disabled).
         """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
@@ -62,6 +97,7 @@ class GeminiEmbeddingFunction:
         genai.configure(api_key=self.api_key)
         self.model = "models/text-embedding-004"
         self._dimension = 768  # text-embedding-004 output dimension
+        self.cache = cache if cache is not None else get_embedding_cache()
 
     @property
     def dimension(self) -> int:
@@ -112,17 +148,57 @@ class GeminiEmbeddingFunction:
         if not query or not query.strip():
             raise ValueError("Query cannot be empty")
 
+        if self.cache is not None:
+            cached = self.cache.get(self.model, self.QUERY_TASK_TYPE, query)
+            if cached is not None:
+                return cached
+
         try:
             result = genai.embed_content(
                 model=self.model,
                 content=query,
-                task_type="retrieval_query"
+                task_type=self.QUERY_TASK_TYPE
             )
-            return result['embedding']
         except Exception as e:
             logger.error(f"Error generating query embedding: {e}")
             raise RuntimeError(f"Failed to generate embedding for query: {e}") from e
 
+        embedding = result['embedding']
+        if self.cache is not None:
+            self.cache.put(self.model, self.QUERY_TASK_TYPE, query, embedding)
+        return embedding
+
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Get query embedding cache counters, or None if caching is off."""
+        return self.cache.get_stats() if self.cache is not None else None
+
+
+EMBEDDING_BACKENDS = ("gemini", "local")
+
+
+def create_embedding_function(
+    backend: Optional[str] = None,
+    dimension: Optional[int] = None
+) -> EmbeddingFunction:
+    """Create the configured embedding backend.
+
+    Args:
+        backend: 'gemini' (text-embedding-004, needs GEMINI_API_KEY and network)
+            or 'local' (deterministic feature hashing, offline). Defaults to
+            EMBEDDING_BACKEND.
+        dimension: Vector size for the local backend. Defaults to
+            EMBEDDING_DIMENSION. Gemini vectors are always 768-dimensional.
+
+    Returns:
+        Embedding function for PgVectorStore and VectorService.
+    """
+    backend = backend or settings.embedding_backend
+    if backend == "gemini":
+        return GeminiEmbeddingFunction()
+    if backend == "local":
+        return HashingEmbeddingFunction(dimension or settings.embedding_dimension)
+    raise ValueError(f"Unknown embedding backend: {backend}. Expected one of {EMBEDDING_BACKENDS}")
+
 
 class PgVectorStore:
     """PostgreSQL-based vector store using pgvector for document retrieval.
@@ -144,26 +220,63 @@ class PgVectorStore:
     """
 
     TABLE_NAME = "document_embeddings"
+    TEXT_SEARCH_CONFIG = "english"
+    SEARCH_MODES = ("vector", "hybrid")
+    RRF_K = 60  # reciprocal rank fusion damping constant
+    # Maximal Marginal Relevance defaults for search_diverse
+    MMR_LAMBDA = 0.5  # 1.0 = relevance only, 0.0 = diversity only
+    MMR_FETCH_FACTOR = 4  # candidate pool size per requested result
+    HNSW_M = 16
+    HNSW_EF_CONSTRUCTION = 64
+    # ANN index layouts. Full vectors always stay in the table for re-ranking;
+    # compact modes only shrink the HNSW index, which is what must fit in RAM.
+    STORAGE_MODES = ("full", "halfvec", "binary")
+    # Candidates fetched from a compact index per requested result, re-ranked exactly
+    RERANK_FACTORS = {"full": 1, "halfvec": 2, "binary": 10}
+    COMPACT_MIN_PGVECTOR = (0, 7, 0)  # halfvec and binary_quantize
 
     def __init__(
         self,
         database_url: Optional[str] = None,
-        embedding_function: Optional[GeminiEmbeddingFunction] = None
+        embedding_function: Optional[EmbeddingFunction] = None,
+        storage_mode: Optional[str] = None
     ):
         """Initialize PostgreSQL vector store.
 
         Args:
             database_url: PostgreSQL connection URL. Defaults to DATABASE_URL env var.
-            embedding_function: Custom embedding function. Defaults to GeminiEmbeddingFunction.
+            embedding_function: Custom embedding function. Defaults to the
+                EMBEDDING_BACKEND backend (see ``create_embedding_function``).
+            storage_mode: ANN index layout: 'full', 'halfvec' or 'binary'.
+                Defaults to VECTOR_STORAGE_MODE. Compact layouts are only used
+                once ``migrate_storage_mode`` has built their index; until then
+                the store uses 'full'.
         """
         self.database_url = database_url or os.getenv("DATABASE_URL")
         if not self.database_url:
             raise ValueError("DATABASE_URL not found in environment variables")
 
-        self.embedding_function = embedding_function or GeminiEmbeddingFunction()
+        self.storage_mode = storage_mode or settings.vector_storage_mode
+        if self.storage_mode not in self.STORAGE_MODES:
+            raise ValueError(
+                f"Unknown storage mode: {self.storage_mode}. Expected one of {self.STORAGE_MODES}"
+            )
+
+        self.embedding_function = embedding_function or create_embedding_function()
         self._dimension = self.embedding_function.dimension
+        # Set by _init_database; hybrid search falls back to vector search without it
+        self.full_text_search = False
 
         self._init_database()
+        self._pool = VectorConnectionPool(
+            self.database_url,
+            min_size=settings.vector_db_pool_min_size,
+            max_size=settings.vector_db_pool_max_size,
+            acquire_timeout=settings.vector_db_pool_timeout,
+            connect_timeout=self.CONNECTION_TIMEOUT,
+            statement_timeout_ms=self.STATEMENT_TIMEOUT,
+        )
+        self._async_store = None
         logger.info("PgVectorStore initialized with PostgreSQL")
 
     # Connection timeout in seconds
@@ -171,7 +284,10 @@ class PgVectorStore:
     STATEMENT_TIMEOUT = 60000  # 60 seconds in milliseconds
 
     def _get_connection(self, register_vec: bool = True):
-        """Get a new database connection with timeout settings.
+        """Get a new, unpooled database connection with timeout settings.
+
+        Only used during initialization, before the vector extension exists,
+        and for index migrations; queries go through the shared connection pool.
 
         Args:
             register_vec: Whether to register vector type (set False during init)
@@ -196,6 +312,9 @@ class PgVectorStore:
             register_vector(conn)
             
             with conn.cursor() as cur:
+                cur.execute("SELECT to_regclass(%s)", (self.TABLE_NAME,))
+                table_existed = cur.fetchone()[0] is not None
+
                 cur.execute(f"""
                     CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} (
                         id TEXT PRIMARY KEY,
@@ -207,22 +326,60 @@ class PgVectorStore:
                         chunk_index INTEGER,
                         metadata JSONB DEFAULT '{{}}',
                         embedding vector({self._dimension}),
+                        content_hash TEXT,
+                        content_tsv tsvector,
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                     )
                 """)
-                
+
                 cur.execute(f"""
-                    CREATE INDEX IF NOT EXISTS idx_{self.TABLE_NAME}_source_type 
-                    ON {self.TABLE_NAME} (source_type)
+                    ALTER TABLE {self.TABLE_NAME}
+                    ADD COLUMN IF NOT EXISTS content_hash TEXT
                 """)
                 
                 cur.execute(f"""
-                    CREATE INDEX IF NOT EXISTS idx_{self.TABLE_NAME}_embedding 
-                    ON {self.TABLE_NAME} 
-                    USING hnsw (embedding vector_cosine_ops)
-                    WITH (m = 16, ef_construction = 64)
+                    CREATE INDEX IF NOT EXISTS idx_{self.TABLE_NAME}_source_type 
+                    ON {self.TABLE_NAME} (source_type)
                 """)
                 
+                if self.storage_mode != "full" and not self._supports_compact_storage(cur):
+                    logger.warning(
+                        f"pgvector older than {'.'.join(map(str, self.COMPACT_MIN_PGVECTOR))} "
+                        f"cannot build a {self.storage_mode} index; using full vectors"
+                    )
+                    self.storage_mode = "full"
+                # Compact indexes are only built by the concurrent migration, never at startup
+                if self.storage_mode != "full" and not self._index_is_valid(
+                    cur, self._vector_index_name(self.storage_mode)
+                ):
+                    logger.warning(
+                        f"No valid {self.storage_mode} index on {self.TABLE_NAME}; using full vectors. "
+                        f"Build it with: python -m scripts.migrate_vector_storage --mode {self.storage_mode}"
+                    )
+                    self.storage_mode = "full"
+
+                if self.storage_mode == "full":
+                    self._drop_invalid_index(cur, self._vector_index_name("full"))
+                    cur.execute(self._vector_index_sql(
+                        "full", self.HNSW_M, self.HNSW_EF_CONSTRUCTION
+                    ))
+
+                # Full-text index for the lexical half of hybrid search. A new, empty
+                # table gets it here; existing tables need the explicit (batched,
+                # concurrent) migration, which would be too slow for startup.
+                if not table_existed:
+                    for statement in self._content_tsv_trigger_sql():
+                        cur.execute(statement)
+                    cur.execute(self._full_text_index_sql())
+                    self.full_text_search = True
+                else:
+                    self.full_text_search = self._full_text_search_ready(cur)
+                    if not self.full_text_search:
+                        logger.warning(
+                            f"{self.TABLE_NAME} has no full-text index; hybrid search falls back to "
+                            "vector search. Run scripts/migrate_full_text_search.py to build it."
+                        )
+
                 conn.commit()
                 logger.info("Database initialized with pgvector extension and table")
         except Exception as e:
@@ -239,6 +396,9 @@ class PgVectorStore:
     ) -> int:
         """Add document chunks to the vector store.
 
+        Chunks already stored with identical content are not re-embedded;
+        see ``upsert_documents`` for the skipped/updated/inserted breakdown.
+
         Args:
             chunks: List of DocumentChunk objects to add.
             source_type: Override source type (uses chunk.source_type if not provided).
@@ -246,55 +406,152 @@ class PgVectorStore:
         Returns:
             Number of chunks added.
         """
+        return sum(self.upsert_documents(chunks, source_type=source_type).values())
+
+    def _content_hash(self, content: str) -> str:
+        """Hash of everything the stored embedding depends on: model and content."""
+        model = getattr(self.embedding_function, "model", type(self.embedding_function).__name__)
+        return hashlib.sha256(f"{model}\x1f{content}".encode("utf-8")).hexdigest()
+
+    def upsert_documents(
+        self,
+        chunks: List[DocumentChunk],
+        source_type: Optional[str] = None
+    ) -> Dict[str, int]:
+        """Add document chunks, embedding only new or changed content.
+
+        Existing content hashes are looked up in one query before
+        ``embedding_function`` is called, so re-indexing an unchanged corpus
+        costs no embedding calls. Rows stored before content hashes existed
+        are re-embedded once, which backfills their hash.
+
+        Args:
+            chunks: List of DocumentChunk objects to add.
+            source_type: Override source type (uses chunk.source_type if not provided).
+
+        Returns:
+            Dictionary with counts of 'inserted', 'updated' and 'skipped' chunks.
+        """
+        pending, counts = self.filter_unchanged(chunks)
+        if not pending:
+            logger.info(f"All {len(chunks)} chunks unchanged; nothing to embed")
+            return counts
+
+        embeddings = self.embedding_function([chunk.content for chunk in pending])
+        self.write_chunks(pending, embeddings, source_type=source_type)
+        logger.info(
+            f"Indexed {len(chunks)} chunks to PostgreSQL: "
+            f"{counts['inserted']} inserted, {counts['updated']} updated, "
+            f"{counts['skipped']} unchanged"
+        )
+        return counts
+
+    def filter_unchanged(
+        self,
+        chunks: List[DocumentChunk]
+    ) -> Tuple[List[DocumentChunk], Dict[str, int]]:
+        """Find the chunks that need embedding, with one bulk hash lookup.
+
+        Args:
+            chunks: Candidate chunks.
+
+        Returns:
+            Tuple of (new or changed chunks, counts of 'inserted', 'updated'
+            and 'skipped' chunks).
+        """
+        counts = {"inserted": 0, "updated": 0, "skipped": 0}
         if not chunks:
-            return 0
+            return [], counts
 
-        documents = [chunk.content for chunk in chunks]
-        embeddings = self.embedding_function(documents)
+        by_id = {chunk.chunk_id: chunk for chunk in chunks}
+        counts["skipped"] += len(chunks) - len(by_id)  # duplicates within the batch
 
-        conn = self._get_connection()
-        try:
+        with self._pool.connection() as conn:
             with conn.cursor() as cur:
-                values = []
-                for chunk, embedding in zip(chunks, embeddings):
-                    st = source_type or chunk.source_type
-                    import json
-                    metadata_json = json.dumps(chunk.metadata)
-                    values.append((
-                        chunk.chunk_id,
-                        chunk.content,
-                        chunk.source_file,
-                        st,
-                        chunk.page_number,
-                        chunk.section or "",
-                        chunk.chunk_index,
-                        metadata_json,
-                        embedding
-                    ))
-
-                execute_values(
-                    cur,
-                    f"""
-                    INSERT INTO {self.TABLE_NAME} 
-                    (id, content, source_file, source_type, page_number, section, chunk_index, metadata, embedding)
-                    VALUES %s
-                    ON CONFLICT (id) DO UPDATE SET
-                        content = EXCLUDED.content,
-                        embedding = EXCLUDED.embedding,
-                        metadata = EXCLUDED.metadata
-                    """,
-                    values,
-                    template="(%s, %s, %s, %s, %s, %s, %s, %s, %s::vector)"
+                cur.execute(
+                    f"SELECT id, content_hash FROM {self.TABLE_NAME} WHERE id = ANY(%s)",
+                    (list(by_id),)
                 )
-                conn.commit()
-                logger.info(f"Added {len(chunks)} chunks to PostgreSQL")
-                return len(chunks)
-        except Exception as e:
-            logger.error(f"Error adding documents: {e}")
+                stored = dict(cur.fetchall())
             conn.rollback()
-            raise
-        finally:
-            conn.close()
+
+        pending = []
+        for chunk_id, chunk in by_id.items():
+            if chunk_id not in stored:
+                counts["inserted"] += 1
+            elif stored[chunk_id] != self._content_hash(chunk.content):
+                counts["updated"] += 1
+            else:
+                counts["skipped"] += 1
+                continue
+            pending.append(chunk)
+
+        return pending, counts
+
+    def write_chunks(
+        self,
+        chunks: List[DocumentChunk],
+        embeddings: List[List[float]],
+        source_type: Optional[str] = None
+    ) -> int:
+        """Upsert already-embedded chunks.
+
+        Args:
+            chunks: Chunks to write.
+            embeddings: One embedding per chunk.
+            source_type: Override source type (uses chunk.source_type if not provided).
+
+        Returns:
+            Number of chunks written.
+        """
+        if not chunks:
+            return 0
+
+        with self._pool.connection() as conn:
+            try:
+                with conn.cursor() as cur:
+                    values = []
+                    for chunk, embedding in zip(chunks, embeddings):
+                        st = source_type or chunk.source_type
+                        import json
+                        metadata_json = json.dumps(chunk.metadata)
+                        # Failed embeddings come back as zero vectors; leave the
+                        # hash empty so the next run retries them.
+                        content_hash = self._content_hash(chunk.content) if any(embedding) else None
+                        values.append((
+                            chunk.chunk_id,
+                            chunk.content,
+                            chunk.source_file,
+                            st,
+                            chunk.page_number,
+                            chunk.section or "",
+                            chunk.chunk_index,
+                            metadata_json,
+                            embedding,
+                            content_hash
+                        ))
+
+                    execute_values(
+                        cur,
+                        f"""
+                        INSERT INTO {self.TABLE_NAME} 
+                        (id, content, source_file, source_type, page_number, section, chunk_index, metadata, embedding, content_hash)
+                        VALUES %s
+                        ON CONFLICT (id) DO UPDATE SET
+                            content = EXCLUDED.content,
+                            embedding = EXCLUDED.embedding,
+                            metadata = EXCLUDED.metadata,
+                            content_hash = EXCLUDED.content_hash
+                        """,
+                        values,
+                        template="(%s, %s, %s, %s, %s, %s, %s, %s, %s::vector, %s)"
+                    )
+                    conn.commit()
+                    return len(values)
+            except Exception as e:
+                logger.error(f"Error adding documents: {e}")
+                conn.rollback()
+                raise
 
     def search(
         self,
@@ -302,7 +559,9 @@ class PgVectorStore:
         source_type: str = "all",
         n_results: int = 5,
         where: Optional[Dict[str, Any]] = None,
-        include_distances: bool = True
+        include_distances: bool = True,
+        mode: str = "vector",
+        ef_search: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Search for relevant document chunks.
 
@@ -312,116 +571,628 @@ class PgVectorStore:
             n_results: Number of results to return.
             where: Optional metadata filter.
             include_distances: Whether to include similarity distances in results.
+            mode: 'vector' (embedding similarity) or 'hybrid' (vector + full-text,
+                see ``hybrid_search``).
+            ef_search: HNSW candidate list size for this query (1-1000); higher
+                trades latency for recall. Defaults to the server setting.
 
         Returns:
             List of result dictionaries with keys: content, metadata, distance (if included).
         """
+        if mode not in self.SEARCH_MODES:
+            raise ValueError(f"Unknown search mode: {mode}. Expected one of {self.SEARCH_MODES}")
+        if mode == "hybrid":
+            return self.hybrid_search(
+                query, source_type=source_type, n_results=n_results, ef_search=ef_search
+            )
+
         query_embedding = self.embedding_function.embed_query(query)
         embedding_str = "[" + ",".join(str(x) for x in query_embedding) + "]"
 
-        conn = self._get_connection()
-        try:
+        filter_sql = "WHERE source_type = %(source_type)s" if source_type != "all" else ""
+
+        with self._pool.connection() as conn:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                if source_type != "all":
-                    if include_distances:
-                        cur.execute(
-                            f"""
-                            SELECT id, content, source_file, source_type, page_number, 
-                                   section, chunk_index, metadata,
-                                   1 - (embedding <=> %s::vector) AS similarity
-                            FROM {self.TABLE_NAME}
-                            WHERE source_type = %s
-                            ORDER BY embedding <=> %s::vector
-                            LIMIT %s
-                            """,
-                            (embedding_str, source_type, embedding_str, n_results)
-                        )
-                    else:
-                        cur.execute(
-                            f"""
-                            SELECT id, content, source_file, source_type, page_number, 
-                                   section, chunk_index, metadata
-                            FROM {self.TABLE_NAME}
-                            WHERE source_type = %s
-                            ORDER BY embedding <=> %s::vector
-                            LIMIT %s
-                            """,
-                            (source_type, embedding_str, n_results)
-                        )
-                else:
-                    if include_distances:
+                self._set_ef_search(cur, ef_search, n_results)
+                cur.execute(
+                    self._nearest_sql(
+                        """id, content, source_file, source_type, page_number,
+                           section, chunk_index, metadata,
+                           1 - (embedding <=> %(embedding)s::vector) AS similarity""",
+                        filter_sql,
+                        "%(n_results)s",
+                    ),
+                    {"embedding": embedding_str, "source_type": source_type, "n_results": n_results}
+                )
+
+                rows = cur.fetchall()
+                
+                return [self._row_to_result(row, include_distances) for row in rows]
+
+    def hybrid_search(
+        self,
+        query: str,
+        source_type: str = "all",
+        n_results: int = 5,
+        n_candidates: Optional[int] = None,
+        ef_search: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Search with vector similarity and full-text matching, fused by rank.
+
+        Exact tokens such as "Paprosky 3B", "HHS" or registry acronyms match
+        poorly in embedding space but exactly in a text index. One statement
+        takes the top ``n_candidates`` from the HNSW index and from the GIN
+        full-text index (query terms OR-ed, ranked by ts_rank_cd; equal text
+        ranks share a rank), then merges them with reciprocal rank fusion:
+        score = sum of 1 / (RRF_K + rank). Until the full-text index exists
+        (see ``migrate_full_text_search``) this is a plain vector search.
+
+        Args:
+            query: Search query text.
+            source_type: Which source to search ('protocol', 'literature', 'registry', 'all').
+            n_results: Number of results to return.
+            n_candidates: Candidates taken from each index. Defaults to
+                max(4 * n_results, 20).
+            ef_search: HNSW candidate list size for this query (see ``search``).
+
+        Returns:
+            List of result dictionaries with keys: content, metadata, distance,
+            score (fused RRF score), vector_rank and lexical_rank (None when
+            the chunk was not a candidate of that index).
+        """
+        if not self.full_text_search:
+            logger.debug("No full-text index; hybrid search falls back to vector search")
+            return self.search(query, source_type=source_type, n_results=n_results, ef_search=ef_search)
+
+        n_candidates = n_candidates or max(4 * n_results, 20)
+        query_embedding = self.embedding_function.embed_query(query)
+        embedding_str = "[" + ",".join(str(x) for x in query_embedding) + "]"
+
+        with self._pool.connection() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                self._set_ef_search(cur, ef_search, n_candidates)
+                vector_candidates_sql = self._nearest_sql(
+                    "id, embedding <=> %(embedding)s::vector AS distance",
+                    "WHERE %(source_type)s = 'all' OR source_type = %(source_type)s",
+                    "%(n_candidates)s",
+                )
+                cur.execute(
+                    f"""
+                    WITH vector_hits AS (
+                        SELECT id, row_number() OVER (ORDER BY distance) AS rank
+                        FROM ({vector_candidates_sql}) v
+                    ),
+                    lexical_hits AS (
+                        SELECT id, rank() OVER (ORDER BY text_rank DESC) AS rank
+                        FROM (
+                            SELECT id, ts_rank_cd(content_tsv, q.tsq) AS text_rank
+                            FROM {self.TABLE_NAME},
+                                 (SELECT replace(
+                                      plainto_tsquery('{self.TEXT_SEARCH_CONFIG}', %(query)s)::text,
+                                      '&', '|'
+                                  )::tsquery AS tsq) q
+                            WHERE content_tsv @@ q.tsq
+                              AND (%(source_type)s = 'all' OR source_type = %(source_type)s)
+                            ORDER BY text_rank DESC, id
+                            LIMIT %(n_candidates)s
+                        ) l
+                    ),
+                    fused AS (
+                        SELECT COALESCE(v.id, l.id) AS id,
+                               v.rank AS vector_rank,
+                               l.rank AS lexical_rank,
+                               COALESCE(1.0 / (%(rrf_k)s + v.rank), 0)
+                                 + COALESCE(1.0 / (%(rrf_k)s + l.rank), 0) AS score
+                        FROM vector_hits v
+                        FULL OUTER JOIN lexical_hits l ON v.id = l.id
+                        ORDER BY score DESC, id
+                        LIMIT %(n_results)s
+                    )
+                    SELECT d.id, d.content, d.source_file, d.source_type, d.page_number,
+                           d.section, d.chunk_index, d.metadata,
+                           1 - (d.embedding <=> %(embedding)s::vector) AS similarity,
+                           f.score, f.vector_rank, f.lexical_rank
+                    FROM fused f
+                    JOIN {self.TABLE_NAME} d ON d.id = f.id
+                    ORDER BY f.score DESC, f.id
+                    """,
+                    {
+                        "embedding": embedding_str,
+                        "source_type": source_type,
+                        "query": query,
+                        "n_candidates": n_candidates,
+                        "rrf_k": self.RRF_K,
+                        "n_results": n_results,
+                    }
+                )
+                rows = cur.fetchall()
+
+        results = []
+        for row in rows:
+            result = self._row_to_result(row)
+            result["score"] = float(row["score"])
+            result["vector_rank"] = row["vector_rank"]
+            result["lexical_rank"] = row["lexical_rank"]
+            results.append(result)
+        return results
+
+    def search_diverse(
+        self,
+        query: str,
+        source_type: str = "all",
+        n_results: int = 5,
+        fetch_k: Optional[int] = None,
+        lambda_mult: Optional[float] = None,
+        max_per_source: Optional[int] = None,
+        max_per_page: Optional[int] = 1,
+        mode: str = "vector",
+        ef_search: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Search, then re-rank a larger candidate pool for diversity.
+
+        Overlapping chunks of one page tend to fill a plain top-k. This fetches
+        ``fetch_k`` candidates and selects ``n_results`` of them by Maximal
+        Marginal Relevance with per-source and per-page caps (see
+        ``reranking.mmr_rerank``), so more distinct evidence fits in a prompt.
+
+        Args:
+            query: Search query text.
+            source_type: Which source to search ('protocol', 'literature', 'registry', 'all').
+            n_results: Number of results to return.
+            fetch_k: Candidate pool size. Defaults to MMR_FETCH_FACTOR * n_results.
+            lambda_mult: Relevance/diversity trade-off (1.0 = relevance only).
+                Defaults to MMR_LAMBDA.
+            max_per_source: Maximum results from one source file (None = no cap).
+            max_per_page: Maximum results from one page (None = no cap). Chunks
+                without a page number are not capped.
+            mode: Candidate retrieval mode, 'vector' or 'hybrid'.
+            ef_search: HNSW candidate list size for this query (see ``search``).
+
+        Returns:
+            Up to ``n_results`` result dictionaries, in the shape returned by
+            ``search`` for the given mode.
+        """
+        fetch_k = fetch_k or self.MMR_FETCH_FACTOR * n_results
+        lambda_mult = self.MMR_LAMBDA if lambda_mult is None else lambda_mult
+        candidates = self.search(
+            query,
+            source_type=source_type,
+            n_results=max(fetch_k, n_results),
+            include_distances=True,
+            mode=mode,
+            ef_search=ef_search,
+        )
+        if len(candidates) <= 1:
+            return candidates[:n_results]
+
+        embeddings = self._fetch_embeddings([c["id"] for c in candidates])
+        # Skip chunks deleted between the search and the embedding fetch
+        candidates = [c for c in candidates if c["id"] in embeddings]
+        return mmr_rerank(
+            candidates,
+            [embeddings[c["id"]] for c in candidates],
+            n_results,
+            lambda_mult=lambda_mult,
+            max_per_source=max_per_source,
+            max_per_page=max_per_page,
+        )
+
+    def _fetch_embeddings(self, chunk_ids: List[str]) -> Dict[str, np.ndarray]:
+        """Load stored embeddings by chunk ID (one primary-key lookup)."""
+        with self._pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"SELECT id, embedding FROM {self.TABLE_NAME} WHERE id = ANY(%s)",
+                    (list(chunk_ids),)
+                )
+                rows = cur.fetchall()
+        # pgvector returns numpy arrays or Vector objects depending on its version
+        return {
+            chunk_id: np.asarray(
+                embedding.to_numpy() if hasattr(embedding, "to_numpy") else embedding,
+                dtype=np.float64,
+            )
+            for chunk_id, embedding in rows
+        }
+
+    def _nearest_sql(self, columns: str, filter_sql: str, limit: str) -> str:
+        """SQL selecting ``columns`` of the rows nearest to %(embedding)s.
+
+        With full storage this is a plain HNSW-ordered scan. Compact modes
+        scan the quantized index for ``limit * RERANK_FACTORS[mode]``
+        candidates, then re-rank them by exact cosine distance on the full
+        vectors, so returned distances and order are exact.
+
+        Args:
+            columns: Select list (may reference %(embedding)s).
+            filter_sql: WHERE clause, or an empty string.
+            limit: SQL expression for the number of rows to return.
+        """
+        if self.storage_mode == "full":
+            return f"""
+                SELECT {columns}
+                FROM {self.TABLE_NAME}
+                {filter_sql}
+                ORDER BY embedding <=> %(embedding)s::vector
+                LIMIT {limit}
+            """
+
+        dimension = int(self._dimension)
+        if self.storage_mode == "halfvec":
+            approximate_order = (
+                f"embedding::halfvec({dimension}) <=> %(embedding)s::halfvec({dimension})"
+            )
+        else:
+            approximate_order = (
+                f"binary_quantize(embedding)::bit({dimension}) "
+                f"<~> binary_quantize(%(embedding)s::vector)"
+            )
+        return f"""
+            SELECT * FROM (
+                SELECT {columns}, embedding <=> %(embedding)s::vector AS exact_distance
+                FROM {self.TABLE_NAME}
+                {filter_sql}
+                ORDER BY {approximate_order}
+                LIMIT ({limit}) * {self.RERANK_FACTORS[self.storage_mode]}
+            ) candidates
+            ORDER BY exact_distance
+            LIMIT {limit}
+        """
+
+    def _set_ef_search(self, cur, ef_search: Optional[int], n_results: int = 0) -> None:
+        """Set hnsw.ef_search for the current transaction only.
+
+        An HNSW scan returns at most ef_search rows, so compact modes raise it
+        to cover their re-rank candidates. SET LOCAL ends with the
+        transaction, which the pool rolls back on checkin, so the setting
+        never leaks to the next user of the connection.
+        """
+        if ef_search is not None and not 1 <= ef_search <= 1000:
+            raise ValueError("ef_search must be between 1 and 1000")
+        if self.storage_mode != "full":
+            candidates = n_results * self.RERANK_FACTORS[self.storage_mode]
+            if candidates > (ef_search or 40):  # 40 is pgvector's default
+                ef_search = min(candidates, 1000)
+        if ef_search is None:
+            return
+        cur.execute("SET LOCAL hnsw.ef_search = %s", (int(ef_search),))
+
+    def _vector_index_name(self, storage_mode: str) -> str:
+        """Name of the ANN index for a storage mode."""
+        suffix = "" if storage_mode == "full" else f"_{storage_mode}"
+        return f"idx_{self.TABLE_NAME}_embedding{suffix}"
+
+    def _vector_index_sql(
+        self,
+        storage_mode: str,
+        m: int,
+        ef_construction: int,
+        concurrently: bool = False
+    ) -> str:
+        """CREATE INDEX statement for the ANN index of a storage mode."""
+        dimension = int(self._dimension)
+        expression = {
+            "full": "embedding vector_cosine_ops",
+            "halfvec": f"(embedding::halfvec({dimension})) halfvec_cosine_ops",
+            "binary": f"(binary_quantize(embedding)::bit({dimension})) bit_hamming_ops",
+        }[storage_mode]
+        return f"""
+            CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS {self._vector_index_name(storage_mode)}
+            ON {self.TABLE_NAME}
+            USING hnsw ({expression})
+            WITH (m = {int(m)}, ef_construction = {int(ef_construction)})
+        """
+
+    def _drop_invalid_index(self, cur, index_name: str, concurrently: bool = False) -> None:
+        """Drop an index if a failed concurrent build left it INVALID.
+
+        CREATE INDEX IF NOT EXISTS would otherwise skip the broken index.
+        """
+        cur.execute(
+            "SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(%s)",
+            (index_name,)
+        )
+        row = cur.fetchone()
+        if row is not None and not row[0]:
+            logger.warning(f"Dropping invalid index {index_name} left by an interrupted build")
+            cur.execute(f"DROP INDEX {'CONCURRENTLY ' if concurrently else ''}IF EXISTS {index_name}")
+
+    def _full_text_index_name(self) -> str:
+        """Name of the GIN index on content_tsv."""
+        return f"idx_{self.TABLE_NAME}_content_tsv"
+
+    def _full_text_index_sql(self, concurrently: bool = False) -> str:
+        """CREATE INDEX statement for the full-text GIN index."""
+        return f"""
+            CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS {self._full_text_index_name()}
+            ON {self.TABLE_NAME}
+            USING gin (content_tsv)
+        """
+
+    def _content_tsv_trigger_sql(self) -> List[str]:
+        """Statements installing the trigger that keeps content_tsv in step with content."""
+        function_name = f"{self.TABLE_NAME}_content_tsv_update"
+        return [
+            f"""
+            CREATE OR REPLACE FUNCTION {function_name}() RETURNS trigger AS $$
+            BEGIN
+                NEW.content_tsv := to_tsvector('{self.TEXT_SEARCH_CONFIG}', NEW.content);
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+            """,
+            f"DROP TRIGGER IF EXISTS {self.TABLE_NAME}_content_tsv ON {self.TABLE_NAME}",
+            f"""
+            CREATE TRIGGER {self.TABLE_NAME}_content_tsv
+            BEFORE INSERT OR UPDATE OF content ON {self.TABLE_NAME}
+            FOR EACH ROW EXECUTE FUNCTION {function_name}()
+            """,
+        ]
+
+    def _content_tsv_generated(self, cur) -> Optional[bool]:
+        """Whether content_tsv is a generated column (None if it does not exist)."""
+        cur.execute(
+            """
+            SELECT is_generated FROM information_schema.columns
+            WHERE table_schema = current_schema() AND table_name = %s AND column_name = 'content_tsv'
+            """,
+            (self.TABLE_NAME,)
+        )
+        row = cur.fetchone()
+        return None if row is None else row[0] == "ALWAYS"
+
+    def _full_text_search_ready(self, cur) -> bool:
+        """Whether content_tsv and a valid GIN index on it exist."""
+        return (
+            self._content_tsv_generated(cur) is not None
+            and self._index_is_valid(cur, self._full_text_index_name())
+        )
+
+    @staticmethod
+    def _index_is_valid(cur, index_name: str) -> bool:
+        """Whether an index exists and is usable (not left INVALID by a failed build)."""
+        cur.execute(
+            "SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(%s)",
+            (index_name,)
+        )
+        row = cur.fetchone()
+        return row is not None and row[0]
+
+    def _supports_compact_storage(self, cur) -> bool:
+        """Whether the installed pgvector has halfvec and binary_quantize."""
+        cur.execute("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+        row = cur.fetchone()
+        if row is None:
+            return False
+        version = tuple(int(part) for part in re.findall(r"\d+", row[0])[:3])
+        return version >= self.COMPACT_MIN_PGVECTOR
+
+    @staticmethod
+    def _validate_index_params(m: int, ef_construction: int) -> None:
+        """Check HNSW build parameters against pgvector's limits."""
+        if not 2 <= m <= 100:
+            raise ValueError("m must be between 2 and 100")
+        if not 2 * m <= ef_construction <= 1000:
+            raise ValueError("ef_construction must be between 2 * m and 1000")
+
+    def rebuild_vector_index(
+        self,
+        m: Optional[int] = None,
+        ef_construction: Optional[int] = None,
+        storage_mode: Optional[str] = None
+    ) -> None:
+        """Drop all ANN indexes and build one with the given parameters.
+
+        Blocks writes while building; use ``migrate_storage_mode`` to switch
+        layouts on a live database.
+
+        Args:
+            m: Max connections per graph node (2-100). Defaults to HNSW_M.
+            ef_construction: Build-time candidate list size (at least 2 * m).
+                Defaults to HNSW_EF_CONSTRUCTION.
+            storage_mode: Index layout to build. Defaults to the current mode.
+        """
+        m = m or self.HNSW_M
+        ef_construction = ef_construction or self.HNSW_EF_CONSTRUCTION
+        storage_mode = storage_mode or self.storage_mode
+        if storage_mode not in self.STORAGE_MODES:
+            raise ValueError(f"Unknown storage mode: {storage_mode}. Expected one of {self.STORAGE_MODES}")
+        self._validate_index_params(m, ef_construction)
+
+        with self._pool.connection() as conn:
+            try:
+                with conn.cursor() as cur:
+                    if storage_mode != "full" and not self._supports_compact_storage(cur):
+                        raise RuntimeError(f"pgvector on this server cannot build a {storage_mode} index")
+                    cur.execute("SET LOCAL statement_timeout = 0")  # index builds can be long
+                    for mode in self.STORAGE_MODES:
+                        cur.execute(f"DROP INDEX IF EXISTS {self._vector_index_name(mode)}")
+                    cur.execute(self._vector_index_sql(storage_mode, m, ef_construction))
+                    conn.commit()
+                    self.storage_mode = storage_mode
+                    logger.info(
+                        f"Rebuilt {storage_mode} HNSW index (m={m}, ef_construction={ef_construction})"
+                    )
+            except Exception as e:
+                logger.error(f"Error rebuilding vector index: {e}")
+                conn.rollback()
+                raise
+
+    def migrate_storage_mode(
+        self,
+        storage_mode: str,
+        drop_unused: bool = True
+    ) -> None:
+        """Switch the ANN index layout without blocking reads or writes.
+
+        Builds the target index with CREATE INDEX CONCURRENTLY while the
+        current index keeps serving queries, switches this store over, then
+        drops the other layouts' indexes. Set VECTOR_STORAGE_MODE to the new
+        mode afterwards so other processes use it too.
+
+        Args:
+            storage_mode: Target layout: 'full', 'halfvec' or 'binary'.
+            drop_unused: Drop the indexes of the other layouts once built.
+        """
+        if storage_mode not in self.STORAGE_MODES:
+            raise ValueError(f"Unknown storage mode: {storage_mode}. Expected one of {self.STORAGE_MODES}")
+
+        # A dedicated connection, so the session settings below never reach the pool
+        conn = self._get_connection(register_vec=False)
+        try:
+            conn.autocommit = True  # CONCURRENTLY cannot run inside a transaction
+            with conn.cursor() as cur:
+                if storage_mode != "full" and not self._supports_compact_storage(cur):
+                    raise RuntimeError(f"pgvector on this server cannot build a {storage_mode} index")
+                cur.execute("SET statement_timeout = 0")  # index builds can be long
+                self._drop_invalid_index(cur, self._vector_index_name(storage_mode), concurrently=True)
+                cur.execute(self._vector_index_sql(
+                    storage_mode, self.HNSW_M, self.HNSW_EF_CONSTRUCTION, concurrently=True
+                ))
+                self.storage_mode = storage_mode
+                if drop_unused:
+                    for mode in self.STORAGE_MODES:
+                        if mode != storage_mode:
+                            cur.execute(
+                                f"DROP INDEX CONCURRENTLY IF EXISTS {self._vector_index_name(mode)}"
+                            )
+        finally:
+            conn.close()
+        logger.info(f"Vector storage migrated to {storage_mode}")
+
+    def migrate_full_text_search(self, batch_size: int = 1000) -> int:
+        """Add the full-text index for hybrid search to an existing table.
+
+        Adds a plain content_tsv column (a catalog-only change, no table
+        rewrite), installs the trigger that fills it on insert and update,
+        backfills existing rows in short batches, then builds the GIN index
+        with CREATE INDEX CONCURRENTLY. Reads and writes continue throughout,
+        and an interrupted run resumes where it stopped.
+
+        Args:
+            batch_size: Rows backfilled per transaction.
+
+        Returns:
+            Number of rows backfilled.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        backfilled = 0
+        # A dedicated connection, so the session settings below never reach the pool
+        conn = self._get_connection(register_vec=False)
+        try:
+            conn.autocommit = True  # each batch commits on its own; CONCURRENTLY needs no transaction
+            with conn.cursor() as cur:
+                cur.execute("SET statement_timeout = 0")  # the index build can be long
+                cur.execute(f"ALTER TABLE {self.TABLE_NAME} ADD COLUMN IF NOT EXISTS content_tsv tsvector")
+                if not self._content_tsv_generated(cur):
+                    for statement in self._content_tsv_trigger_sql():
+                        cur.execute(statement)
+                    last_id = ""
+                    while True:
                         cur.execute(
-                            f"""
-                            SELECT id, content, source_file, source_type, page_number, 
-                                   section, chunk_index, metadata,
-                                   1 - (embedding <=> %s::vector) AS similarity
-                            FROM {self.TABLE_NAME}
-                            ORDER BY embedding <=> %s::vector
-                            LIMIT %s
-                            """,
-                            (embedding_str, embedding_str, n_results)
+                            f"SELECT id FROM {self.TABLE_NAME} WHERE id > %s ORDER BY id LIMIT %s",
+                            (last_id, batch_size)
                         )
-                    else:
+                        ids = [row[0] for row in cur.fetchall()]
+                        if not ids:
+                            break
                         cur.execute(
                             f"""
-                            SELECT id, content, source_file, source_type, page_number, 
-                                   section, chunk_index, metadata
-                            FROM {self.TABLE_NAME}
-                            ORDER BY embedding <=> %s::vector
-                            LIMIT %s
+                            UPDATE {self.TABLE_NAME}
+                            SET content_tsv = to_tsvector('{self.TEXT_SEARCH_CONFIG}', content)
+                            WHERE id = ANY(%s) AND content_tsv IS NULL
                             """,
-                            (embedding_str, n_results)
+                            (ids,)
                         )
-
-                rows = cur.fetchall()
-                
-                results = []
-                for row in rows:
-                    extra_metadata = row["metadata"] if isinstance(row["metadata"], dict) else {}
-                    result = {
-                        "id": row["id"],
-                        "content": row["content"],
-                        "metadata": {
-                            "source_file": row["source_file"],
-                            "source_type": row["source_type"],
-                            "page_number": row["page_number"],
-                            "section": row["section"],
-                            "chunk_index": row["chunk_index"],
-                            **extra_metadata
-                        }
-                    }
-                    if include_distances and "similarity" in row:
-                        similarity = row["similarity"]
-                        result["distance"] = float(1 - similarity) if similarity else 1.0
-                    results.append(result)
-                
-                return results
+                        backfilled += cur.rowcount
+                        last_id = ids[-1]
+                self._drop_invalid_index(cur, self._full_text_index_name(), concurrently=True)
+                cur.execute(self._full_text_index_sql(concurrently=True))
         finally:
             conn.close()
+        self.full_text_search = True
+        logger.info(f"Full-text search enabled on {self.TABLE_NAME} ({backfilled} rows backfilled)")
+        return backfilled
+
+    @staticmethod
+    def _row_to_result(row: Dict[str, Any], include_distances: bool = True) -> Dict[str, Any]:
+        """Convert a chunk row into the search result dictionary."""
+        extra_metadata = row["metadata"] if isinstance(row["metadata"], dict) else {}
+        result = {
+            "id": row["id"],
+            "content": row["content"],
+            "metadata": {
+                "source_file": row["source_file"],
+                "source_type": row["source_type"],
+                "page_number": row["page_number"],
+                "section": row["section"],
+                "chunk_index": row["chunk_index"],
+                **extra_metadata
+            }
+        }
+        if include_distances and "similarity" in row:
+            similarity = row["similarity"]
+            result["distance"] = float(1 - similarity) if similarity else 1.0
+        return result
 
     def search_multi_source(
         self,
         query: str,
         source_types: List[str],
-        n_results_per_source: int = 3
+        n_results_per_source: int = 3,
+        ef_search: Optional[int] = None
     ) -> Dict[str, List[Dict[str, Any]]]:
         """Search across multiple source types.
 
+        The query is embedded once and the top results for every source type
+        come back from a single statement: a lateral join runs one
+        index-ordered, LIMITed scan per requested type.
+
         Args:
             query: Search query text.
-            source_types: List of source types to search.
+            source_types: List of source types to search ('all' matches any).
             n_results_per_source: Number of results per source type.
+            ef_search: HNSW candidate list size for this query (see ``search``).
 
         Returns:
             Dictionary mapping source type to list of results.
         """
-        results = {}
-        for source_type in source_types:
-            results[source_type] = self.search(
-                query=query,
-                source_type=source_type,
-                n_results=n_results_per_source
-            )
+        requested = list(dict.fromkeys(source_types))
+        results: Dict[str, List[Dict[str, Any]]] = {source_type: [] for source_type in requested}
+        if not requested:
+            return results
+
+        query_embedding = self.embedding_function.embed_query(query)
+        embedding_str = "[" + ",".join(str(x) for x in query_embedding) + "]"
+
+        with self._pool.connection() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                self._set_ef_search(cur, ef_search, n_results_per_source)
+                nearest_sql = self._nearest_sql(
+                    """id, content, source_file, source_type, page_number,
+                       section, chunk_index, metadata,
+                       1 - (embedding <=> %(embedding)s::vector) AS similarity""",
+                    "WHERE s.requested_type = 'all' OR source_type = s.requested_type",
+                    "%(n_results)s",
+                )
+                cur.execute(
+                    f"""
+                    SELECT s.requested_type, c.*
+                    FROM unnest(%(requested)s::text[]) WITH ORDINALITY AS s(requested_type, ord)
+                    CROSS JOIN LATERAL ({nearest_sql}) c
+                    ORDER BY s.ord, c.similarity DESC
+                    """,
+                    {
+                        "requested": requested,
+                        "embedding": embedding_str,
+                        "n_results": n_results_per_source,
+                    }
+                )
+                for row in cur.fetchall():
+                    results[row["requested_type"]].append(self._row_to_result(row))
+
         return results
 
     def get_collection_stats(self) -> Dict[str, int]:
@@ -430,8 +1201,7 @@ class PgVectorStore:
         Returns:
             Dictionary mapping source type to document count.
         """
-        conn = self._get_connection()
-        try:
+        with self._pool.connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(f"""
                     SELECT source_type, COUNT(*) as count
@@ -445,8 +1215,34 @@ class PgVectorStore:
                 stats["all"] = cur.fetchone()[0]
                 
                 return stats
-        finally:
-            conn.close()
+
+    def delete_chunks(self, chunk_ids: List[str]) -> int:
+        """Delete specific chunks by id.
+
+        Args:
+            chunk_ids: Chunk ids to delete.
+
+        Returns:
+            Number of chunks deleted.
+        """
+        if not chunk_ids:
+            return 0
+
+        with self._pool.connection() as conn:
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        f"DELETE FROM {self.TABLE_NAME} WHERE id = ANY(%s)",
+                        (list(chunk_ids),)
+                    )
+                    deleted = cur.rowcount
+                    conn.commit()
+                    logger.info(f"Deleted {deleted} chunks")
+                    return deleted
+            except Exception as e:
+                logger.error(f"Error deleting chunks: {e}")
+                conn.rollback()
+                raise
 
     def delete_collection(self, source_type: str) -> bool:
         """Delete all documents of a specific source type.
@@ -460,39 +1256,65 @@ class PgVectorStore:
         if source_type == "all":
             return self.clear_all()
 
-        conn = self._get_connection()
-        try:
-            with conn.cursor() as cur:
-                cur.execute(
-                    f"DELETE FROM {self.TABLE_NAME} WHERE source_type = %s",
-                    [source_type]
-                )
-                deleted = cur.rowcount
-                conn.commit()
-                logger.info(f"Deleted {deleted} documents from source type: {source_type}")
-                return deleted > 0
-        except Exception as e:
-            logger.error(f"Error deleting collection: {e}")
-            conn.rollback()
-            return False
-        finally:
-            conn.close()
+        with self._pool.connection() as conn:
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        f"DELETE FROM {self.TABLE_NAME} WHERE source_type = %s",
+                        [source_type]
+                    )
+                    deleted = cur.rowcount
+                    conn.commit()
+                    logger.info(f"Deleted {deleted} documents from source type: {source_type}")
+                    return deleted > 0
+            except Exception as e:
+                logger.error(f"Error deleting collection: {e}")
+                conn.rollback()
+                return False
 
     def clear_all(self) -> bool:
         """Clear all documents from the store."""
-        conn = self._get_connection()
-        try:
-            with conn.cursor() as cur:
-                cur.execute(f"TRUNCATE TABLE {self.TABLE_NAME}")
-                conn.commit()
-                logger.info("All documents cleared from PostgreSQL")
-                return True
-        except Exception as e:
-            logger.error(f"Error clearing all documents: {e}")
-            conn.rollback()
-            return False
-        finally:
-            conn.close()
+        with self._pool.connection() as conn:
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(f"TRUNCATE TABLE {self.TABLE_NAME}")
+                    conn.commit()
+                    logger.info("All documents cleared from PostgreSQL")
+                    return True
+            except Exception as e:
+                logger.error(f"Error clearing all documents: {e}")
+                conn.rollback()
+                return False
+
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get connection pool usage (in use, idle, waits) for monitoring."""
+        return self._pool.get_stats()
+
+    def get_embedding_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Get query embedding cache counters, if the embedding function caches."""
+        get_stats = getattr(self.embedding_function, "get_cache_stats", None)
+        return get_stats() if get_stats is not None else None
+
+    def as_async(self) -> "AsyncPgVectorStore":
+        """Get the non-blocking front-end for this store (created once).
+
+        Async request handlers should search through this instead of calling
+        ``search`` directly on the event loop.
+        """
+        if self._async_store is None:
+            from data.vectorstore.async_vector_store import AsyncPgVectorStore
+            self._async_store = AsyncPgVectorStore(
+                self, max_workers=settings.vector_db_pool_max_size
+            )
+        return self._async_store
+
+    def close(self) -> None:
+        """Close pooled database connections and the async executor."""
+        if self._async_store is not None:
+            self._async_store.close()
+            self._async_store = None
+        self._pool.close()
 
 
 _vector_store: Optional[PgVectorStore] = None
@@ -514,6 +1336,31 @@ def get_vector_store(
     global _vector_store
 
     if _vector_store is None or force_new:
+        if _vector_store is not None:
+            _vector_store.close()
         _vector_store = PgVectorStore(database_url=database_url)
 
     return _vector_store
+
+
+def close_vector_store() -> None:
+    """Close the shared vector store's pool and async executor, if it was ever created."""
+    global _vector_store
+
+    if _vector_store is not None:
+        _vector_store.close()
+        _vector_store = None
+
+
+def get_vector_store_pool_stats() -> Optional[Dict[str, Any]]:
+    """Get pool stats for the shared vector store, or None if not yet created."""
+    if _vector_store is None:
+        return None
+    return _vector_store.get_pool_stats()
+
+
+def get_vector_store_embedding_cache_stats() -> Optional[Dict[str, Any]]:
+    """Get query embedding cache stats for the shared store, or None if unavailable."""
+    if _vector_store is None:
+        return None
+    return _vector_store.get_embedding_cache_stats()
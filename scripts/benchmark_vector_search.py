@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Recall/latency benchmark for the pgvector HNSW index.
+Loads a corpus into a scratch table using the deterministic local embedding, computes exact
+brute-force nearest neighbours for a query set, then reports recall@k and p50/p95 search latency
+for every storage mode, (m, ef_construction) index build and ef_search value in the grid.
+
+Usage:
+    DATABASE_URL=postgresql://localhost/cip python -m scripts.benchmark_vector_search
+    python -m scripts.benchmark_vector_search --n-docs 20000 --ef-search 20,40,80,160 --index-params 16:64,32:128
+    python -m scripts.benchmark_vector_search --pdf-dir data/raw/literature --json results.json
+    python -m scripts.benchmark_vector_search --storage-modes full,halfvec,binary
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from data.vectorstore.local_embedding import HashingEmbeddingFunction
+from data.vectorstore.pg_vector_store import DocumentChunk, PgVectorStore
+
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
+CLINICAL_TERMS = [
+    "acetabular", "femoral", "revision", "dislocation", "infection", "loosening", "osteolysis",
+    "paprosky", "cup", "stem", "liner", "polyethylene", "ceramic", "cementless", "cemented",
+    "harris", "hip", "score", "hhs", "womack", "survivorship", "kaplan", "meier", "hazard",
+    "ratio", "cohort", "registry", "follow-up", "radiographic", "migration", "fracture",
+    "periprosthetic", "bmi", "diabetes", "smoking", "osteoporosis", "bone", "defect", "graft",
+    "augment", "screw", "fixation", "implant", "arthroplasty", "primary", "outcome", "complication",
+]
+GENERAL_TERMS = [
+    "patients", "study", "years", "months", "rate", "mean", "median", "results", "reported",
+    "compared", "group", "significant", "analysis", "included", "observed", "higher", "lower",
+    "associated", "risk", "weeks", "visit", "protocol", "data", "clinical", "trial", "baseline",
+]
+
+
+class BenchmarkVectorStore(PgVectorStore):
+    """PgVectorStore on a scratch table so benchmarks never touch real embeddings."""
+
+    TABLE_NAME = "vector_benchmark_embeddings"
+
+
+def synthetic_corpus(n_docs: int, n_queries: int, seed: int) -> Tuple[List[DocumentChunk], List[str]]:
+    """Generate topic-clustered chunks and queries drawn from them."""
+    rng = random.Random(seed)
+    topics = [rng.sample(CLINICAL_TERMS, 12) for _ in range(max(8, n_docs // 200))]
+
+    chunks = []
+    for i in range(n_docs):
+        topic = rng.choice(topics)
+        words = [
+            rng.choice(topic) if rng.random() < 0.6 else rng.choice(GENERAL_TERMS)
+            for _ in range(rng.randint(40, 90))
+        ]
+        words.append(f"ref{rng.randint(0, n_docs)}")  # rare token, as real chunks have
+        chunks.append(DocumentChunk(
+            content=" ".join(words),
+            source_file=f"synthetic_{i // 50}.pdf",
+            source_type="literature",
+            chunk_index=i,
+        ))
+
+    queries = []
+    for _ in range(n_queries):
+        words = rng.choice(chunks).content.split()
+        queries.append(" ".join(rng.sample(words, min(8, len(words)))))
+    return chunks, queries
+
+
+def pdf_corpus(pdf_dir: str, n_queries: int, seed: int) -> Tuple[List[DocumentChunk], List[str]]:
+    """Chunk real PDFs and use sentence fragments from them as queries."""
+    from data.vectorstore.pdf_extractor import PDFExtractor
+
+    chunks = PDFExtractor().extract_directory(pdf_dir, "literature", recursive=True)
+    if not chunks:
+        raise SystemExit(f"No chunks extracted from {pdf_dir}")
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(n_queries):
+        words = rng.choice(chunks).content.split()
+        start = rng.randrange(max(1, len(words) - 12))
+        queries.append(" ".join(words[start:start + 12]))
+    return chunks, queries
+
+
+def exact_neighbours(
+    store: BenchmarkVectorStore,
+    queries: List[str],
+    k: int
+) -> List[List[str]]:
+    """Brute-force cosine top-k over the stored vectors."""
+    with store._pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(f"SELECT id, embedding FROM {store.TABLE_NAME}")
+            rows = cur.fetchall()
+
+    ids = [row[0] for row in rows]
+    # pgvector returns numpy arrays or Vector objects depending on its version
+    matrix = np.asarray(
+        [row[1].to_numpy() if hasattr(row[1], "to_numpy") else row[1] for row in rows],
+        dtype=np.float64,
+    )
+    norms = np.linalg.norm(matrix, axis=1)
+    matrix /= np.where(norms == 0, 1.0, norms)[:, None]
+
+    truth = []
+    for query in queries:
+        q = np.asarray(store.embedding_function.embed_query(query))
+        similarity = matrix @ (q / np.linalg.norm(q))
+        top = np.argsort(-similarity, kind="stable")[:k]
+        truth.append([ids[i] for i in top])
+    return truth
+
+
+def measure(
+    store: BenchmarkVectorStore,
+    queries: List[str],
+    truth: List[List[str]],
+    k: int,
+    ef_search: int
+) -> Dict[str, float]:
+    """Run every query at one ef_search and score it against the ground truth."""
+    for query in queries[:5]:  # warm up connections and caches
+        store.search(query, n_results=k, ef_search=ef_search)
+
+    latencies = []
+    recalls = []
+    for query, expected in zip(queries, truth):
+        start = time.perf_counter()
+        results = store.search(query, n_results=k, ef_search=ef_search, include_distances=False)
+        latencies.append((time.perf_counter() - start) * 1000)
+        recalls.append(len({r["id"] for r in results} & set(expected)) / k)
+
+    return {
+        "ef_search": ef_search,
+        "recall_at_k": round(float(np.mean(recalls)), 4),
+        "min_recall": round(float(np.min(recalls)), 4),
+        "p50_ms": round(float(np.percentile(latencies, 50)), 3),
+        "p95_ms": round(float(np.percentile(latencies, 95)), 3),
+    }
+
+
+def index_size_mb(store: BenchmarkVectorStore, storage_mode: str) -> float:
+    """On-disk size of the ANN index for a storage mode."""
+    with store._pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT pg_relation_size(to_regclass(%s))", (store._vector_index_name(storage_mode),))
+            size = cur.fetchone()[0] or 0
+    return round(size / 2**20, 2)
+
+
+def parse_index_params(value: str) -> List[Tuple[int, int]]:
+    """Parse 'm:ef_construction,...' pairs."""
+    pairs = []
+    for item in value.split(","):
+        m, ef_construction = item.split(":")
+        pairs.append((int(m), int(ef_construction)))
+    return pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HNSW recall and latency")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"), help="PostgreSQL URL with pgvector (default: DATABASE_URL)")
+    parser.add_argument("--n-docs", type=int, default=5000, help="Synthetic corpus size")
+    parser.add_argument("--n-queries", type=int, default=200, help="Number of benchmark queries")
+    parser.add_argument("--k", type=int, default=10, help="Neighbours per query (recall@k)")
+    parser.add_argument("--dimension", type=int, default=768, help="Embedding dimension")
+    parser.add_argument("--ef-search", default="10,20,40,80,160", help="Comma-separated ef_search values")
+    parser.add_argument("--index-params", default="16:64", help="Comma-separated m:ef_construction builds")
+    parser.add_argument("--storage-modes", default="full", help="Comma-separated storage modes (full,halfvec,binary)")
+    parser.add_argument("--pdf-dir", default=None, help="Use chunks of real PDFs instead of a synthetic corpus")
+    parser.add_argument("--seed", type=int, default=42, help="Corpus and query seed")
+    parser.add_argument("--json", default=None, help="Write results to this JSON file")
+    parser.add_argument("--keep-table", action="store_true", help="Keep the scratch table afterwards")
+    args = parser.parse_args()
+
+    if not args.database_url:
+        raise SystemExit("Set DATABASE_URL or pass --database-url")
+
+    ef_search_values = [int(v) for v in args.ef_search.split(",")]
+    index_grid = parse_index_params(args.index_params)
+    storage_modes = args.storage_modes.split(",")
+    unknown = set(storage_modes) - set(PgVectorStore.STORAGE_MODES)
+    if unknown:
+        raise SystemExit(f"Unknown storage modes: {', '.join(sorted(unknown))}")
+
+    if args.pdf_dir:
+        chunks, queries = pdf_corpus(args.pdf_dir, args.n_queries, args.seed)
+    else:
+        chunks, queries = synthetic_corpus(args.n_docs, args.n_queries, args.seed)
+
+    store = BenchmarkVectorStore(
+        args.database_url,
+        embedding_function=HashingEmbeddingFunction(args.dimension),
+    )
+    try:
+        store.clear_all()
+        start = time.perf_counter()
+        for i in range(0, len(chunks), 500):
+            store.write_chunks(chunks[i:i + 500], store.embedding_function([c.content for c in chunks[i:i + 500]]))
+        load_seconds = time.perf_counter() - start
+
+        truth = exact_neighbours(store, queries, args.k)
+        print(f"Corpus: {len(chunks)} chunks (loaded in {load_seconds:.1f}s), {len(queries)} queries, k={args.k}")
+
+        results = []
+        print(
+            f"{'mode':>8} {'m':>4} {'ef_con':>7} {'build_s':>8} {'index_mb':>9} {'ef_search':>10} "
+            f"{'recall@k':>9} {'min':>6} {'p50_ms':>8} {'p95_ms':>8}"
+        )
+        for storage_mode in storage_modes:
+            for m, ef_construction in index_grid:
+                start = time.perf_counter()
+                try:
+                    store.rebuild_vector_index(m=m, ef_construction=ef_construction, storage_mode=storage_mode)
+                except RuntimeError as e:
+                    print(f"{storage_mode:>8} skipped: {e}")
+                    break
+                build_seconds = time.perf_counter() - start
+                index_mb = index_size_mb(store, storage_mode)
+                for ef_search in ef_search_values:
+                    row = {
+                        "storage_mode": storage_mode,
+                        "m": m,
+                        "ef_construction": ef_construction,
+                        "build_seconds": round(build_seconds, 2),
+                        "index_mb": index_mb,
+                    }
+                    row.update(measure(store, queries, truth, args.k, ef_search))
+                    results.append(row)
+                    print(
+                        f"{storage_mode:>8} {m:>4} {ef_construction:>7} {build_seconds:>8.2f} {index_mb:>9.2f} {ef_search:>10} "
+                        f"{row['recall_at_k']:>9.4f} {row['min_recall']:>6.2f} {row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f}"
+                    )
+
+        if args.json:
+            Path(args.json).write_text(json.dumps({
+                "n_chunks": len(chunks),
+                "n_queries": len(queries),
+                "k": args.k,
+                "dimension": args.dimension,
+                "results": results,
+            }, indent=2))
+    finally:
+        if not args.keep_table:
+            with store._pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(f"DROP TABLE IF EXISTS {store.TABLE_NAME}")
+                conn.commit()
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
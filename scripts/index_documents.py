@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Incrementally index protocol, literature and registry PDFs into the vector store.
+Only added or modified PDFs are extracted and embedded; chunks of removed PDFs are deleted.
+
+Usage:
+    python -m scripts.index_documents --dry-run
+    python -m scripts.index_documents
+    python -m scripts.index_documents --force
+"""
+
+import argparse
+import json
+import logging
+
+from data.vectorstore import index_all_documents
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index source PDFs into the vector store")
+    parser.add_argument("--data-path", default=None, help="Data root containing protocol/, literature/, registry/ (default: data/raw)")
+    parser.add_argument("--manifest", default=None, help="Index manifest JSON (default: data/vectorstore/index_manifest.json)")
+    parser.add_argument("--force", action="store_true", help="Clear the vector store and manifest, then reindex everything")
+    parser.add_argument("--dry-run", action="store_true", help="Report planned work without extracting, embedding, deleting or saving the manifest")
+    parser.add_argument("--extract-workers", type=int, default=None, help="PDF extraction processes (default: CPU count)")
+    parser.add_argument("--embed-workers", type=int, default=2, help="Concurrent embedding threads (default: 2)")
+    args = parser.parse_args()
+
+    stats = index_all_documents(
+        base_data_path=args.data_path,
+        force_reindex=args.force,
+        manifest_path=args.manifest,
+        dry_run=args.dry_run,
+        extract_workers=args.extract_workers,
+        embed_workers=args.embed_workers,
+    )
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
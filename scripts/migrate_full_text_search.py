@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Build the full-text index that hybrid search needs on an existing vector store table.
+Adds a plain content_tsv column kept current by a trigger, backfills it in short batches and
+builds the GIN index concurrently, so searches and writes continue while it runs. Until this has
+run, search(mode="hybrid") falls back to vector search; running processes pick the index up
+when restarted. Safe to re-run.
+
+Usage:
+    python -m scripts.migrate_full_text_search
+    python -m scripts.migrate_full_text_search --batch-size 500
+"""
+
+import argparse
+import logging
+import time
+
+from data.vectorstore.pg_vector_store import PgVectorStore
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the full-text index for hybrid search")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows backfilled per transaction")
+    args = parser.parse_args()
+
+    store = PgVectorStore()
+    try:
+        start = time.perf_counter()
+        backfilled = store.migrate_full_text_search(batch_size=args.batch_size)
+        print(f"Backfilled {backfilled} rows and built the full-text index in {time.perf_counter() - start:.1f}s")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
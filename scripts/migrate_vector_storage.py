@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Switch the vector store's ANN index between full, halfvec and binary layouts.
+The new index is built concurrently while the old one keeps serving queries; full vectors
+are never rewritten, so compact modes re-rank exactly and switching back is always possible.
+Set VECTOR_STORAGE_MODE to the new mode afterwards so the application uses it.
+
+Usage:
+    python -m scripts.migrate_vector_storage --mode halfvec
+    python -m scripts.migrate_vector_storage --mode binary --keep-old-index
+    python -m scripts.migrate_vector_storage --mode full
+"""
+
+import argparse
+import logging
+
+from data.vectorstore.pg_vector_store import PgVectorStore
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def index_sizes(store: PgVectorStore) -> dict:
+    """Size in bytes of each ANN index that currently exists."""
+    sizes = {}
+    with store._pool.connection() as conn:
+        with conn.cursor() as cur:
+            for mode in store.STORAGE_MODES:
+                cur.execute("SELECT pg_relation_size(to_regclass(%s))", (store._vector_index_name(mode),))
+                size = cur.fetchone()[0]
+                if size is not None:
+                    sizes[mode] = size
+    return sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate the vector index storage layout")
+    parser.add_argument("--mode", required=True, choices=PgVectorStore.STORAGE_MODES, help="Target storage mode")
+    parser.add_argument("--keep-old-index", action="store_true", help="Keep the other layouts' indexes (for rollback)")
+    args = parser.parse_args()
+
+    store = PgVectorStore()
+    try:
+        print(f"Before: {index_sizes(store)}")
+        store.migrate_storage_mode(args.mode, drop_unused=not args.keep_old_index)
+        print(f"After:  {index_sizes(store)}")
+        print(f"Set VECTOR_STORAGE_MODE={args.mode} to use the new index.")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()